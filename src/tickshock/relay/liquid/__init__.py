@@ -1,8 +1,86 @@
 from ._client import (
     Liquid
 )
+from ._async_client import (
+    AsyncLiquid,
+)
+from ._transport import (
+    LiquidTransport,
+)
+from ._rate_limit import (
+    RateLimiter,
+    RateBudget,
+)
+from ._metrics import (
+    MetricsSink,
+    InMemoryMetrics,
+    MetricsExporter,
+    MetricsSnapshot,
+    RequestStats,
+    HistogramSnapshot,
+)
+from ._tracing import (
+    Tracer,
+    Trace,
+    Span,
+)
+from ._resilience import (
+    RetryPolicy,
+    CircuitBreaker,
+)
+from ._candle_store import (
+    CandleStore,
+)
+from ._columnar import (
+    CandleColumns,
+)
+from ._quote_cache import (
+    QuoteCache,
+    QuoteCacheStats,
+)
+from ._instrument_registry import (
+    InstrumentRegistry,
+)
+from ._trading_calendar import (
+    TradingCalendar,
+)
+from ._instrument_catalog import (
+    InstrumentCatalog,
+)
+from ._position_tracker import (
+    PositionTracker,
+)
+from ._quote_feed import (
+    QuoteFeed,
+    QuoteChannel,
+)
 
 
 __all__ = [
     "Liquid",
+    "AsyncLiquid",
+    "LiquidTransport",
+    "CandleStore",
+    "CandleColumns",
+    "QuoteCache",
+    "QuoteCacheStats",
+    "QuoteFeed",
+    "QuoteChannel",
+    "InstrumentCatalog",
+    "InstrumentRegistry",
+    "TradingCalendar",
+    "PositionTracker",
+    "RateLimiter",
+    "RateBudget",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "MetricsSink",
+    "InMemoryMetrics",
+    "MetricsExporter",
+    "MetricsSnapshot",
+    "RequestStats",
+    "HistogramSnapshot",
+    "Tracer",
+    "Trace",
+    "Span",
 ]
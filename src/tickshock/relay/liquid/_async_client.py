@@ -0,0 +1,407 @@
+import logging as _logging
+from asyncio import (
+    Lock as _Lock,
+    sleep as _sleep,
+)
+from time import (
+    perf_counter as _perf_counter,
+)
+from typing import (
+    Optional as _Optional,
+    Any as _Any,
+    Dict as _Dict,
+    Final as _Final,
+    List as _List,
+    Tuple as _Tuple,
+    Type as _Type,
+)
+from types import (
+    TracebackType as _TracebackType,
+)
+from urllib.parse import (
+    quote as _quote,
+)
+from datetime import (
+    datetime as _datetime,
+)
+from http import HTTPMethod as _HTTPMethod
+from httpx import (
+    AsyncClient as _AsyncClient,
+    Limits as _Limits,
+    TransportError as _TransportError,
+)
+from tickshock.ground import (
+    get_env as _get_env,
+)
+from tickshock.ground.types import (
+    Candle as _Candle,
+    CandleIntervalLiteral as _CandleIntervalLiteral,
+)
+from . import _protocol
+from . import _tracing
+from ._response import (
+    LiquidResponse as _LiquidResponse,
+)
+from ._rate_limit import (
+    RateLimiter as _RateLimiter,
+)
+from ._metrics import (
+    MetricsSink as _MetricsSink,
+    InMemoryMetrics as _InMemoryMetrics,
+)
+from ._tracing import (
+    Tracer as _Tracer,
+    traced_async as _traced_async,
+)
+from ._resilience import (
+    RetryPolicy as _RetryPolicy,
+    CircuitBreaker as _CircuitBreaker,
+    SERVER_ERRORS as _SERVER_ERRORS,
+)
+from ._validation import (
+    Validation as _Validation,
+    ValidationLevelLiteral as _ValidationLevelLiteral,
+)
+from .exceptions import (
+    LiquidApiAuthException as _LiquidApiAuthException,
+    LiquidApiUnavailableException as _LiquidApiUnavailableException,
+)
+from .types._quote import (
+    Quote as _Quote,
+)
+from .types import (
+    Instrument as _Instrument,
+    SymbolLiteral as _SymbolLiteral,
+    Position as _Position,
+    TradeSideLiteral as _TradeSideLiteral,
+    PositionEffectLiteral as _PositionEffectLiteral,
+    OrderTypeLiteral as _OrderTypeLiteral,
+    HistoricalOrderDto as _HistoricalOrderDto,
+)
+
+_logger = _logging.getLogger(__name__)
+
+
+class AsyncLiquid:
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        api_base_url: str,
+        account_id: str,
+        client: _Optional[_AsyncClient] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        validation: _ValidationLevelLiteral = "strict",
+        validation_sample_rate: float = 0.01,
+        rate_limiter: _Optional[_RateLimiter] = None,
+        metrics: _Optional[_MetricsSink] = None,
+        tracer: _Optional[_Tracer] = None,
+        retry_policy: _Optional[_RetryPolicy] = None,
+        circuit_breaker: _Optional[_CircuitBreaker] = None,
+    ) -> None:
+        _logger.info("Initializing async Liquid relay for account_id: %s", account_id)
+        self._username: _Final[str] = username
+        self._password: _Final[str] = password
+        self._api_base_url: _Final[str] = api_base_url
+        self._account_code: _Final[str] = _quote(f"default:{account_id}")
+        self._validation: _Final = _Validation(validation, validation_sample_rate)
+        self._rate_limiter: _Final = rate_limiter or _RateLimiter()
+        self._metrics: _Final = metrics if metrics is not None else _InMemoryMetrics()
+        self._tracer: _Final = tracer
+        self._retry_policy: _Final = retry_policy or _RetryPolicy()
+        self._circuit_breaker: _Final = circuit_breaker or _CircuitBreaker()
+        self._owns_client: _Final[bool] = client is None
+        self._client: _Final[_AsyncClient] = client or _AsyncClient(
+            limits=_Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+        )
+        self._session_token: _Optional[str] = None
+        self._token_lock: _Final[_Lock] = _Lock()
+
+    @staticmethod
+    def const_with_envvars(client: _Optional[_AsyncClient] = None) -> "AsyncLiquid":
+        return AsyncLiquid(
+            _get_env("LIQUID_UN"),
+            _get_env("LIQUID_PW"),
+            _get_env("LIQUID_API_BASE_URL"),
+            _get_env("LIQUID_ACCOUNT_ID"),
+            client,
+        )
+
+    @property
+    def metrics(self) -> _MetricsSink:
+        return self._metrics
+
+    @property
+    def tracer(self) -> _Optional[_Tracer]:
+        return self._tracer
+
+    async def aclose(self) -> None:
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncLiquid":
+        await self._ensure_session_token()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: _Optional[_Type[BaseException]],
+        exc: _Optional[BaseException],
+        tb: _Optional[_TracebackType],
+    ) -> None:
+        await self.aclose()
+
+    async def _get_session_token(self, username: str, password: str) -> str:
+        _logger.debug("Attempting to acquire session token for user: %s", username)
+        result = (
+            await self._query(
+                _HTTPMethod.POST,
+                _protocol.LOGIN_PATH,
+                _protocol.login_payload(username, password),
+                authenticate=False,
+            )
+        ).json()
+        return _protocol.parse_session_token(result)
+
+    async def _ensure_session_token(self) -> str:
+        if self._session_token is not None:
+            return self._session_token
+        return await self._refresh_session_token(None)
+
+    async def _refresh_session_token(self, stale_token: _Optional[str]) -> str:
+        async with self._token_lock:
+            if self._session_token is not None and self._session_token != stale_token:
+                return self._session_token
+            self._session_token = await self._get_session_token(
+                self._username, self._password
+            )
+            return self._session_token
+
+    async def _query(
+        self,
+        method: _HTTPMethod,
+        api_url_path: str,
+        data: _Optional[_Dict[str, _Any]] = None,
+        params: _Optional[_Dict[str, _Any]] = None,
+        authenticate: bool = True,
+    ) -> _LiquidResponse:
+        url = _protocol.build_url(self._api_base_url, api_url_path)
+        endpoint = _protocol.endpoint_for(api_url_path)
+        timeout = self._retry_policy.timeout(endpoint)
+        attempt, throttled, failures = 0, 0, 0
+        trace = _tracing.active()
+        extensions = {"trace": _tracing.httpcore_trace(trace)} if trace is not None else None
+        while attempt <= _protocol.MAX_AUTH_RETRIES:
+            try:
+                self._circuit_breaker.before_call(endpoint)
+            except _LiquidApiUnavailableException:
+                self._metrics.increment("rejected", endpoint)
+                raise
+            await self._rate_limiter.acquire_async(endpoint)
+            token = await self._ensure_session_token() if authenticate else None
+            _logger.debug("Executing %s request to %s", method, url)
+            started = _perf_counter()
+            try:
+                raw_response = await self._client.request(
+                    method,
+                    url,
+                    headers=_protocol.build_headers(token),
+                    json=data,
+                    params=params,
+                    timeout=timeout,
+                    extensions=extensions,
+                )
+            except _TransportError as e:
+                self._metrics.request(endpoint, method, None, _perf_counter() - started, 0)
+                self._circuit_breaker.record_failure(endpoint)
+                failures += 1
+                delay = self._retry_policy.backoff(endpoint, failures)
+                if delay is None:
+                    raise
+                self._metrics.increment("retry", endpoint)
+                _logger.warning(
+                    "%s request to %s failed (attempt %d), retrying in %.2fs: %s",
+                    method,
+                    api_url_path,
+                    failures,
+                    delay,
+                    e,
+                )
+                await _sleep(delay)
+                continue
+            response = _LiquidResponse(
+                raw_response.status_code,
+                raw_response.is_success,
+                raw_response.content,
+                raw_response.headers,
+            )
+            self._metrics.request(
+                endpoint,
+                method,
+                response.status_code,
+                _perf_counter() - started,
+                _protocol.response_size(response),
+            )
+            throttle = _protocol.is_throttled(
+                endpoint, response.status_code, response.headers
+            )
+            if throttle and throttled < _protocol.MAX_THROTTLE_RETRIES:
+                throttled += 1
+                self._metrics.increment("throttled", endpoint)
+                self._rate_limiter.throttled(endpoint, _protocol.retry_after(response.headers))
+                continue
+            if response.status_code in _SERVER_ERRORS:
+                self._circuit_breaker.record_failure(endpoint)
+                failures += 1
+                delay = self._retry_policy.backoff(endpoint, failures)
+                if delay is not None:
+                    self._metrics.increment("retry", endpoint)
+                    _logger.warning(
+                        "%s request to %s returned %d (attempt %d), retrying in %.2fs",
+                        method,
+                        api_url_path,
+                        response.status_code,
+                        failures,
+                        delay,
+                    )
+                    await _sleep(delay)
+                    continue
+            elif not throttle:
+                self._circuit_breaker.record_success(endpoint)
+            if authenticate and _protocol.is_auth_required(response.json()):
+                _logger.warning(
+                    "Authorization required for %s. Attempting token refresh.",
+                    api_url_path,
+                )
+                self._metrics.increment("reauth", endpoint)
+                await self._refresh_session_token(token)
+                attempt += 1
+                continue
+
+            if not throttle:
+                self._rate_limiter.succeeded(endpoint)
+
+            if not response.ok:
+                _logger.error(
+                    "Request to %s failed with status %d: %s",
+                    api_url_path,
+                    response.status_code,
+                    response.text,
+                )
+            return response
+
+        _logger.error("Too many retries for path: %s", api_url_path)
+        raise _LiquidApiAuthException("too many retries")
+
+    @_traced_async
+    async def get_instruments(self) -> _List[_Instrument]:
+        _logger.info("Fetching instruments")
+        result = (
+            await self._query(_HTTPMethod.GET, _protocol.INSTRUMENTS_PATH)
+        ).json()
+        return _protocol.parse_instruments(result)
+
+    @_traced_async
+    async def get_quotes(self, symbols: _List[_SymbolLiteral]) -> _List[_Quote]:
+        response = (
+            await self._query(
+                _HTTPMethod.POST,
+                _protocol.MARKET_DATA_PATH,
+                _protocol.quotes_payload(symbols),
+            )
+        ).json()
+        return _protocol.parse_quotes(symbols, response, self._validation)
+
+    @_traced_async
+    async def get_market_data(
+        self,
+        symbol: _SymbolLiteral,
+        duration: _CandleIntervalLiteral,
+        from_time: _datetime,
+        to_time: _datetime,
+    ) -> _List[_Candle[_SymbolLiteral]]:
+        _protocol.check_time_range(from_time, to_time)
+        _logger.info(
+            "Fetching market data for %s (interval: %s) from %s to %s",
+            symbol,
+            duration,
+            from_time,
+            to_time,
+        )
+        response = (
+            await self._query(
+                _HTTPMethod.POST,
+                _protocol.MARKET_DATA_PATH,
+                _protocol.candles_payload([symbol], duration, from_time, to_time),
+            )
+        ).json()
+        return _protocol.parse_candles(symbol, from_time, response, self._validation)
+
+    @_traced_async
+    async def get_open_positions(self) -> _List[_Position]:
+        _logger.info("Fetching open positions")
+        response = (
+            await self._query(
+                _HTTPMethod.GET,
+                _protocol.positions_path(self._account_code),
+            )
+        ).json()
+        return _protocol.parse_positions(response, self._validation)
+
+    @_traced_async
+    async def place_order(
+        self,
+        symbol: _SymbolLiteral,
+        order_type: _OrderTypeLiteral,
+        side: _TradeSideLiteral,
+        effect: _PositionEffectLiteral,
+        quantity: float,
+        position_code: _Optional[str] = None,
+        limit_price: _Optional[float] = None,
+        stop_price: _Optional[float] = None,
+    ) -> _Tuple[str, str]:
+        order_code = _protocol.new_order_code()
+        response = (
+            await self._query(
+                _HTTPMethod.POST,
+                _protocol.orders_path(self._account_code),
+                _protocol.order_payload(
+                    order_code,
+                    symbol,
+                    order_type,
+                    side,
+                    effect,
+                    quantity,
+                    position_code,
+                    limit_price,
+                    stop_price,
+                ),
+            )
+        ).json()
+        return _protocol.parse_order_result(
+            order_code, symbol, order_type, side, effect, quantity, response
+        )
+
+    @_traced_async
+    async def get_order_history(
+        self,
+        symbol: _Optional[_SymbolLiteral] = None,
+        order_id: _Optional[str] = None,
+    ) -> _List[_HistoricalOrderDto]:
+        _logger.info(
+            "Fetching order history (symbol: %s, order_id: %s)", symbol, order_id
+        )
+        response = (
+            await self._query(
+                _HTTPMethod.GET,
+                _protocol.order_history_path(self._account_code),
+                params=_protocol.order_history_params(symbol, order_id),
+            )
+        ).json()
+        return _protocol.parse_order_history(symbol, order_id, response, self._validation)
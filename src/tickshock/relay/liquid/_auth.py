@@ -0,0 +1,127 @@
+import logging as _logging
+from threading import (
+    Event as _Event,
+    Lock as _Lock,
+    Thread as _Thread,
+)
+from time import (
+    monotonic as _monotonic,
+)
+from typing import (
+    Callable as _Callable,
+    Final as _Final,
+    Optional as _Optional,
+)
+
+_logger = _logging.getLogger(__name__)
+
+
+class SessionTokenManager:
+    def __init__(
+        self,
+        login: _Callable[[], str],
+        ttl: _Optional[float] = None,
+        renew_ratio: float = 0.8,
+        keep_alive: _Optional[_Callable[[], None]] = None,
+        keep_alive_interval: _Optional[float] = None,
+        clock: _Callable[[], float] = _monotonic,
+    ) -> None:
+        if ttl is not None and ttl <= 0:
+            raise ValueError("'ttl' must be positive")
+        if not 0 < renew_ratio <= 1:
+            raise ValueError("'renew_ratio' must be in (0, 1]")
+        if keep_alive_interval is not None and (
+            keep_alive is None or keep_alive_interval <= 0
+        ):
+            raise ValueError(
+                "'keep_alive_interval' needs a positive value and a 'keep_alive' callable"
+            )
+        self._login: _Final = login
+        self._ttl: _Final = ttl
+        self._renew_ratio: _Final = renew_ratio
+        self._keep_alive: _Final = keep_alive
+        self._keep_alive_interval: _Final = keep_alive_interval
+        self._clock: _Final = clock
+        self._lock: _Final = _Lock()
+        self._stop: _Final = _Event()
+        self._thread: _Optional[_Thread] = None
+        self._token: _Optional[str] = None
+        self._issued_at = 0.0
+        self._last_activity = 0.0
+        self.refresh_count = 0
+
+    @property
+    def token(self) -> _Optional[str]:
+        return self._token
+
+    def _expired(self) -> bool:
+        return self._ttl is not None and self._clock() - self._issued_at >= self._ttl
+
+    def current(self) -> str:
+        token = self._token
+        if token is None or self._expired():
+            return self.refresh(token)
+        return token
+
+    def refresh(self, stale_token: _Optional[str]) -> str:
+        with self._lock:
+            token = self._token
+            if token is not None and token != stale_token and not self._expired():
+                _logger.debug("Session token already refreshed by another caller")
+                return token
+            _logger.debug("Refreshing session token")
+            token = self._login()
+            self._token = token
+            self._issued_at = self._clock()
+            self._last_activity = self._issued_at
+            self.refresh_count += 1
+            return token
+
+    def touch(self) -> None:
+        self._last_activity = self._clock()
+
+    def _next_delay(self) -> _Optional[float]:
+        now = self._clock()
+        delays = []
+        if self._ttl is not None:
+            delays.append(self._issued_at + self._ttl * self._renew_ratio - now)
+        if self._keep_alive_interval is not None:
+            delays.append(self._last_activity + self._keep_alive_interval - now)
+        return max(0.0, min(delays)) if delays else None
+
+    def _tick(self) -> None:
+        now = self._clock()
+        if self._ttl is not None and now - self._issued_at >= self._ttl * self._renew_ratio:
+            _logger.info("Renewing session token ahead of expiry")
+            self.refresh(self._token)
+        elif (
+            self._keep_alive is not None
+            and self._keep_alive_interval is not None
+            and now - self._last_activity >= self._keep_alive_interval
+        ):
+            _logger.debug("Sending session keep-alive")
+            self._keep_alive()
+            self.touch()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            delay = self._next_delay()
+            if delay is None or self._stop.wait(delay):
+                return
+            try:
+                self._tick()
+            except Exception:  # pylint: disable=broad-exception-caught
+                _logger.exception("Background session renewal failed")
+                self._stop.wait(1.0)
+
+    def start(self) -> None:
+        if self._thread is not None or (self._ttl is None and self._keep_alive_interval is None):
+            return
+        self._thread = _Thread(target=self._run, name="liquid-session-renewal", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
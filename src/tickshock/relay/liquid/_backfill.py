@@ -0,0 +1,61 @@
+from typing import (
+    Dict as _Dict,
+    Final as _Final,
+    Iterable as _Iterable,
+    List as _List,
+    Optional as _Optional,
+    Tuple as _Tuple,
+)
+from datetime import (
+    datetime as _datetime,
+    timedelta as _timedelta,
+)
+from tickshock.ground.types import (
+    Candle as _Candle,
+    CandleIntervalLiteral as _CandleIntervalLiteral,
+)
+from .types import (
+    SymbolLiteral as _SymbolLiteral,
+)
+
+# Roughly 1-2k candles per request, which the broker answers well within the timeout.
+WINDOW_SIZES: _Final[_Dict[_CandleIntervalLiteral, _timedelta]] = {
+    "m": _timedelta(days=1),
+    "5m": _timedelta(days=5),
+    "15m": _timedelta(days=14),
+    "30m": _timedelta(days=30),
+    "h": _timedelta(days=60),
+    "2h": _timedelta(days=120),
+    "4h": _timedelta(days=240),
+    "d": _timedelta(days=365 * 4),
+    "w": _timedelta(days=365 * 20),
+    "mo": _timedelta(days=365 * 80),
+}
+
+
+def split_range(
+    from_time: _datetime,
+    to_time: _datetime,
+    duration: _CandleIntervalLiteral,
+    window: _Optional[_timedelta] = None,
+) -> _List[_Tuple[_datetime, _datetime]]:
+    step = window if window is not None else WINDOW_SIZES[duration]
+    if step <= _timedelta(0):
+        raise ValueError("'window' must be a positive duration")
+    windows: _List[_Tuple[_datetime, _datetime]] = []
+    start = from_time
+    while start < to_time:
+        end = min(start + step, to_time)
+        windows.append((start, end))
+        start = end
+    return windows
+
+
+def merge_candles(
+    chunks: _Iterable[_List[_Candle[_SymbolLiteral]]],
+) -> _List[_Candle[_SymbolLiteral]]:
+    by_time: _Dict[_datetime, _Candle[_SymbolLiteral]] = {}
+    for chunk in chunks:
+        for candle in chunk:
+            by_time[candle.time] = candle
+    return [by_time[time] for time in sorted(by_time)]
@@ -0,0 +1,217 @@
+import logging as _logging
+import sqlite3 as _sqlite3
+from os import (
+    PathLike as _PathLike,
+)
+from threading import (
+    Lock as _Lock,
+)
+from types import (
+    TracebackType as _TracebackType,
+)
+from typing import (
+    Dict as _Dict,
+    Final as _Final,
+    List as _List,
+    Optional as _Optional,
+    Tuple as _Tuple,
+    Type as _Type,
+    Union as _Union,
+)
+from datetime import (
+    datetime as _datetime,
+    timedelta as _timedelta,
+    timezone as _timezone,
+)
+from tickshock.ground.types import (
+    Candle as _Candle,
+    CandleIntervalLiteral as _CandleIntervalLiteral,
+)
+from .types import (
+    SymbolLiteral as _SymbolLiteral,
+)
+
+_logger = _logging.getLogger(__name__)
+
+INTERVAL_LENGTHS: _Final[_Dict[_CandleIntervalLiteral, _timedelta]] = {
+    "m": _timedelta(minutes=1),
+    "5m": _timedelta(minutes=5),
+    "15m": _timedelta(minutes=15),
+    "30m": _timedelta(minutes=30),
+    "h": _timedelta(hours=1),
+    "2h": _timedelta(hours=2),
+    "4h": _timedelta(hours=4),
+    "d": _timedelta(days=1),
+    "w": _timedelta(weeks=1),
+    "mo": _timedelta(days=31),
+}
+
+_SCHEMA: _Final = """
+CREATE TABLE IF NOT EXISTS candles (
+    symbol TEXT NOT NULL,
+    candle_type TEXT NOT NULL,
+    time INTEGER NOT NULL,
+    open REAL NOT NULL,
+    close REAL NOT NULL,
+    high REAL NOT NULL,
+    low REAL NOT NULL,
+    volume REAL NOT NULL,
+    PRIMARY KEY (symbol, candle_type, time)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS coverage (
+    symbol TEXT NOT NULL,
+    candle_type TEXT NOT NULL,
+    start_time INTEGER NOT NULL,
+    end_time INTEGER NOT NULL,
+    PRIMARY KEY (symbol, candle_type, start_time)
+) WITHOUT ROWID;
+"""
+
+_Span = _Tuple[int, int]
+
+
+def _to_micros(value: _datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=_timezone.utc)
+    delta = value - _datetime(1970, 1, 1, tzinfo=_timezone.utc)
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _from_micros(value: int) -> _datetime:
+    return _datetime(1970, 1, 1, tzinfo=_timezone.utc) + _timedelta(microseconds=value)
+
+
+def _merge_spans(spans: _List[_Span]) -> _List[_Span]:
+    merged: _List[_Span] = []
+    for start, end in sorted(spans):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class CandleStore:
+    def __init__(self, path: _Union[str, "_PathLike[str]"]) -> None:
+        self._lock: _Final = _Lock()
+        self._connection: _Final = _sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "CandleStore":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: _Optional[_Type[BaseException]],
+        exc: _Optional[BaseException],
+        tb: _Optional[_TracebackType],
+    ) -> None:
+        self.close()
+
+    def _coverage(self, symbol: str, candle_type: str) -> _List[_Span]:
+        return [
+            (start, end)
+            for start, end in self._connection.execute(
+                "SELECT start_time, end_time FROM coverage "
+                "WHERE symbol = ? AND candle_type = ? ORDER BY start_time",
+                (symbol, candle_type),
+            )
+        ]
+
+    def missing(
+        self,
+        symbol: _SymbolLiteral,
+        candle_type: _CandleIntervalLiteral,
+        from_time: _datetime,
+        to_time: _datetime,
+    ) -> _List[_Tuple[_datetime, _datetime]]:
+        start, end = _to_micros(from_time), _to_micros(to_time)
+        with self._lock:
+            coverage = self._coverage(symbol, candle_type)
+        gaps: _List[_Tuple[_datetime, _datetime]] = []
+        cursor = start
+        for covered_start, covered_end in coverage:
+            if covered_end <= cursor:
+                continue
+            if covered_start >= end:
+                break
+            if covered_start > cursor:
+                gaps.append((_from_micros(cursor), _from_micros(covered_start)))
+            cursor = max(cursor, covered_end)
+        if cursor < end:
+            gaps.append((_from_micros(cursor), _from_micros(end)))
+        return gaps
+
+    def load(
+        self,
+        symbol: _SymbolLiteral,
+        candle_type: _CandleIntervalLiteral,
+        from_time: _datetime,
+        to_time: _datetime,
+    ) -> _List[_Candle[_SymbolLiteral]]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT time, open, close, high, low, volume FROM candles "
+                "WHERE symbol = ? AND candle_type = ? AND time >= ? AND time <= ? ORDER BY time",
+                (symbol, candle_type, _to_micros(from_time), _to_micros(to_time)),
+            ).fetchall()
+        return [
+            _Candle(symbol, candle_type, open_, close, high, low, volume, _from_micros(time))
+            for time, open_, close, high, low, volume in rows
+        ]
+
+    def save(
+        self,
+        symbol: _SymbolLiteral,
+        candle_type: _CandleIntervalLiteral,
+        from_time: _datetime,
+        to_time: _datetime,
+        candles: _List[_Candle[_SymbolLiteral]],
+        now: _Optional[_datetime] = None,
+    ) -> None:
+        # Only closed candles are immutable, so coverage stops where the forming candle starts.
+        closed_until = _to_micros(now or _datetime.now(_timezone.utc)) - int(
+            INTERVAL_LENGTHS[candle_type] / _timedelta(microseconds=1)
+        )
+        start = _to_micros(from_time)
+        end = min(_to_micros(to_time), closed_until)
+        rows = [
+            (
+                symbol,
+                candle_type,
+                _to_micros(candle.time),
+                candle.open,
+                candle.close,
+                candle.high,
+                candle.low,
+                candle.volume,
+            )
+            for candle in candles
+            if _to_micros(candle.time) <= closed_until
+        ]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO candles VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            if end <= start:
+                return
+            coverage = _merge_spans(self._coverage(symbol, candle_type) + [(start, end)])
+            self._connection.execute(
+                "DELETE FROM coverage WHERE symbol = ? AND candle_type = ?",
+                (symbol, candle_type),
+            )
+            self._connection.executemany(
+                "INSERT INTO coverage VALUES (?, ?, ?, ?)",
+                [(symbol, candle_type, s, e) for s, e in coverage],
+            )
+        _logger.debug(
+            "Stored %d candles for %s (%s), coverage now %d spans",
+            len(rows),
+            symbol,
+            candle_type,
+            len(coverage),
+        )
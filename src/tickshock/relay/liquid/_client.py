@@ -1,55 +1,99 @@
 import logging as _logging
 from typing import (
-    cast as _cast,
     Optional as _Optional,
     Any as _Any,
     Dict as _Dict,
     Final as _Final,
     List as _List,
     Tuple as _Tuple,
+    Type as _Type,
+    Callable as _Callable,
+    Iterator as _Iterator,
+    Union as _Union,
 )
-from random import (
-    choices as _choices,
-)
-from string import (
-    digits as _digits,
-    ascii_letters as _ascii_letters,
+from types import (
+    TracebackType as _TracebackType,
 )
 from urllib.parse import (
     quote as _quote,
 )
 from datetime import (
     datetime as _datetime,
+    timedelta as _timedelta,
+)
+from time import (
+    perf_counter as _perf_counter,
+    sleep as _sleep,
+)
+from concurrent.futures import (
+    ThreadPoolExecutor as _ThreadPoolExecutor,
 )
 from http import HTTPMethod as _HTTPMethod
 from requests import (
-    request as _request,
-    Response as _Response,
+    RequestException as _RequestException,
 )
 from tickshock.ground import (
-    to_dict as _to_dict,
     get_env as _get_env,
 )
 from tickshock.ground.types import (
     Candle as _Candle,
     CandleIntervalLiteral as _CandleIntervalLiteral,
 )
+from . import _protocol
+from . import _backfill
+from . import _tracing
+from ._transport import (
+    LiquidTransport as _LiquidTransport,
+)
+from ._response import (
+    LiquidResponse as _LiquidResponse,
+)
+from ._json import (
+    JsonArrayNotFound as _JsonArrayNotFound,
+)
+from ._auth import (
+    SessionTokenManager as _SessionTokenManager,
+)
+from ._candle_store import (
+    CandleStore as _CandleStore,
+)
+from ._instrument_registry import (
+    InstrumentRegistry as _InstrumentRegistry,
+)
+from ._columnar import (
+    CandleColumns as _CandleColumns,
+    candle_columns as _candle_columns,
+)
+from ._rate_limit import (
+    RateLimiter as _RateLimiter,
+)
+from ._metrics import (
+    MetricsSink as _MetricsSink,
+    InMemoryMetrics as _InMemoryMetrics,
+)
+from ._tracing import (
+    Tracer as _Tracer,
+    traced as _traced,
+)
+from ._resilience import (
+    RetryPolicy as _RetryPolicy,
+    CircuitBreaker as _CircuitBreaker,
+    SERVER_ERRORS as _SERVER_ERRORS,
+)
+from ._validation import (
+    Validation as _Validation,
+    ValidationLevelLiteral as _ValidationLevelLiteral,
+)
 from .exceptions import (
     LiquidApiException as _LiquidApiException,
     LiquidApiAuthException as _LiquidApiAuthException,
-)
-from .types._position import (
-    PositionsDto as _PositionsDto,
-)
-from .types._candle import (
-    CandleDto as _CandleDto,
+    LiquidApiUnavailableException as _LiquidApiUnavailableException,
 )
 from .types._quote import (
-    QuoteDto as _QuoteDto,
     Quote as _Quote,
+    QuoteBatchResult as _QuoteBatchResult,
 )
 from .types import (
-    InstrumentsDtoCollection as _InstrumentsDtoCollection,
     Instrument as _Instrument,
     SymbolLiteral as _SymbolLiteral,
     Position as _Position,
@@ -57,6 +101,8 @@ from .types import (
     PositionEffectLiteral as _PositionEffectLiteral,
     OrderTypeLiteral as _OrderTypeLiteral,
     HistoricalOrderDto as _HistoricalOrderDto,
+    OrderSpec as _OrderSpec,
+    OrderBatchResult as _OrderBatchResult,
 )
 
 _logger = _logging.getLogger(__name__)
@@ -69,43 +115,91 @@ class Liquid:
         password: str,
         api_base_url: str,
         account_id: str,
+        transport: _Optional[_LiquidTransport] = None,
+        session_ttl: _Optional[float] = None,
+        keep_alive_interval: _Optional[float] = None,
+        candle_store: _Optional[_CandleStore] = None,
+        validation: _ValidationLevelLiteral = "strict",
+        validation_sample_rate: float = 0.01,
+        rate_limiter: _Optional[_RateLimiter] = None,
+        metrics: _Optional[_MetricsSink] = None,
+        tracer: _Optional[_Tracer] = None,
+        retry_policy: _Optional[_RetryPolicy] = None,
+        circuit_breaker: _Optional[_CircuitBreaker] = None,
     ) -> None:
         _logger.info("Initializing Liquid relay for account_id: %s", account_id)
         self._username: _Final[str] = username
         self._password: _Final[str] = password
         self._api_base_url: _Final[str] = api_base_url
         self._account_code: _Final[str] = _quote(f"default:{account_id}")
-        self._session_token: str = self._get_session_token(
-            self._username,
-            self._password,
+        self._candle_store: _Final[_Optional[_CandleStore]] = candle_store
+        self._validation: _Final = _Validation(validation, validation_sample_rate)
+        self._rate_limiter: _Final = rate_limiter or _RateLimiter()
+        self._metrics: _Final = metrics if metrics is not None else _InMemoryMetrics()
+        self._tracer: _Final = tracer
+        self._retry_policy: _Final = retry_policy or _RetryPolicy()
+        self._circuit_breaker: _Final = circuit_breaker or _CircuitBreaker()
+        self._owns_transport: _Final[bool] = transport is None
+        self._transport: _Final[_LiquidTransport] = transport or _LiquidTransport()
+        self._tokens: _Final[_SessionTokenManager] = _SessionTokenManager(
+            lambda: self._get_session_token(self._username, self._password),
+            ttl=session_ttl,
+            keep_alive=self._ping if keep_alive_interval is not None else None,
+            keep_alive_interval=keep_alive_interval,
         )
+        self._tokens.refresh(None)
+        self._tokens.start()
 
     @staticmethod
-    def const_with_envvars() -> "Liquid":
+    def const_with_envvars(transport: _Optional[_LiquidTransport] = None) -> "Liquid":
         return Liquid(
             _get_env("LIQUID_UN"),
             _get_env("LIQUID_PW"),
             _get_env("LIQUID_API_BASE_URL"),
             _get_env("LIQUID_ACCOUNT_ID"),
+            transport,
         )
 
+    @property
+    def metrics(self) -> _MetricsSink:
+        return self._metrics
+
+    @property
+    def tracer(self) -> _Optional[_Tracer]:
+        return self._tracer
+
+    @property
+    def _session_token(self) -> _Optional[str]:
+        return self._tokens.token
+
+    def close(self) -> None:
+        self._tokens.close()
+        if self._owns_transport:
+            self._transport.close()
+
+    def __enter__(self) -> "Liquid":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: _Optional[_Type[BaseException]],
+        exc: _Optional[BaseException],
+        tb: _Optional[_TracebackType],
+    ) -> None:
+        self.close()
+
     def _get_session_token(self, username: str, password: str) -> str:
         _logger.debug("Attempting to acquire session token for user: %s", username)
-        tkey = "sessionToken"
         result = self._query(
             _HTTPMethod.POST,
-            "/login",
-            {
-                "username": username,
-                "password": password,
-                "domain": "default",
-            },
+            _protocol.LOGIN_PATH,
+            _protocol.login_payload(username, password),
+            authenticate=False,
         ).json()
-        if not isinstance(result, dict) or not isinstance(result.get(tkey), str):
-            _logger.error("Failed to receive session token. Result: %s", result)
-            raise _LiquidApiAuthException("session token not received", result)
-        _logger.info("Successfully acquired session token")
-        return _cast(str, result.get(tkey))
+        return _protocol.parse_session_token(result)
+
+    def _ping(self) -> None:
+        self._query(_HTTPMethod.POST, _protocol.PING_PATH)
 
     def _query(
         self,
@@ -114,89 +208,250 @@ class Liquid:
         data: _Optional[_Dict[str, _Any]] = None,
         num_retries: _Optional[int] = None,
         params: _Optional[_Dict[str, _Any]] = None,
-    ) -> _Response:
-        if (num_retries or 0) > 2:
-            _logger.error("Too many retries for path: %s", api_url_path)
-            raise _LiquidApiAuthException("too many retries")
-        base_url = self._api_base_url
-        url = (
-            f"{base_url}/dxsca-web{'/' if api_url_path[0] != '/' else ''}{api_url_path}"
-        )
-        _logger.debug("Executing %s request to %s", method, url)
-        response = _request(
-            method=method,
-            headers={
-                "Content-Type": "application/json",
-                **(
-                    {"Authorization": f"DXAPI {self._session_token}"}
-                    if getattr(self, "_session_token", None)
-                    else {}
-                ),
-            },
-            json=data,
-            url=url,
-            params=params,
-            timeout=10,
-        )
-        if _to_dict(response.text).get("description") == "Authorization required":
-            _logger.warning(
-                "Authorization required for %s. Attempting token refresh.", api_url_path
+        authenticate: bool = True,
+        timeout: _Optional[float] = None,
+        stream: bool = False,
+    ) -> _LiquidResponse:
+        url = _protocol.build_url(self._api_base_url, api_url_path)
+        endpoint = _protocol.endpoint_for(api_url_path)
+        if timeout is None:
+            timeout = self._retry_policy.timeout(endpoint)
+        attempt, throttled, failures = num_retries or 0, 0, 0
+        while attempt <= _protocol.MAX_AUTH_RETRIES:
+            try:
+                self._circuit_breaker.before_call(endpoint)
+            except _LiquidApiUnavailableException:
+                self._metrics.increment("rejected", endpoint)
+                raise
+            self._rate_limiter.acquire(endpoint)
+            token = self._tokens.current() if authenticate else None
+            _logger.debug("Executing %s request to %s", method, url)
+            started = _perf_counter()
+            try:
+                raw_response = self._transport.request(
+                    method=method,
+                    headers=_protocol.build_headers(token),
+                    json=data,
+                    url=url,
+                    params=params,
+                    timeout=timeout,
+                    stream=stream,
+                )
+            except _RequestException as e:
+                self._metrics.request(endpoint, method, None, _perf_counter() - started, 0)
+                self._circuit_breaker.record_failure(endpoint)
+                failures += 1
+                delay = self._retry_policy.backoff(endpoint, failures)
+                if delay is None:
+                    raise
+                self._metrics.increment("retry", endpoint)
+                _logger.warning(
+                    "%s request to %s failed (attempt %d), retrying in %.2fs: %s",
+                    method,
+                    api_url_path,
+                    failures,
+                    delay,
+                    e,
+                )
+                _sleep(delay)
+                continue
+            if stream and raw_response.ok:
+                response = _LiquidResponse(
+                    raw_response.status_code,
+                    raw_response.ok,
+                    None,
+                    raw_response.headers,
+                    raw_response.iter_content(_protocol.STREAM_CHUNK_SIZE),
+                    raw_response.close,
+                )
+            else:
+                response = _LiquidResponse(
+                    raw_response.status_code,
+                    raw_response.ok,
+                    raw_response.content,
+                    raw_response.headers,
+                )
+            finished = _perf_counter()
+            self._metrics.request(
+                endpoint,
+                method,
+                response.status_code,
+                finished - started,
+                _protocol.response_size(response),
             )
-            self._session_token = self._get_session_token(
-                self._username, self._password
+            trace = _tracing.active()
+            if trace is not None:
+                # requests only reports when the headers arrived, connecting and sending
+                # are part of the wait.
+                headers_at = min(finished, started + raw_response.elapsed.total_seconds())
+                trace.record("wait", started, headers_at)
+                if not response.streaming:
+                    trace.record("download", headers_at, finished)
+            throttle = _protocol.is_throttled(
+                endpoint, response.status_code, response.headers
             )
-            return self._query(method, api_url_path, data, (num_retries or 0) + 1)
+            if throttle and throttled < _protocol.MAX_THROTTLE_RETRIES:
+                throttled += 1
+                self._metrics.increment("throttled", endpoint)
+                self._rate_limiter.throttled(endpoint, _protocol.retry_after(response.headers))
+                continue
+            if response.status_code in _SERVER_ERRORS:
+                self._circuit_breaker.record_failure(endpoint)
+                failures += 1
+                delay = self._retry_policy.backoff(endpoint, failures)
+                if delay is not None:
+                    self._metrics.increment("retry", endpoint)
+                    _logger.warning(
+                        "%s request to %s returned %d (attempt %d), retrying in %.2fs",
+                        method,
+                        api_url_path,
+                        response.status_code,
+                        failures,
+                        delay,
+                    )
+                    _sleep(delay)
+                    continue
+            elif not throttle:
+                self._circuit_breaker.record_success(endpoint)
+            if (
+                authenticate
+                and not response.streaming
+                and _protocol.is_auth_required(response.json())
+            ):
+                _logger.warning(
+                    "Authorization required for %s. Attempting token refresh.", api_url_path
+                )
+                self._metrics.increment("reauth", endpoint)
+                self._tokens.refresh(token)
+                attempt += 1
+                continue
 
-        if not response.ok:
-            _logger.error(
-                "Request to %s failed with status %d: %s",
-                api_url_path,
-                response.status_code,
-                response.text,
-            )
+            if not throttle:
+                self._rate_limiter.succeeded(endpoint)
+            if authenticate:
+                self._tokens.touch()
+            if not response.ok:
+                _logger.error(
+                    "Request to %s failed with status %d: %s",
+                    api_url_path,
+                    response.status_code,
+                    response.text,
+                )
+            return response
 
-        return response
+        _logger.error("Too many retries for path: %s", api_url_path)
+        raise _LiquidApiAuthException("too many retries")
 
+    @_traced
     def get_instruments(self) -> _List[_Instrument]:
         _logger.info("Fetching instruments")
         result = self._query(
             _HTTPMethod.GET,
-            "instruments/query",
+            _protocol.INSTRUMENTS_PATH,
         ).json()
-        if not isinstance(result, dict) or "instruments" not in result:
-            _logger.error("Invalid instruments response: %s", result)
-            raise _LiquidApiException("instruments not received", result)
-        dtos = _InstrumentsDtoCollection(**result)
-        _logger.debug("Successfully parsed %d instruments", len(dtos.instruments))
-        return [dto.to_bo() for dto in dtos.instruments]
+        return _protocol.parse_instruments(result)
+
+    def get_instrument_registry(self) -> _InstrumentRegistry:
+        return _InstrumentRegistry(self.get_instruments())
 
+    @_traced
+    def get_instrument_records(self) -> _List[_Dict[str, _Any]]:
+        _logger.info("Fetching raw instrument records")
+        result = self._query(
+            _HTTPMethod.GET,
+            _protocol.INSTRUMENTS_PATH,
+        ).json()
+        return _protocol.instrument_records(result)
+
+    @_traced
     def get_quotes(self, symbols: _List[_SymbolLiteral]) -> _List[_Quote]:
         response = self._query(
             _HTTPMethod.POST,
-            "marketdata",
-            {
-                "symbols": symbols,
-                "eventTypes": [{"type": "Quote"}],
-            },
+            _protocol.MARKET_DATA_PATH,
+            _protocol.quotes_payload(symbols),
         ).json()
-        if not isinstance(response, dict) or "events" not in response:
-            _logger.error(
-                "Failed to receive quotes for %s: %s", ",".join(symbols), response
-            )
-            raise _LiquidApiException(
-                f"'{','.join(symbols)}' quotes not received", response
-            )
-        if not isinstance(response["events"], list) or len(response["events"]) != len(
-            symbols
-        ):
-            _logger.error(
-                "Failed to receive all quotes for %s: %s", ",".join(symbols), response
-            )
-            raise _LiquidApiException(
-                f"All of '{','.join(symbols)}' quotes not received", response
+        return _protocol.parse_quotes(symbols, response, self._validation)
+
+    @_traced
+    def get_quotes_bulk(
+        self,
+        symbols: _List[_SymbolLiteral],
+        batch_size: int = 50,
+        max_workers: int = 4,
+    ) -> _QuoteBatchResult:
+        unique_symbols = list(dict.fromkeys(symbols))
+        if not unique_symbols:
+            return _QuoteBatchResult({}, {})
+        batches = _protocol.batched(unique_symbols, batch_size)
+        _logger.info(
+            "Fetching quotes for %d symbols in %d requests", len(unique_symbols), len(batches)
+        )
+
+        def fetch_batch(batch: _List[_SymbolLiteral]) -> _QuoteBatchResult:
+            try:
+                response = self._query(
+                    _HTTPMethod.POST,
+                    _protocol.MARKET_DATA_PATH,
+                    _protocol.quotes_payload(batch),
+                ).json()
+            except (_LiquidApiException, _RequestException) as e:
+                _logger.error("Quote request for %s failed: %s", ",".join(batch), e)
+                return _QuoteBatchResult({}, {symbol: e for symbol in batch})
+            return _protocol.parse_quotes_partial(batch, response, self._validation)
+
+        result = _QuoteBatchResult({}, {})
+        with _ThreadPoolExecutor(
+            max_workers=min(max_workers, len(batches)),
+            thread_name_prefix="liquid-quotes",
+        ) as executor:
+            for batch_result in executor.map(_tracing.in_context(fetch_batch), batches):
+                result.quotes.update(batch_result.quotes)
+                result.errors.update(batch_result.errors)
+        if result.errors:
+            _logger.warning(
+                "Quotes missing for %d of %d symbols", len(result.errors), len(unique_symbols)
             )
-        return [_QuoteDto(**event).to_bo() for event in response["events"]]
+        return result
+
+    def _fetch_candles(
+        self,
+        symbol: _SymbolLiteral,
+        duration: _CandleIntervalLiteral,
+        from_time: _datetime,
+        to_time: _datetime,
+        timeout: _Optional[float] = None,
+    ) -> _List[_Candle[_SymbolLiteral]]:
+        response = self._query(
+            _HTTPMethod.POST,
+            _protocol.MARKET_DATA_PATH,
+            _protocol.candles_payload([symbol], duration, from_time, to_time),
+            timeout=timeout,
+        ).json()
+        return _protocol.parse_candles(symbol, from_time, response, self._validation)
+
+    def _read_through(
+        self,
+        symbol: _SymbolLiteral,
+        duration: _CandleIntervalLiteral,
+        from_time: _datetime,
+        to_time: _datetime,
+        fetch: _Callable[[_datetime, _datetime], _List[_Candle[_SymbolLiteral]]],
+    ) -> _List[_Candle[_SymbolLiteral]]:
+        store = self._candle_store
+        if store is None:
+            return fetch(from_time, to_time)
+        fetched: _List[_List[_Candle[_SymbolLiteral]]] = []
+        for gap_from, gap_to in store.missing(symbol, duration, from_time, to_time):
+            _logger.debug("Filling candle gap for %s from %s to %s", symbol, gap_from, gap_to)
+            candles = fetch(gap_from, gap_to)
+            store.save(symbol, duration, gap_from, gap_to, candles)
+            fetched.append(candles)
+        stored = store.load(symbol, duration, from_time, to_time)
+        if not fetched:
+            return stored
+        return _backfill.merge_candles([stored, *fetched])
 
+    @_traced
     def get_market_data(
         self,
         symbol: _SymbolLiteral,
@@ -204,11 +459,7 @@ class Liquid:
         from_time: _datetime,
         to_time: _datetime,
     ) -> _List[_Candle[_SymbolLiteral]]:
-        if from_time >= to_time:
-            _logger.error(
-                "Invalid time range: from_time (%s) >= to_time (%s)", from_time, to_time
-            )
-            raise ValueError("'from_time' must be a date-time before 'to_time'")
+        _protocol.check_time_range(from_time, to_time)
         _logger.info(
             "Fetching market data for %s (interval: %s) from %s to %s",
             symbol,
@@ -216,45 +467,201 @@ class Liquid:
             from_time,
             to_time,
         )
+        return self._read_through(
+            symbol,
+            duration,
+            from_time,
+            to_time,
+            lambda start, end: self._fetch_candles(symbol, duration, start, end),
+        )
+
+    @_traced
+    def get_market_data_multi(
+        self,
+        symbols: _List[_SymbolLiteral],
+        duration: _CandleIntervalLiteral,
+        from_time: _datetime,
+        to_time: _datetime,
+        max_symbols_per_request: int = 50,
+        max_workers: int = 4,
+    ) -> _Dict[_SymbolLiteral, _List[_Candle[_SymbolLiteral]]]:
+        _protocol.check_time_range(from_time, to_time)
+        unique_symbols = list(dict.fromkeys(symbols))
+        if not unique_symbols:
+            return {}
+        batches = _protocol.batched(unique_symbols, max_symbols_per_request)
+        _logger.info(
+            "Fetching market data for %d symbols (interval: %s) from %s to %s in %d requests",
+            len(unique_symbols),
+            duration,
+            from_time,
+            to_time,
+            len(batches),
+        )
+
+        def fetch_batch(
+            batch: _List[_SymbolLiteral],
+        ) -> _Dict[_SymbolLiteral, _List[_Candle[_SymbolLiteral]]]:
+            response = self._query(
+                _HTTPMethod.POST,
+                _protocol.MARKET_DATA_PATH,
+                _protocol.candles_payload(batch, duration, from_time, to_time),
+            ).json()
+            return _protocol.parse_candles_by_symbol(
+                batch, from_time, response, self._validation
+            )
+
+        candles: _Dict[_SymbolLiteral, _List[_Candle[_SymbolLiteral]]] = {}
+        if len(batches) == 1:
+            candles.update(fetch_batch(batches[0]))
+            return candles
+        with _ThreadPoolExecutor(
+            max_workers=min(max_workers, len(batches)),
+            thread_name_prefix="liquid-marketdata",
+        ) as executor:
+            for batch_candles in executor.map(_tracing.in_context(fetch_batch), batches):
+                candles.update(batch_candles)
+        return candles
+
+    @_traced
+    def get_market_data_columns(
+        self,
+        symbol: _SymbolLiteral,
+        duration: _CandleIntervalLiteral,
+        from_time: _datetime,
+        to_time: _datetime,
+    ) -> _CandleColumns:
+        _protocol.check_time_range(from_time, to_time)
+        _logger.info(
+            "Fetching columnar market data for %s (interval: %s) from %s to %s",
+            symbol,
+            duration,
+            from_time,
+            to_time,
+        )
         response = self._query(
             _HTTPMethod.POST,
-            "marketdata",
-            {
-                "symbols": [symbol],
-                "eventTypes": [
-                    {
-                        "type": "Candle",
-                        "candleType": duration,
-                        "fromTime": from_time.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-7]
-                        + "Z",
-                        "toTime": to_time.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-7] + "Z",
-                    },
-                ],
-            },
+            _protocol.MARKET_DATA_PATH,
+            _protocol.candles_payload([symbol], duration, from_time, to_time),
         ).json()
+        events = _protocol.candle_events(symbol, from_time, response)
+        with _tracing.phase("convert"):
+            return _candle_columns(symbol, duration, events)
 
-        if not isinstance(response, dict) or "events" not in response:
-            _logger.error("Failed to receive market data for %s: %s", symbol, response)
+    def iter_market_data(
+        self,
+        symbol: _SymbolLiteral,
+        duration: _CandleIntervalLiteral,
+        from_time: _datetime,
+        to_time: _datetime,
+    ) -> _Iterator[_Candle[_SymbolLiteral]]:
+        # Checked here rather than in the generator so a bad range fails at the call.
+        _protocol.check_time_range(from_time, to_time)
+        return self._stream_market_data(symbol, duration, from_time, to_time)
+
+    def _stream_market_data(
+        self,
+        symbol: _SymbolLiteral,
+        duration: _CandleIntervalLiteral,
+        from_time: _datetime,
+        to_time: _datetime,
+    ) -> _Iterator[_Candle[_SymbolLiteral]]:
+        _logger.info(
+            "Streaming market data for %s (interval: %s) from %s to %s",
+            symbol,
+            duration,
+            from_time,
+            to_time,
+        )
+        response = self._query(
+            _HTTPMethod.POST,
+            _protocol.MARKET_DATA_PATH,
+            _protocol.candles_payload([symbol], duration, from_time, to_time),
+            stream=True,
+        )
+        try:
+            for event in response.iter_array("events"):
+                yield self._validation.candle(event)
+        except _JsonArrayNotFound as e:
+            _logger.error("Failed to receive market data for %s: %s", symbol, e.payload)
             raise _LiquidApiException(
-                f"'{symbol}' at '{from_time}' market data not received", response
+                f"'{symbol}' at '{from_time}' market data not received", e.payload
+            ) from e
+        finally:
+            response.close()
+
+    @_traced
+    def backfill_market_data(
+        self,
+        symbol: _SymbolLiteral,
+        duration: _CandleIntervalLiteral,
+        from_time: _datetime,
+        to_time: _datetime,
+        window: _Optional[_timedelta] = None,
+        max_workers: int = 4,
+        max_attempts: int = 3,
+        retry_delay: float = 0.5,
+        timeout: float = 30.0,
+    ) -> _List[_Candle[_SymbolLiteral]]:
+        _protocol.check_time_range(from_time, to_time)
+        if max_workers < 1 or max_attempts < 1:
+            raise ValueError("'max_workers' and 'max_attempts' must be at least 1")
+        _logger.info(
+            "Backfilling market data for %s (interval: %s) from %s to %s",
+            symbol,
+            duration,
+            from_time,
+            to_time,
+        )
+
+        def fetch_window(bounds: _Tuple[_datetime, _datetime]) -> _List[_Candle[_SymbolLiteral]]:
+            for attempt in range(1, max_attempts):
+                try:
+                    return self._fetch_candles(symbol, duration, *bounds, timeout=timeout)
+                except (_LiquidApiAuthException, _LiquidApiUnavailableException):
+                    raise
+                except _LiquidApiException as e:
+                    # Transport errors and server errors were already retried by the retry
+                    # policy, only a bad window payload is fetched again here.
+                    _logger.warning(
+                        "Window %s - %s for %s failed (attempt %d/%d): %s",
+                        bounds[0],
+                        bounds[1],
+                        symbol,
+                        attempt,
+                        max_attempts,
+                        e,
+                    )
+                    _sleep(retry_delay * 2 ** (attempt - 1))
+            return self._fetch_candles(symbol, duration, *bounds, timeout=timeout)
+
+        def fetch_range(start: _datetime, end: _datetime) -> _List[_Candle[_SymbolLiteral]]:
+            windows = _backfill.split_range(start, end, duration, window)
+            _logger.debug(
+                "Fetching %s from %s to %s in %d windows", symbol, start, end, len(windows)
             )
-        dtos = [_CandleDto(**candle_dict) for candle_dict in response["events"]]
-        _logger.debug("Retrieved %d candles for %s", len(dtos), symbol)
-        return [dto.to_bo() for dto in dtos]
+            with _ThreadPoolExecutor(
+                max_workers=min(max_workers, len(windows)),
+                thread_name_prefix="liquid-backfill",
+            ) as executor:
+                return _backfill.merge_candles(
+                    executor.map(_tracing.in_context(fetch_window), windows)
+                )
+
+        candles = self._read_through(symbol, duration, from_time, to_time, fetch_range)
+        _logger.debug("Backfilled %d candles for %s", len(candles), symbol)
+        return candles
 
+    @_traced
     def get_open_positions(self) -> _List[_Position]:
         _logger.info("Fetching open positions")
         response = self._query(
             _HTTPMethod.GET,
-            f"accounts/{self._account_code}/positions",
+            _protocol.positions_path(self._account_code),
         ).json()
-        if not isinstance(response, dict) or "positions" not in response:
-            _logger.error("Failed to receive positions: %s", response)
-            raise _LiquidApiException("positions not received", response)
-        dtos = _PositionsDto(**response).positions
-        _logger.debug("Successfully parsed %d open positions", len(dtos))
-        return [dto.to_bo() for dto in dtos]
+        return _protocol.parse_positions(response, self._validation)
 
+    @_traced
     def place_order(
         self,
         symbol: _SymbolLiteral,
@@ -266,50 +673,63 @@ class Liquid:
         limit_price: _Optional[float] = None,
         stop_price: _Optional[float] = None,
     ) -> _Tuple[str, str]:
-        order_code = "".join(_choices(_ascii_letters + _digits, k=7))
-        _logger.info(
-            "Placing %s %s order for %s (qty: %f, effect: %s, code: %s)",
-            side,
-            order_type,
-            symbol,
-            quantity,
-            effect,
-            order_code,
-        )
+        order_code = _protocol.new_order_code()
         response = self._query(
             _HTTPMethod.POST,
-            f"accounts/{self._account_code}/orders",
-            {
-                "orderCode": order_code,
-                "type": order_type,
-                "instrument": symbol,
-                "quantity": quantity,
-                "side": side,
-                "positionEffect": effect,
-                "tif": "GTC",
-                **(
-                    {"positionCode": position_code} if position_code is not None else {}
-                ),
-                **({"limitPrice": limit_price} if limit_price is not None else {}),
-                **({"stopPrice": stop_price} if stop_price is not None else {}),
-            },
+            _protocol.orders_path(self._account_code),
+            _protocol.order_payload(
+                order_code,
+                symbol,
+                order_type,
+                side,
+                effect,
+                quantity,
+                position_code,
+                limit_price,
+                stop_price,
+            ),
         ).json()
-        if not isinstance(response, dict) or not "orderId" in response:
-            _logger.error("Order placement failed for %s: %s", order_code, response)
-            raise _LiquidApiException(
-                f"'{symbol}' '{order_type}' '{side}' order to '{effect}' amount '{quantity}' not successful",
-                response,
-            )
-        _logger.info(
-            "Order successfully placed. orderId: %s, updateOrderId: %s",
-            response.get("orderId"),
-            response.get("updateOrderId"),
-        )
-        return (
-            _cast(str, response["orderId"]),
-            _cast(str, response["updateOrderId"]),
+        return _protocol.parse_order_result(
+            order_code, symbol, order_type, side, effect, quantity, response
         )
 
+    @_traced
+    def place_orders(
+        self,
+        orders: _List[_OrderSpec],
+        max_concurrency: int = 8,
+        preserve_order: bool = False,
+    ) -> _OrderBatchResult:
+        if max_concurrency < 1:
+            raise ValueError("'max_concurrency' must be at least 1")
+        result = _OrderBatchResult({}, {})
+        if not orders:
+            return result
+        workers = 1 if preserve_order else min(max_concurrency, len(orders))
+        _logger.info("Placing %d orders with up to %d in flight", len(orders), workers)
+
+        def submit(order: _OrderSpec) -> _Union[_Tuple[str, str], Exception]:
+            try:
+                return self.place_order(*order)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                _logger.error("Order for %s failed: %s", order.symbol, e)
+                return e
+
+        # Orders are never retried, a failed leg is reported back to the caller.
+        with _ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="liquid-orders",
+        ) as executor:
+            for index, outcome in enumerate(executor.map(_tracing.in_context(submit), orders)):
+                if isinstance(outcome, Exception):
+                    result.errors[index] = outcome
+                else:
+                    result.placed[index] = outcome
+        if result.errors:
+            _logger.warning("%d of %d orders failed", len(result.errors), len(orders))
+        return result
+
+    @_traced
     def get_order_history(
         self,
         symbol: _Optional[_SymbolLiteral] = None,
@@ -320,17 +740,32 @@ class Liquid:
         )
         response = self._query(
             _HTTPMethod.GET,
-            f"accounts/{self._account_code}/orders/history",
-            params={
-                **({"for-instrument": symbol} if symbol is not None else {}),
-                **({"with-order-id": order_id} if order_id is not None else {}),
-            },
+            _protocol.order_history_path(self._account_code),
+            params=_protocol.order_history_params(symbol, order_id),
         ).json()
-        if not isinstance(response, dict) or "orders" not in response:
-            _logger.error("Failed to receive order history: %s", response)
+        return _protocol.parse_order_history(symbol, order_id, response, self._validation)
+
+    def iter_order_history(
+        self,
+        symbol: _Optional[_SymbolLiteral] = None,
+        order_id: _Optional[str] = None,
+    ) -> _Iterator[_HistoricalOrderDto]:
+        _logger.info(
+            "Streaming order history (symbol: %s, order_id: %s)", symbol, order_id
+        )
+        response = self._query(
+            _HTTPMethod.GET,
+            _protocol.order_history_path(self._account_code),
+            params=_protocol.order_history_params(symbol, order_id),
+            stream=True,
+        )
+        try:
+            for order in response.iter_array("orders"):
+                yield self._validation.order(order)
+        except _JsonArrayNotFound as e:
+            _logger.error("Failed to receive order history: %s", e.payload)
             raise _LiquidApiException(
-                f"'{symbol or order_id}' order history not received", response
-            )
-        dtos = [_HistoricalOrderDto(**order) for order in response["orders"]]
-        _logger.debug("Successfully parsed %d historical orders", len(dtos))
-        return dtos
+                f"'{symbol or order_id}' order history not received", e.payload
+            ) from e
+        finally:
+            response.close()
@@ -0,0 +1,62 @@
+from typing import (
+    TYPE_CHECKING as _TYPE_CHECKING,
+    Any as _Any,
+    Dict as _Dict,
+    List as _List,
+    NamedTuple as _NamedTuple,
+)
+from datetime import (
+    datetime as _datetime,
+    timezone as _timezone,
+)
+from tickshock.ground.types import (
+    CandleIntervalLiteral as _CandleIntervalLiteral,
+)
+from .types import (
+    SymbolLiteral as _SymbolLiteral,
+)
+from ._numpy import (
+    require_numpy as _require_numpy,
+)
+
+if _TYPE_CHECKING:
+    from numpy.typing import NDArray as _NDArray
+
+
+class CandleColumns(_NamedTuple):
+    symbol: _SymbolLiteral
+    candle_type: _CandleIntervalLiteral
+    time: "_NDArray[_Any]"
+    open: "_NDArray[_Any]"
+    high: "_NDArray[_Any]"
+    low: "_NDArray[_Any]"
+    close: "_NDArray[_Any]"
+    volume: "_NDArray[_Any]"
+
+
+def _utc_naive(value: str) -> str:
+    if value.endswith("Z"):
+        return value[:-1]
+    parsed = _datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(_timezone.utc).replace(tzinfo=None)
+    return parsed.isoformat()
+
+
+def candle_columns(
+    symbol: _SymbolLiteral,
+    candle_type: _CandleIntervalLiteral,
+    events: _List[_Dict[str, _Any]],
+) -> CandleColumns:
+    np = _require_numpy("columnar candles")
+    count = len(events)
+    return CandleColumns(
+        symbol,
+        candle_type,
+        np.array([_utc_naive(event["time"]) for event in events], dtype="datetime64[us]"),
+        np.fromiter((event["open"] for event in events), dtype=np.float64, count=count),
+        np.fromiter((event["high"] for event in events), dtype=np.float64, count=count),
+        np.fromiter((event["low"] for event in events), dtype=np.float64, count=count),
+        np.fromiter((event["close"] for event in events), dtype=np.float64, count=count),
+        np.fromiter((event["volume"] for event in events), dtype=np.float64, count=count),
+    )
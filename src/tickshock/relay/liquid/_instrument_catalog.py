@@ -0,0 +1,185 @@
+import json as _json
+import logging as _logging
+from os import (
+    PathLike as _PathLike,
+    replace as _replace,
+)
+from pathlib import (
+    Path as _Path,
+)
+from threading import (
+    Event as _Event,
+    Lock as _Lock,
+    Thread as _Thread,
+)
+from types import (
+    TracebackType as _TracebackType,
+)
+from typing import (
+    Any as _Any,
+    Dict as _Dict,
+    Final as _Final,
+    List as _List,
+    Optional as _Optional,
+    Tuple as _Tuple,
+    Type as _Type,
+    Union as _Union,
+    cast as _cast,
+)
+from pydantic import (
+    TypeAdapter as _TypeAdapter,
+)
+from ._client import (
+    Liquid as _Liquid,
+)
+from ._instrument_registry import (
+    InstrumentRegistry as _InstrumentRegistry,
+)
+from .types import (
+    Instrument as _Instrument,
+    SymbolLiteral as _SymbolLiteral,
+)
+from .types._instrument import (
+    AnyInstrumentDto as _AnyInstrumentDto,
+)
+
+_logger = _logging.getLogger(__name__)
+
+_CATALOG_FORMAT = 1
+_instrument_adapter: _Final[_TypeAdapter[_AnyInstrumentDto]] = _TypeAdapter(
+    _cast(_Type[_AnyInstrumentDto], _AnyInstrumentDto)
+)
+
+_Entry = _Tuple[int, _Dict[str, _Any], _Instrument]
+
+
+class InstrumentCatalog:
+    def __init__(
+        self,
+        path: _Union[str, "_PathLike[str]"],
+        client: _Optional[_Liquid] = None,
+        refresh_interval: _Optional[float] = None,
+    ) -> None:
+        if refresh_interval is not None and (client is None or refresh_interval <= 0):
+            raise ValueError("'refresh_interval' needs a positive value and a client")
+        self._path: _Final = _Path(path)
+        self._client: _Final = client
+        self._refresh_interval: _Final = refresh_interval
+        self._lock: _Final = _Lock()
+        self._refresh_lock: _Final = _Lock()
+        self._stop: _Final = _Event()
+        self._thread: _Optional[_Thread] = None
+        self._entries: _Dict[_SymbolLiteral, _Entry] = {}
+        self._registry = _InstrumentRegistry(())
+        self.load()
+
+    @staticmethod
+    def _build(record: _Dict[str, _Any]) -> _Instrument:
+        return _instrument_adapter.validate_python(record).to_bo()
+
+    def load(self) -> int:
+        if not self._path.exists():
+            _logger.info("No instrument catalog at %s yet", self._path)
+            return 0
+        document = _json.loads(self._path.read_bytes())
+        if document.get("format") != _CATALOG_FORMAT:
+            _logger.warning("Ignoring instrument catalog with unknown format at %s", self._path)
+            return 0
+        entries: _Dict[_SymbolLiteral, _Entry] = {
+            record["symbol"]: (record["version"], record, self._build(record))
+            for record in document["instruments"]
+        }
+        self._publish(entries)
+        _logger.info("Loaded %d instruments from %s", len(entries), self._path)
+        return len(entries)
+
+    def _publish(self, entries: _Dict[_SymbolLiteral, _Entry]) -> None:
+        with self._lock:
+            self._entries = entries
+            self._registry = _InstrumentRegistry(entry[2] for entry in entries.values())
+
+    def _persist(self, entries: _Dict[_SymbolLiteral, _Entry]) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self._path.with_name(self._path.name + ".tmp")
+        temporary.write_text(
+            _json.dumps(
+                {
+                    "format": _CATALOG_FORMAT,
+                    "instruments": [entry[1] for entry in entries.values()],
+                }
+            ),
+            encoding="utf-8",
+        )
+        _replace(temporary, self._path)
+
+    @property
+    def instruments(self) -> _List[_Instrument]:
+        return list(self._registry)
+
+    @property
+    def registry(self) -> _InstrumentRegistry:
+        return self._registry
+
+    def get(self, symbol: _SymbolLiteral) -> _Optional[_Instrument]:
+        return self._registry.get(symbol)
+
+    def refresh(self) -> _Tuple[int, int]:
+        if self._client is None:
+            raise ValueError("catalog has no client to refresh from")
+        # Background and manual refreshes share the temporary file and the entries they
+        # diff against, so they run one at a time.
+        with self._refresh_lock:
+            records = self._client.get_instrument_records()
+            current = self._entries
+            entries: _Dict[_SymbolLiteral, _Entry] = {}
+            rebuilt = 0
+            for record in records:
+                symbol = _cast(_SymbolLiteral, record.get("symbol"))
+                version = _cast(int, record.get("version"))
+                existing = current.get(symbol)
+                if existing is not None and existing[0] == version:
+                    entries[symbol] = existing
+                    continue
+                entries[symbol] = (version, record, self._build(record))
+                rebuilt += 1
+            removed = len(set(current) - set(entries))
+            if rebuilt or removed:
+                self._persist(entries)
+            self._publish(entries)
+        _logger.info(
+            "Instrument catalog refreshed: %d rebuilt, %d removed, %d total",
+            rebuilt,
+            removed,
+            len(entries),
+        )
+        return rebuilt, removed
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._refresh_interval):
+            try:
+                self.refresh()
+            except Exception:  # pylint: disable=broad-exception-caught
+                _logger.exception("Background instrument refresh failed")
+
+    def start(self) -> "InstrumentCatalog":
+        if self._thread is None and self._refresh_interval is not None:
+            self._thread = _Thread(target=self._run, name="liquid-instrument-catalog", daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def __enter__(self) -> "InstrumentCatalog":
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: _Optional[_Type[BaseException]],
+        exc: _Optional[BaseException],
+        tb: _Optional[_TracebackType],
+    ) -> None:
+        self.close()
@@ -0,0 +1,68 @@
+from typing import (
+    Dict as _Dict,
+    Final as _Final,
+    Iterable as _Iterable,
+    Iterator as _Iterator,
+    List as _List,
+    Optional as _Optional,
+    Tuple as _Tuple,
+    TypeVar as _TypeVar,
+)
+from .types import (
+    CurrencyLiteral as _CurrencyLiteral,
+    Instrument as _Instrument,
+    InstrumentTypeLiteral as _InstrumentTypeLiteral,
+    SymbolLiteral as _SymbolLiteral,
+)
+
+_K = _TypeVar("_K")
+
+
+def _freeze(index: _Dict[_K, _List[_Instrument]]) -> _Dict[_K, _Tuple[_Instrument, ...]]:
+    return {key: tuple(instruments) for key, instruments in index.items()}
+
+
+class InstrumentRegistry:
+    def __init__(self, instruments: _Iterable[_Instrument]) -> None:
+        by_symbol: _Dict[_SymbolLiteral, _Instrument] = {}
+        by_type: _Dict[_InstrumentTypeLiteral, _List[_Instrument]] = {}
+        by_currency: _Dict[_CurrencyLiteral, _List[_Instrument]] = {}
+        by_asset_class: _Dict[str, _List[_Instrument]] = {}
+        for instrument in instruments:
+            if instrument.symbol in by_symbol:
+                raise ValueError(f"duplicate instrument '{instrument.symbol}'")
+            by_symbol[instrument.symbol] = instrument
+            if instrument.type is not None:
+                by_type.setdefault(instrument.type, []).append(instrument)
+            if instrument.currency is not None:
+                by_currency.setdefault(instrument.currency, []).append(instrument)
+            if instrument.asset_class is not None:
+                by_asset_class.setdefault(instrument.asset_class, []).append(instrument)
+        self._by_symbol: _Final = by_symbol
+        self._by_type: _Final = _freeze(by_type)
+        self._by_currency: _Final = _freeze(by_currency)
+        self._by_asset_class: _Final = _freeze(by_asset_class)
+
+    def __len__(self) -> int:
+        return len(self._by_symbol)
+
+    def __iter__(self) -> _Iterator[_Instrument]:
+        return iter(self._by_symbol.values())
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._by_symbol
+
+    def __getitem__(self, symbol: _SymbolLiteral) -> _Instrument:
+        return self._by_symbol[symbol]
+
+    def get(self, symbol: _SymbolLiteral) -> _Optional[_Instrument]:
+        return self._by_symbol.get(symbol)
+
+    def by_type(self, instrument_type: _InstrumentTypeLiteral) -> _Tuple[_Instrument, ...]:
+        return self._by_type.get(instrument_type, ())
+
+    def by_currency(self, currency: _CurrencyLiteral) -> _Tuple[_Instrument, ...]:
+        return self._by_currency.get(currency, ())
+
+    def by_asset_class(self, asset_class: str) -> _Tuple[_Instrument, ...]:
+        return self._by_asset_class.get(asset_class, ())
@@ -0,0 +1,96 @@
+import json as _json
+from codecs import (
+    getincrementaldecoder as _getincrementaldecoder,
+)
+from re import (
+    compile as _compile,
+    escape as _escape,
+)
+from typing import (
+    Any as _Any,
+    Callable as _Callable,
+    Iterable as _Iterable,
+    Iterator as _Iterator,
+    Optional as _Optional,
+    Union as _Union,
+)
+
+_orjson_loads: _Optional[_Callable[[_Union[bytes, str]], _Any]]
+try:
+    from orjson import (
+        loads as _orjson_loads,
+    )
+except ImportError:  # pragma: no cover - depends on the environment
+    _orjson_loads = None
+
+JSON_BACKEND = "orjson" if _orjson_loads is not None else "json"
+
+_loads: _Callable[[_Union[bytes, str]], _Any] = (
+    _orjson_loads if _orjson_loads is not None else _json.loads
+)
+_raw_decode = _json.JSONDecoder().raw_decode
+_WHITESPACE = " \t\n\r"
+
+
+class JsonArrayNotFound(ValueError):
+    def __init__(self, key: str, payload: _Any) -> None:
+        super().__init__(f"'{key}' array not found in response")
+        self.payload = payload
+
+
+def loads(data: _Union[bytes, str]) -> _Any:
+    return _loads(data)
+
+
+def iter_array(chunks: _Iterable[bytes], key: str) -> _Iterator[_Any]:
+    decoder = _getincrementaldecoder("utf-8")()
+    source = iter(chunks)
+    opening = _compile(rf'"{_escape(key)}"\s*:\s*\[')
+    buffer = ""
+    exhausted = False
+
+    def read() -> bool:
+        nonlocal buffer, exhausted
+        if exhausted:
+            return False
+        chunk = next(source, None)
+        if chunk is None:
+            exhausted = True
+            buffer += decoder.decode(b"", final=True)
+        else:
+            buffer += decoder.decode(chunk)
+        return True
+
+    match = opening.search(buffer)
+    while match is None:
+        if not read():
+            try:
+                payload = _loads(buffer) if buffer.strip() else None
+            except ValueError:
+                payload = None
+            raise JsonArrayNotFound(key, payload)
+        match = opening.search(buffer)
+    buffer = buffer[match.end():]
+
+    position = 0
+    while True:
+        while position < len(buffer) and buffer[position] in _WHITESPACE + ",":
+            position += 1
+        if position >= len(buffer):
+            buffer = ""
+            position = 0
+            if not read():
+                raise ValueError(f"'{key}' array is truncated")
+            continue
+        if buffer[position] == "]":
+            return
+        try:
+            item, end = _raw_decode(buffer, position)
+        except ValueError:
+            buffer = buffer[position:]
+            position = 0
+            if not read():
+                raise
+            continue
+        yield item
+        position = end
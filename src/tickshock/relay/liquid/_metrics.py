@@ -0,0 +1,261 @@
+import json as _json
+import logging as _logging
+from bisect import (
+    bisect_left as _bisect_left,
+)
+from os import (
+    PathLike as _PathLike,
+    replace as _replace,
+)
+from pathlib import (
+    Path as _Path,
+)
+from threading import (
+    Event as _Event,
+    Lock as _Lock,
+    Thread as _Thread,
+)
+from types import (
+    TracebackType as _TracebackType,
+)
+from typing import (
+    Any as _Any,
+    Dict as _Dict,
+    Final as _Final,
+    Literal as _Literal,
+    NamedTuple as _NamedTuple,
+    Optional as _Optional,
+    Sequence as _Sequence,
+    Tuple as _Tuple,
+    Type as _Type,
+    Union as _Union,
+)
+from ._rate_limit import (
+    EndpointLiteral as _EndpointLiteral,
+)
+
+_logger = _logging.getLogger(__name__)
+
+CounterLiteral = _Literal["retry", "reauth", "throttled", "rejected"]
+
+LATENCY_BOUNDS: _Final = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0
+)
+SIZE_BOUNDS: _Final = (256, 1_024, 4_096, 16_384, 65_536, 262_144, 1_048_576, 4_194_304)
+
+
+class MetricsSink:
+    def request(
+        self,
+        endpoint: _EndpointLiteral,
+        method: str,
+        status_code: _Optional[int],
+        seconds: float,
+        size: int,
+    ) -> None:
+        pass
+
+    def increment(self, counter: CounterLiteral, endpoint: _EndpointLiteral) -> None:
+        pass
+
+
+class HistogramSnapshot(_NamedTuple):
+    bounds: _Tuple[float, ...]
+    counts: _Tuple[int, ...]
+    samples: int
+    total: float
+    max: float
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.samples if self.samples else 0.0
+
+    def quantile(self, q: float) -> float:
+        if not 0 <= q <= 1:
+            raise ValueError("'q' must be between 0 and 1")
+        if not self.samples:
+            return 0.0
+        # Upper bound of the bucket holding the quantile, the overflow bucket
+        # reports the max.
+        rank, seen = q * self.samples, 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank and seen:
+                return min(bound, self.max)
+        return self.max
+
+
+class RequestStats(_NamedTuple):
+    requests: int
+    errors: int
+    latency: HistogramSnapshot
+    size: HistogramSnapshot
+
+
+class MetricsSnapshot(_NamedTuple):
+    requests: _Dict[_Tuple[_EndpointLiteral, str], RequestStats]
+    counters: _Dict[_Tuple[CounterLiteral, _EndpointLiteral], int]
+
+
+class _Histogram:
+    __slots__ = ("bounds", "counts", "total", "max")
+
+    def __init__(self, bounds: _Sequence[float]) -> None:
+        self.bounds: _Final = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[_bisect_left(self.bounds, value)] += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def snapshot(self) -> HistogramSnapshot:
+        return HistogramSnapshot(
+            self.bounds, tuple(self.counts), sum(self.counts), self.total, self.max
+        )
+
+
+class _RequestMetrics:
+    __slots__ = ("errors", "latency", "size")
+
+    def __init__(
+        self, latency_bounds: _Sequence[float], size_bounds: _Sequence[float]
+    ) -> None:
+        self.errors = 0
+        self.latency: _Final = _Histogram(latency_bounds)
+        self.size: _Final = _Histogram(size_bounds)
+
+    def snapshot(self) -> RequestStats:
+        latency = self.latency.snapshot()
+        return RequestStats(latency.samples, self.errors, latency, self.size.snapshot())
+
+
+class InMemoryMetrics(MetricsSink):
+    def __init__(
+        self,
+        latency_bounds: _Sequence[float] = LATENCY_BOUNDS,
+        size_bounds: _Sequence[float] = SIZE_BOUNDS,
+    ) -> None:
+        for bounds in (latency_bounds, size_bounds):
+            if list(bounds) != sorted(bounds):
+                raise ValueError("histogram bounds need to be sorted")
+        self._latency_bounds: _Final = tuple(latency_bounds)
+        self._size_bounds: _Final = tuple(size_bounds)
+        self._lock: _Final = _Lock()
+        self._requests: _Dict[_Tuple[_EndpointLiteral, str], _RequestMetrics] = {}
+        self._counters: _Dict[_Tuple[CounterLiteral, _EndpointLiteral], int] = {}
+
+    def request(
+        self,
+        endpoint: _EndpointLiteral,
+        method: str,
+        status_code: _Optional[int],
+        seconds: float,
+        size: int,
+    ) -> None:
+        key = (endpoint, method)
+        with self._lock:
+            metrics = self._requests.get(key)
+            if metrics is None:
+                metrics = self._requests[key] = _RequestMetrics(
+                    self._latency_bounds, self._size_bounds
+                )
+            metrics.latency.observe(seconds)
+            metrics.size.observe(size)
+            if status_code is None or status_code >= 400:
+                metrics.errors += 1
+
+    def increment(self, counter: CounterLiteral, endpoint: _EndpointLiteral) -> None:
+        key = (counter, endpoint)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+
+    def snapshot(self) -> MetricsSnapshot:
+        with self._lock:
+            return MetricsSnapshot(
+                {key: metrics.snapshot() for key, metrics in self._requests.items()},
+                dict(self._counters),
+            )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._requests = {}
+            self._counters = {}
+
+    def export(self) -> _Dict[str, _Any]:
+        snapshot = self.snapshot()
+        return {
+            "requests": [
+                {
+                    "endpoint": endpoint,
+                    "method": str(method),
+                    "requests": stats.requests,
+                    "errors": stats.errors,
+                    "latency": stats.latency._asdict(),
+                    "size": stats.size._asdict(),
+                }
+                for (endpoint, method), stats in snapshot.requests.items()
+            ],
+            "counters": [
+                {"counter": counter, "endpoint": endpoint, "value": value}
+                for (counter, endpoint), value in snapshot.counters.items()
+            ],
+        }
+
+
+class MetricsExporter:
+    def __init__(
+        self,
+        metrics: InMemoryMetrics,
+        path: _Union[str, "_PathLike[str]"],
+        interval: float = 60.0,
+    ) -> None:
+        if interval <= 0:
+            raise ValueError("'interval' must be positive")
+        self._metrics: _Final = metrics
+        self._path: _Final = _Path(path)
+        self._interval: _Final = interval
+        self._stop: _Final = _Event()
+        self._thread: _Optional[_Thread] = None
+
+    def export(self) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self._path.with_name(self._path.name + ".tmp")
+        temporary.write_text(_json.dumps(self._metrics.export()), encoding="utf-8")
+        _replace(temporary, self._path)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            try:
+                self.export()
+            except Exception:  # pylint: disable=broad-exception-caught
+                _logger.exception("Exporting metrics to %s failed", self._path)
+
+    def start(self) -> "MetricsExporter":
+        if self._thread is None:
+            self._thread = _Thread(
+                target=self._run, name="liquid-metrics-exporter", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.export()
+
+    def __enter__(self) -> "MetricsExporter":
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: _Optional[_Type[BaseException]],
+        exc: _Optional[BaseException],
+        tb: _Optional[_TracebackType],
+    ) -> None:
+        self.close()
@@ -0,0 +1,14 @@
+from types import (
+    ModuleType as _ModuleType,
+)
+
+try:
+    import numpy as _numpy
+except ImportError:  # pragma: no cover - depends on the environment
+    _numpy = None  # type: ignore[assignment]
+
+
+def require_numpy(feature: str) -> _ModuleType:
+    if _numpy is None:
+        raise ImportError(f"{feature} need numpy, install relay with the 'columnar' extra")
+    return _numpy
@@ -0,0 +1,85 @@
+import logging as _logging
+from threading import (
+    Lock as _Lock,
+)
+from typing import (
+    Callable as _Callable,
+    Dict as _Dict,
+    Final as _Final,
+    Iterable as _Iterable,
+    List as _List,
+    Optional as _Optional,
+)
+from ._client import (
+    Liquid as _Liquid,
+)
+from .types import (
+    Position as _Position,
+    PositionDelta as _PositionDelta,
+)
+
+_logger = _logging.getLogger(__name__)
+
+PositionCallback = _Callable[[_PositionDelta], None]
+
+
+class PositionTracker:
+    def __init__(self, client: _Optional[_Liquid] = None) -> None:
+        self._client: _Final = client
+        self._lock: _Final = _Lock()
+        self._positions: _Dict[str, _Position] = {}
+        self._callbacks: _List[PositionCallback] = []
+
+    def snapshot(self) -> _Dict[str, _Position]:
+        return dict(self._positions)
+
+    def get(self, position_code: str) -> _Optional[_Position]:
+        return self._positions.get(position_code)
+
+    def add_callback(self, callback: PositionCallback) -> None:
+        with self._lock:
+            self._callbacks = [*self._callbacks, callback]
+
+    def remove_callback(self, callback: PositionCallback) -> None:
+        with self._lock:
+            self._callbacks = [cb for cb in self._callbacks if cb is not callback]
+
+    def update(self, positions: _Iterable[_Position]) -> _PositionDelta:
+        delta = _PositionDelta([], [], [])
+        with self._lock:
+            previous = self._positions
+            current: _Dict[str, _Position] = {}
+            for position in positions:
+                code = position.position_code
+                known = previous.get(code)
+                if known is None:
+                    delta.added.append(position)
+                elif known.version != position.version:
+                    delta.changed.append(position)
+                else:
+                    position = known
+                current[code] = position
+            if len(current) - len(delta.added) != len(previous):
+                delta.closed.extend(
+                    position for code, position in previous.items() if code not in current
+                )
+            self._positions = current
+            callbacks = self._callbacks
+        if delta.added or delta.changed or delta.closed:
+            _logger.debug(
+                "Positions: %d added, %d changed, %d closed",
+                len(delta.added),
+                len(delta.changed),
+                len(delta.closed),
+            )
+            for callback in callbacks:
+                try:
+                    callback(delta)
+                except Exception:  # pylint: disable=broad-exception-caught
+                    _logger.exception("Position callback failed")
+        return delta
+
+    def poll(self) -> _PositionDelta:
+        if self._client is None:
+            raise ValueError("tracker has no client to poll")
+        return self.update(self._client.get_open_positions())
@@ -0,0 +1,425 @@
+import logging as _logging
+from typing import (
+    cast as _cast,
+    Optional as _Optional,
+    Any as _Any,
+    Dict as _Dict,
+    List as _List,
+    Mapping as _Mapping,
+    Tuple as _Tuple,
+    TypeVar as _TypeVar,
+)
+from random import (
+    choices as _choices,
+)
+from string import (
+    digits as _digits,
+    ascii_letters as _ascii_letters,
+)
+from datetime import (
+    datetime as _datetime,
+    timezone as _timezone,
+)
+from email.utils import (
+    parsedate_to_datetime as _parsedate_to_datetime,
+)
+from tickshock.ground.types import (
+    Candle as _Candle,
+    CandleIntervalLiteral as _CandleIntervalLiteral,
+)
+from ._rate_limit import (
+    EndpointLiteral as _EndpointLiteral,
+)
+from .exceptions import (
+    LiquidApiException as _LiquidApiException,
+    LiquidApiAuthException as _LiquidApiAuthException,
+)
+from ._response import (
+    LiquidResponse as _LiquidResponse,
+)
+from ._tracing import (
+    phase as _phase,
+)
+from ._validation import (
+    STRICT as _STRICT,
+    Validation as _Validation,
+)
+from .types._quote import (
+    Quote as _Quote,
+    QuoteBatchResult as _QuoteBatchResult,
+)
+from .types import (
+    InstrumentsDtoCollection as _InstrumentsDtoCollection,
+    Instrument as _Instrument,
+    SymbolLiteral as _SymbolLiteral,
+    Position as _Position,
+    TradeSideLiteral as _TradeSideLiteral,
+    PositionEffectLiteral as _PositionEffectLiteral,
+    OrderTypeLiteral as _OrderTypeLiteral,
+    HistoricalOrderDto as _HistoricalOrderDto,
+)
+
+_logger = _logging.getLogger(__name__)
+
+_T = _TypeVar("_T")
+
+MAX_AUTH_RETRIES = 2
+MAX_THROTTLE_RETRIES = 3
+STREAM_CHUNK_SIZE = 64 * 1024
+AUTH_REQUIRED_DESCRIPTION = "Authorization required"
+LOGIN_PATH = "/login"
+PING_PATH = "/ping"
+INSTRUMENTS_PATH = "instruments/query"
+MARKET_DATA_PATH = "marketdata"
+
+
+def build_url(api_base_url: str, api_url_path: str) -> str:
+    return f"{api_base_url}/dxsca-web{'/' if api_url_path[0] != '/' else ''}{api_url_path}"
+
+
+def build_headers(session_token: _Optional[str]) -> _Dict[str, str]:
+    return {
+        "Content-Type": "application/json",
+        **({"Authorization": f"DXAPI {session_token}"} if session_token else {}),
+    }
+
+
+def endpoint_for(api_url_path: str) -> _EndpointLiteral:
+    path = api_url_path.rstrip("/")
+    if path == LOGIN_PATH:
+        return "login"
+    if path.lstrip("/") == MARKET_DATA_PATH:
+        return "marketdata"
+    if path.endswith("/orders/history"):
+        return "history"
+    if path.endswith("/orders"):
+        return "orders"
+    return "other"
+
+
+def is_throttled(
+    endpoint: _EndpointLiteral, status_code: int, headers: _Mapping[str, str]
+) -> bool:
+    if status_code == 429:
+        return True
+    # A 503 can come back after the order went through, only a 429 is safe to resend.
+    return endpoint != "orders" and status_code == 503 and "Retry-After" in headers
+
+
+def retry_after(headers: _Mapping[str, str]) -> _Optional[float]:
+    value = headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = _parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        _logger.warning("Ignoring unparsable Retry-After header: %s", value)
+        return None
+    return max(0.0, (when - _datetime.now(_timezone.utc)).total_seconds())
+
+
+def response_size(response: _LiquidResponse) -> int:
+    # Streamed bodies haven't been read yet, the announced length is the best there is.
+    if response.streaming:
+        length = response.headers.get("Content-Length")
+        return int(length) if length and length.isdigit() else 0
+    return len(response.content)
+
+
+def is_auth_required(result: _Any) -> bool:
+    return isinstance(result, dict) and result.get("description") == AUTH_REQUIRED_DESCRIPTION
+
+
+def login_payload(username: str, password: str) -> _Dict[str, _Any]:
+    return {
+        "username": username,
+        "password": password,
+        "domain": "default",
+    }
+
+
+def parse_session_token(result: _Any) -> str:
+    tkey = "sessionToken"
+    if not isinstance(result, dict) or not isinstance(result.get(tkey), str):
+        _logger.error("Failed to receive session token. Result: %s", result)
+        raise _LiquidApiAuthException("session token not received", result)
+    _logger.info("Successfully acquired session token")
+    return _cast(str, result.get(tkey))
+
+
+def parse_instruments(result: _Any) -> _List[_Instrument]:
+    if not isinstance(result, dict) or "instruments" not in result:
+        _logger.error("Invalid instruments response: %s", result)
+        raise _LiquidApiException("instruments not received", result)
+    with _phase("validate"):
+        dtos = _InstrumentsDtoCollection(**result)
+    _logger.debug("Successfully parsed %d instruments", len(dtos.instruments))
+    with _phase("convert"):
+        return [dto.to_bo() for dto in dtos.instruments]
+
+
+def instrument_records(result: _Any) -> _List[_Dict[str, _Any]]:
+    if not isinstance(result, dict) or not isinstance(result.get("instruments"), list):
+        _logger.error("Invalid instruments response: %s", result)
+        raise _LiquidApiException("instruments not received", result)
+    return _cast(_List[_Dict[str, _Any]], result["instruments"])
+
+
+def quotes_payload(symbols: _List[_SymbolLiteral]) -> _Dict[str, _Any]:
+    return {
+        "symbols": symbols,
+        "eventTypes": [{"type": "Quote"}],
+    }
+
+
+def parse_quotes(
+    symbols: _List[_SymbolLiteral],
+    response: _Any,
+    validation: _Validation = _STRICT,
+) -> _List[_Quote]:
+    if not isinstance(response, dict) or "events" not in response:
+        _logger.error(
+            "Failed to receive quotes for %s: %s", ",".join(symbols), response
+        )
+        raise _LiquidApiException(
+            f"'{','.join(symbols)}' quotes not received", response
+        )
+    if not isinstance(response["events"], list) or len(response["events"]) != len(
+        symbols
+    ):
+        _logger.error(
+            "Failed to receive all quotes for %s: %s", ",".join(symbols), response
+        )
+        raise _LiquidApiException(
+            f"All of '{','.join(symbols)}' quotes not received", response
+        )
+    return validation.quotes(response["events"])
+
+
+def parse_quotes_partial(
+    symbols: _List[_SymbolLiteral],
+    response: _Any,
+    validation: _Validation = _STRICT,
+) -> _QuoteBatchResult:
+    if not isinstance(response, dict) or not isinstance(response.get("events"), list):
+        _logger.error(
+            "Failed to receive quotes for %s: %s", ",".join(symbols), response
+        )
+        error = _LiquidApiException(f"'{','.join(symbols)}' quotes not received", response)
+        return _QuoteBatchResult({}, {symbol: error for symbol in symbols})
+    requested = set(symbols)
+    quotes: _Dict[_SymbolLiteral, _Quote] = {}
+    errors: _Dict[_SymbolLiteral, Exception] = {}
+    for event in response["events"]:
+        symbol = event.get("symbol") if isinstance(event, dict) else None
+        if symbol not in requested:
+            _logger.warning("Ignoring quote event for unrequested symbol: %s", event)
+            continue
+        try:
+            quotes[symbol] = validation.quote(event)
+        except (ValueError, TypeError, KeyError) as e:
+            _logger.error("Invalid quote for %s: %s", symbol, event)
+            errors[symbol] = _LiquidApiException(f"'{symbol}' quote invalid", event, e)
+    for symbol in symbols:
+        if symbol not in quotes and symbol not in errors:
+            errors[symbol] = _LiquidApiException(f"'{symbol}' quote not received", response)
+    return _QuoteBatchResult(quotes, errors)
+
+
+def check_time_range(from_time: _datetime, to_time: _datetime) -> None:
+    if from_time >= to_time:
+        _logger.error(
+            "Invalid time range: from_time (%s) >= to_time (%s)", from_time, to_time
+        )
+        raise ValueError("'from_time' must be a date-time before 'to_time'")
+
+
+def format_time(value: _datetime) -> str:
+    return value.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-7] + "Z"
+
+
+def candles_payload(
+    symbols: _List[_SymbolLiteral],
+    duration: _CandleIntervalLiteral,
+    from_time: _datetime,
+    to_time: _datetime,
+) -> _Dict[str, _Any]:
+    return {
+        "symbols": symbols,
+        "eventTypes": [
+            {
+                "type": "Candle",
+                "candleType": duration,
+                "fromTime": format_time(from_time),
+                "toTime": format_time(to_time),
+            },
+        ],
+    }
+
+
+def candle_events(
+    symbol: _SymbolLiteral,
+    from_time: _datetime,
+    response: _Any,
+) -> _List[_Dict[str, _Any]]:
+    if not isinstance(response, dict) or not isinstance(response.get("events"), list):
+        _logger.error("Failed to receive market data for %s: %s", symbol, response)
+        raise _LiquidApiException(
+            f"'{symbol}' at '{from_time}' market data not received", response
+        )
+    return _cast(_List[_Dict[str, _Any]], response["events"])
+
+
+def parse_candles(
+    symbol: _SymbolLiteral,
+    from_time: _datetime,
+    response: _Any,
+    validation: _Validation = _STRICT,
+) -> _List[_Candle[_SymbolLiteral]]:
+    candles = validation.candles(candle_events(symbol, from_time, response))
+    _logger.debug("Retrieved %d candles for %s", len(candles), symbol)
+    return candles
+
+
+def parse_candles_by_symbol(
+    symbols: _List[_SymbolLiteral],
+    from_time: _datetime,
+    response: _Any,
+    validation: _Validation = _STRICT,
+) -> _Dict[_SymbolLiteral, _List[_Candle[_SymbolLiteral]]]:
+    events = candle_events(_cast(_SymbolLiteral, ",".join(symbols)), from_time, response)
+    candles: _Dict[_SymbolLiteral, _List[_Candle[_SymbolLiteral]]] = {
+        symbol: [] for symbol in symbols
+    }
+    for candle in validation.candles(events):
+        if candle.symbol not in candles:
+            _logger.warning("Ignoring candle for unrequested symbol %s", candle.symbol)
+            continue
+        candles[candle.symbol].append(candle)
+    _logger.debug("Retrieved %d candles for %d symbols", len(events), len(symbols))
+    return candles
+
+
+def batched(items: _List[_T], size: int) -> _List[_List[_T]]:
+    if size < 1:
+        raise ValueError("batch size must be at least 1")
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def positions_path(account_code: str) -> str:
+    return f"accounts/{account_code}/positions"
+
+
+def parse_positions(
+    response: _Any,
+    validation: _Validation = _STRICT,
+) -> _List[_Position]:
+    if not isinstance(response, dict) or not isinstance(response.get("positions"), list):
+        _logger.error("Failed to receive positions: %s", response)
+        raise _LiquidApiException("positions not received", response)
+    positions = validation.positions(response["positions"])
+    _logger.debug("Successfully parsed %d open positions", len(positions))
+    return positions
+
+
+def orders_path(account_code: str) -> str:
+    return f"accounts/{account_code}/orders"
+
+
+def new_order_code() -> str:
+    return "".join(_choices(_ascii_letters + _digits, k=7))
+
+
+def order_payload(
+    order_code: str,
+    symbol: _SymbolLiteral,
+    order_type: _OrderTypeLiteral,
+    side: _TradeSideLiteral,
+    effect: _PositionEffectLiteral,
+    quantity: float,
+    position_code: _Optional[str] = None,
+    limit_price: _Optional[float] = None,
+    stop_price: _Optional[float] = None,
+) -> _Dict[str, _Any]:
+    _logger.info(
+        "Placing %s %s order for %s (qty: %f, effect: %s, code: %s)",
+        side,
+        order_type,
+        symbol,
+        quantity,
+        effect,
+        order_code,
+    )
+    return {
+        "orderCode": order_code,
+        "type": order_type,
+        "instrument": symbol,
+        "quantity": quantity,
+        "side": side,
+        "positionEffect": effect,
+        "tif": "GTC",
+        **({"positionCode": position_code} if position_code is not None else {}),
+        **({"limitPrice": limit_price} if limit_price is not None else {}),
+        **({"stopPrice": stop_price} if stop_price is not None else {}),
+    }
+
+
+def parse_order_result(
+    order_code: str,
+    symbol: _SymbolLiteral,
+    order_type: _OrderTypeLiteral,
+    side: _TradeSideLiteral,
+    effect: _PositionEffectLiteral,
+    quantity: float,
+    response: _Any,
+) -> _Tuple[str, str]:
+    if not isinstance(response, dict) or not "orderId" in response:
+        _logger.error("Order placement failed for %s: %s", order_code, response)
+        raise _LiquidApiException(
+            f"'{symbol}' '{order_type}' '{side}' order to '{effect}' "
+            f"amount '{quantity}' not successful",
+            response,
+        )
+    _logger.info(
+        "Order successfully placed. orderId: %s, updateOrderId: %s",
+        response.get("orderId"),
+        response.get("updateOrderId"),
+    )
+    return (
+        _cast(str, response["orderId"]),
+        _cast(str, response["updateOrderId"]),
+    )
+
+
+def order_history_path(account_code: str) -> str:
+    return f"accounts/{account_code}/orders/history"
+
+
+def order_history_params(
+    symbol: _Optional[_SymbolLiteral],
+    order_id: _Optional[str],
+) -> _Dict[str, _Any]:
+    return {
+        **({"for-instrument": symbol} if symbol is not None else {}),
+        **({"with-order-id": order_id} if order_id is not None else {}),
+    }
+
+
+def parse_order_history(
+    symbol: _Optional[_SymbolLiteral],
+    order_id: _Optional[str],
+    response: _Any,
+    validation: _Validation = _STRICT,
+) -> _List[_HistoricalOrderDto]:
+    if not isinstance(response, dict) or "orders" not in response:
+        _logger.error("Failed to receive order history: %s", response)
+        raise _LiquidApiException(
+            f"'{symbol or order_id}' order history not received", response
+        )
+    dtos = validation.orders(response["orders"])
+    _logger.debug("Successfully parsed %d historical orders", len(dtos))
+    return dtos
@@ -0,0 +1,116 @@
+import logging as _logging
+from concurrent.futures import (
+    Future as _Future,
+)
+from threading import (
+    Lock as _Lock,
+)
+from time import (
+    monotonic as _monotonic,
+)
+from typing import (
+    Callable as _Callable,
+    Dict as _Dict,
+    Final as _Final,
+    List as _List,
+    NamedTuple as _NamedTuple,
+    Optional as _Optional,
+    Tuple as _Tuple,
+)
+from ._client import (
+    Liquid as _Liquid,
+)
+from .exceptions import (
+    LiquidApiException as _LiquidApiException,
+)
+from .types import (
+    Quote as _Quote,
+    SymbolLiteral as _SymbolLiteral,
+)
+
+_logger = _logging.getLogger(__name__)
+
+
+class QuoteCacheStats(_NamedTuple):
+    hits: int
+    misses: int
+    coalesced: int
+
+
+class QuoteCache:
+    def __init__(
+        self,
+        client: _Liquid,
+        ttl: float = 0.25,
+        symbol_ttls: _Optional[_Dict[_SymbolLiteral, float]] = None,
+        clock: _Callable[[], float] = _monotonic,
+    ) -> None:
+        if ttl < 0 or any(value < 0 for value in (symbol_ttls or {}).values()):
+            raise ValueError("quote TTLs can not be negative")
+        self._client: _Final = client
+        self._ttl: _Final = ttl
+        self._symbol_ttls: _Final = dict(symbol_ttls or {})
+        self._clock: _Final = clock
+        self._lock: _Final = _Lock()
+        self._entries: _Dict[_SymbolLiteral, _Tuple[float, _Quote]] = {}
+        self._in_flight: _Dict[_SymbolLiteral, "_Future[_Quote]"] = {}
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+
+    def stats(self) -> QuoteCacheStats:
+        with self._lock:
+            return QuoteCacheStats(self._hits, self._misses, self._coalesced)
+
+    def invalidate(self, symbols: _Optional[_List[_SymbolLiteral]] = None) -> None:
+        with self._lock:
+            if symbols is None:
+                self._entries.clear()
+            for symbol in symbols or ():
+                self._entries.pop(symbol, None)
+
+    def get_quotes(self, symbols: _List[_SymbolLiteral]) -> _List[_Quote]:
+        quotes: _Dict[_SymbolLiteral, _Quote] = {}
+        waiting: _Dict[_SymbolLiteral, "_Future[_Quote]"] = {}
+        owned: _Dict[_SymbolLiteral, "_Future[_Quote]"] = {}
+        with self._lock:
+            now = self._clock()
+            for symbol in dict.fromkeys(symbols):
+                entry = self._entries.get(symbol)
+                if entry is not None and now - entry[0] < self._symbol_ttls.get(symbol, self._ttl):
+                    self._hits += 1
+                    quotes[symbol] = entry[1]
+                elif symbol in self._in_flight:
+                    self._coalesced += 1
+                    waiting[symbol] = self._in_flight[symbol]
+                else:
+                    self._misses += 1
+                    owned[symbol] = self._in_flight[symbol] = _Future()
+        if owned:
+            self._fetch(owned)
+        for symbol, future in {**owned, **waiting}.items():
+            quotes[symbol] = future.result()
+        return [quotes[symbol] for symbol in symbols]
+
+    def _fetch(self, owned: _Dict[_SymbolLiteral, "_Future[_Quote]"]) -> None:
+        _logger.debug("Fetching %d uncached quotes", len(owned))
+        try:
+            fetched = {quote.symbol: quote for quote in self._client.get_quotes(list(owned))}
+        except Exception as e:
+            with self._lock:
+                for symbol, future in owned.items():
+                    del self._in_flight[symbol]
+                    future.set_exception(e)
+            raise
+        fetched_at = self._clock()
+        with self._lock:
+            for symbol, future in owned.items():
+                del self._in_flight[symbol]
+                quote = fetched.get(symbol)
+                if quote is None:
+                    future.set_exception(
+                        _LiquidApiException(f"'{symbol}' quote not received")
+                    )
+                    continue
+                self._entries[symbol] = (fetched_at, quote)
+                future.set_result(quote)
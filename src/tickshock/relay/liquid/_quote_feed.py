@@ -0,0 +1,194 @@
+import logging as _logging
+from sched import (
+    scheduler as _scheduler,
+)
+from threading import (
+    Event as _Event,
+    Lock as _Lock,
+    Thread as _Thread,
+)
+from time import (
+    monotonic as _monotonic,
+)
+from types import (
+    TracebackType as _TracebackType,
+)
+from typing import (
+    Callable as _Callable,
+    Dict as _Dict,
+    Final as _Final,
+    Iterable as _Iterable,
+    List as _List,
+    Optional as _Optional,
+    Protocol as _Protocol,
+    Type as _Type,
+)
+from ._client import (
+    Liquid as _Liquid,
+)
+from .types import (
+    Quote as _Quote,
+    SymbolLiteral as _SymbolLiteral,
+)
+
+_logger = _logging.getLogger(__name__)
+
+QuoteCallback = _Callable[[_Quote], None]
+
+
+class QuoteChannel(_Protocol):
+    def subscribe(self, symbols: _List[_SymbolLiteral], on_quote: QuoteCallback) -> None: ...
+
+    def unsubscribe(self, symbols: _List[_SymbolLiteral]) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class QuoteFeed:
+    def __init__(
+        self,
+        client: _Liquid,
+        symbols: _Iterable[_SymbolLiteral],
+        channel: _Optional[QuoteChannel] = None,
+        min_interval: float = 0.1,
+        max_interval: float = 2.0,
+        backoff: float = 1.5,
+    ) -> None:
+        if not 0 < min_interval <= max_interval or backoff < 1:
+            raise ValueError("need 0 < 'min_interval' <= 'max_interval' and 'backoff' >= 1")
+        self._client: _Final = client
+        self._channel: _Final = channel
+        self._min_interval: _Final = min_interval
+        self._max_interval: _Final = max_interval
+        self._backoff: _Final = backoff
+        self._symbols: _Dict[_SymbolLiteral, None] = dict.fromkeys(symbols)
+        self._quotes: _Dict[_SymbolLiteral, _Quote] = {}
+        self._callbacks: _List[QuoteCallback] = []
+        self._lock: _Final = _Lock()
+        self._stop: _Final = _Event()
+        self._scheduler: _Final = _scheduler(_monotonic, self._stop.wait)
+        self._thread: _Optional[_Thread] = None
+        self._started = False
+        self.interval = min_interval
+
+    def latest(self, symbol: _SymbolLiteral) -> _Optional[_Quote]:
+        return self._quotes.get(symbol)
+
+    def snapshot(self) -> _Dict[_SymbolLiteral, _Quote]:
+        return dict(self._quotes)
+
+    def add_callback(self, callback: QuoteCallback) -> None:
+        with self._lock:
+            self._callbacks = [*self._callbacks, callback]
+
+    def remove_callback(self, callback: QuoteCallback) -> None:
+        with self._lock:
+            self._callbacks = [cb for cb in self._callbacks if cb is not callback]
+
+    def subscribe(self, symbols: _Iterable[_SymbolLiteral]) -> None:
+        added = [symbol for symbol in symbols if symbol not in self._symbols]
+        with self._lock:
+            self._symbols.update(dict.fromkeys(added))
+        if added and self._channel is not None and self._started:
+            self._channel.subscribe(added, self._on_quote)
+        self.interval = self._min_interval
+
+    def unsubscribe(self, symbols: _Iterable[_SymbolLiteral]) -> None:
+        removed = [symbol for symbol in symbols if symbol in self._symbols]
+        with self._lock:
+            for symbol in removed:
+                del self._symbols[symbol]
+                self._quotes.pop(symbol, None)
+        if removed and self._channel is not None:
+            self._channel.unsubscribe(removed)
+
+    def _on_quote(self, quote: _Quote) -> None:
+        self._update(quote)
+
+    def _update(self, quote: _Quote) -> bool:
+        with self._lock:
+            # A poll finishing after unsubscribe() must not bring a dropped symbol back.
+            if quote.symbol not in self._symbols:
+                return False
+            previous = self._quotes.get(quote.symbol)
+            if previous is not None and (
+                quote.time < previous.time
+                or (
+                    quote.time == previous.time
+                    and quote.bid == previous.bid
+                    and quote.ask == previous.ask
+                )
+            ):
+                return False
+            self._quotes[quote.symbol] = quote
+        for callback in self._callbacks:
+            try:
+                callback(quote)
+            except Exception:  # pylint: disable=broad-exception-caught
+                _logger.exception("Quote callback failed for %s", quote.symbol)
+        return True
+
+    def poll(self) -> bool:
+        symbols = list(self._symbols)
+        if not symbols:
+            return False
+        result = self._client.get_quotes_bulk(symbols)
+        if result.errors:
+            _logger.debug("Quote poll missed %d symbols", len(result.errors))
+        changed = False
+        for quote in result.quotes.values():
+            changed = self._update(quote) or changed
+        return changed
+
+    def _poll_and_reschedule(self) -> None:
+        if self._stop.is_set():
+            return
+        try:
+            changed = self.poll()
+        except Exception:  # pylint: disable=broad-exception-caught
+            _logger.exception("Quote poll failed")
+            changed = False
+        if changed:
+            self.interval = self._min_interval
+        else:
+            self.interval = min(self.interval * self._backoff, self._max_interval)
+        if not self._stop.is_set():
+            self._scheduler.enter(self.interval, 0, self._poll_and_reschedule)
+
+    def start(self) -> "QuoteFeed":
+        if self._started:
+            return self
+        self._started = True
+        if self._channel is not None:
+            _logger.info("Subscribing to push quotes for %d symbols", len(self._symbols))
+            self._channel.subscribe(list(self._symbols), self._on_quote)
+            return self
+        _logger.info("Polling quotes for %d symbols", len(self._symbols))
+        self._scheduler.enter(0, 0, self._poll_and_reschedule)
+        self._thread = _Thread(target=self._scheduler.run, name="liquid-quote-feed", daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        self._stop.set()
+        for event in self._scheduler.queue:
+            try:
+                self._scheduler.cancel(event)
+            except ValueError:
+                pass
+        if self._channel is not None:
+            self._channel.close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def __enter__(self) -> "QuoteFeed":
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: _Optional[_Type[BaseException]],
+        exc: _Optional[BaseException],
+        tb: _Optional[_TracebackType],
+    ) -> None:
+        self.close()
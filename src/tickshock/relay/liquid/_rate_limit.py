@@ -0,0 +1,140 @@
+import logging as _logging
+from asyncio import (
+    sleep as _async_sleep,
+)
+from threading import (
+    Lock as _Lock,
+)
+from time import (
+    monotonic as _monotonic,
+    sleep as _sleep,
+)
+from typing import (
+    Callable as _Callable,
+    Dict as _Dict,
+    Final as _Final,
+    Literal as _Literal,
+    Mapping as _Mapping,
+    NamedTuple as _NamedTuple,
+    Optional as _Optional,
+)
+
+_logger = _logging.getLogger(__name__)
+
+EndpointLiteral = _Literal["login", "marketdata", "orders", "history", "other"]
+
+
+class RateBudget(_NamedTuple):
+    rate: float
+    burst: float
+
+
+DEFAULT_BUDGETS: _Final[_Dict[EndpointLiteral, RateBudget]] = {
+    "login": RateBudget(2.0, 5.0),
+    "marketdata": RateBudget(20.0, 40.0),
+    "orders": RateBudget(10.0, 20.0),
+    "history": RateBudget(2.0, 5.0),
+    "other": RateBudget(10.0, 20.0),
+}
+DEFAULT_TOTAL_BUDGET: _Final = RateBudget(30.0, 60.0)
+
+
+class _Bucket:
+    __slots__ = ("budget", "rate", "tokens", "updated", "blocked_until")
+
+    def __init__(self, budget: RateBudget, now: float) -> None:
+        if budget.rate <= 0 or budget.burst < 1:
+            raise ValueError("rate budgets need a positive rate and a burst of at least 1")
+        self.budget: _Final = budget
+        self.rate = budget.rate
+        self.tokens = budget.burst
+        self.updated = now
+        self.blocked_until = now
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(self.budget.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait(self, now: float, needed: float = 1.0) -> float:
+        shortfall = (needed - self.tokens) / self.rate if self.tokens < needed else 0.0
+        return max(self.blocked_until - now, shortfall)
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        budgets: _Optional[_Mapping[EndpointLiteral, RateBudget]] = None,
+        total: RateBudget = DEFAULT_TOTAL_BUDGET,
+        orders_reserve: float = 10.0,
+        min_rate_ratio: float = 0.1,
+        clock: _Callable[[], float] = _monotonic,
+    ) -> None:
+        if not 0 <= orders_reserve <= total.burst - 1:
+            raise ValueError("'orders_reserve' must leave room for at least one other request")
+        if not 0 < min_rate_ratio <= 1:
+            raise ValueError("'min_rate_ratio' must be in (0, 1]")
+        now = clock()
+        self._clock: _Final = clock
+        self._lock: _Final = _Lock()
+        self._orders_reserve: _Final = orders_reserve
+        self._min_rate_ratio: _Final = min_rate_ratio
+        self._total: _Final = _Bucket(total, now)
+        self._buckets: _Final[_Dict[str, _Bucket]] = {
+            endpoint: _Bucket(budget, now)
+            for endpoint, budget in {**DEFAULT_BUDGETS, **(budgets or {})}.items()
+        }
+
+    def _bucket(self, endpoint: EndpointLiteral) -> _Bucket:
+        return self._buckets.get(endpoint) or self._buckets["other"]
+
+    def rate(self, endpoint: EndpointLiteral) -> float:
+        return self._bucket(endpoint).rate
+
+    def reserve(self, endpoint: EndpointLiteral) -> float:
+        with self._lock:
+            now = self._clock()
+            bucket = self._bucket(endpoint)
+            bucket.refill(now)
+            self._total.refill(now)
+            # Everything but orders has to leave the reserve in the shared bucket untouched.
+            needed = 1.0 if endpoint == "orders" else 1.0 + self._orders_reserve
+            delay = max(bucket.wait(now), self._total.wait(now, needed))
+            if delay > 0:
+                return delay
+            bucket.tokens -= 1
+            self._total.tokens -= 1
+            return 0.0
+
+    def acquire(self, endpoint: EndpointLiteral) -> None:
+        while (delay := self.reserve(endpoint)) > 0:
+            _logger.debug("Rate limiting %s request for %.3fs", endpoint, delay)
+            _sleep(delay)
+
+    async def acquire_async(self, endpoint: EndpointLiteral) -> None:
+        while (delay := self.reserve(endpoint)) > 0:
+            _logger.debug("Rate limiting %s request for %.3fs", endpoint, delay)
+            await _async_sleep(delay)
+
+    def throttled(self, endpoint: EndpointLiteral, retry_after: _Optional[float] = None) -> None:
+        with self._lock:
+            now = self._clock()
+            bucket = self._bucket(endpoint)
+            bucket.refill(now)
+            bucket.rate = max(bucket.budget.rate * self._min_rate_ratio, bucket.rate / 2)
+            bucket.tokens = 0.0
+            pause = retry_after if retry_after is not None else 1.0 / bucket.rate
+            bucket.blocked_until = max(bucket.blocked_until, now + pause)
+        _logger.warning(
+            "Throttled on %s, slowing to %.2f requests/s for at least %.2fs",
+            endpoint,
+            bucket.rate,
+            pause,
+        )
+
+    def succeeded(self, endpoint: EndpointLiteral) -> None:
+        bucket = self._bucket(endpoint)
+        if bucket.rate >= bucket.budget.rate:
+            return
+        with self._lock:
+            bucket.refill(self._clock())
+            bucket.rate = min(bucket.budget.rate, bucket.rate + bucket.budget.rate * 0.1)
@@ -0,0 +1,154 @@
+import logging as _logging
+from random import (
+    random as _random,
+)
+from threading import (
+    Lock as _Lock,
+)
+from time import (
+    monotonic as _monotonic,
+)
+from typing import (
+    Callable as _Callable,
+    Dict as _Dict,
+    Final as _Final,
+    FrozenSet as _FrozenSet,
+    Iterable as _Iterable,
+    Literal as _Literal,
+    Mapping as _Mapping,
+    Optional as _Optional,
+)
+from ._rate_limit import (
+    EndpointLiteral as _EndpointLiteral,
+)
+from .exceptions import (
+    LiquidApiUnavailableException as _LiquidApiUnavailableException,
+)
+
+_logger = _logging.getLogger(__name__)
+
+CircuitStateLiteral = _Literal["closed", "open", "half-open"]
+
+DEFAULT_TIMEOUTS: _Final[_Dict[_EndpointLiteral, float]] = {
+    "login": 10.0,
+    "marketdata": 10.0,
+    "orders": 10.0,
+    "history": 30.0,
+    "other": 10.0,
+}
+# Order placement is left out on purpose: a timed out order may still have been placed.
+DEFAULT_RETRY_ENDPOINTS: _Final[_FrozenSet[_EndpointLiteral]] = frozenset(
+    ("marketdata", "history", "other")
+)
+SERVER_ERRORS: _Final = frozenset((500, 502, 503, 504))
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.2,
+        max_delay: float = 5.0,
+        timeouts: _Optional[_Mapping[_EndpointLiteral, float]] = None,
+        retry_endpoints: _Iterable[_EndpointLiteral] = DEFAULT_RETRY_ENDPOINTS,
+        rng: _Callable[[], float] = _random,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("'max_attempts' must be at least 1")
+        if base_delay < 0 or max_delay < base_delay:
+            raise ValueError("delays need 0 <= 'base_delay' <= 'max_delay'")
+        self.max_attempts: _Final = max_attempts
+        self.base_delay: _Final = base_delay
+        self.max_delay: _Final = max_delay
+        self._timeouts: _Final = {**DEFAULT_TIMEOUTS, **(timeouts or {})}
+        self._retry_endpoints: _Final = frozenset(retry_endpoints)
+        if "orders" in self._retry_endpoints:
+            raise ValueError("order placement is not idempotent and can't be retried")
+        self._rng: _Final = rng
+
+    def timeout(self, endpoint: _EndpointLiteral) -> float:
+        return self._timeouts.get(endpoint, self._timeouts["other"])
+
+    def retries(self, endpoint: _EndpointLiteral) -> bool:
+        return endpoint in self._retry_endpoints
+
+    def backoff(self, endpoint: _EndpointLiteral, failures: int) -> _Optional[float]:
+        if failures >= self.max_attempts or not self.retries(endpoint):
+            return None
+        # Full jitter keeps clients that failed together from retrying together.
+        return self._rng() * min(self.max_delay, self.base_delay * 2 ** (failures - 1))
+
+
+class _Circuit:
+    __slots__ = ("failures", "opened_at")
+
+    def __init__(self) -> None:
+        self.failures = 0
+        self.opened_at: _Optional[float] = None
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: _Callable[[], float] = _monotonic,
+    ) -> None:
+        if failure_threshold < 1 or reset_timeout <= 0:
+            raise ValueError("'failure_threshold' must be at least 1 and 'reset_timeout' positive")
+        self.failure_threshold: _Final = failure_threshold
+        self.reset_timeout: _Final = reset_timeout
+        self._clock: _Final = clock
+        self._lock: _Final = _Lock()
+        self._circuits: _Final[_Dict[str, _Circuit]] = {}
+
+    def state(self, endpoint: _EndpointLiteral) -> CircuitStateLiteral:
+        circuit = self._circuits.get(endpoint)
+        if circuit is None or circuit.opened_at is None:
+            return "closed"
+        if self._clock() - circuit.opened_at < self.reset_timeout:
+            return "open"
+        return "half-open"
+
+    def before_call(self, endpoint: _EndpointLiteral) -> None:
+        circuit = self._circuits.get(endpoint)
+        if circuit is None or circuit.opened_at is None:
+            return
+        with self._lock:
+            now = self._clock()
+            if circuit.opened_at is None:
+                return
+            if now - circuit.opened_at < self.reset_timeout:
+                raise _LiquidApiUnavailableException(
+                    f"circuit for '{endpoint}' is open after {circuit.failures} failures"
+                )
+            # Half-open: this call is the probe, everyone else keeps failing fast until
+            # it reports back or another reset_timeout passes without an answer.
+            circuit.opened_at = now
+        _logger.info("Probing %s after the circuit was open", endpoint)
+
+    def record_success(self, endpoint: _EndpointLiteral) -> None:
+        circuit = self._circuits.get(endpoint)
+        if circuit is None or (circuit.failures == 0 and circuit.opened_at is None):
+            return
+        with self._lock:
+            if circuit.opened_at is not None:
+                _logger.info("Circuit for %s closed again", endpoint)
+            circuit.failures = 0
+            circuit.opened_at = None
+
+    def record_failure(self, endpoint: _EndpointLiteral) -> None:
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None:
+                circuit = self._circuits[endpoint] = _Circuit()
+            circuit.failures += 1
+            if circuit.opened_at is None and circuit.failures < self.failure_threshold:
+                return
+            circuit.opened_at = self._clock()
+        _logger.warning(
+            "Circuit for %s open for %.1fs after %d failures",
+            endpoint,
+            self.reset_timeout,
+            circuit.failures,
+        )
@@ -0,0 +1,80 @@
+import logging as _logging
+from typing import (
+    Any as _Any,
+    Callable as _Callable,
+    Final as _Final,
+    Iterable as _Iterable,
+    Iterator as _Iterator,
+    Mapping as _Mapping,
+    Optional as _Optional,
+)
+from ._tracing import (
+    phase as _phase,
+)
+from ._json import (
+    loads as _loads,
+    iter_array as _iter_array,
+    JsonArrayNotFound as _JsonArrayNotFound,
+)
+
+_logger = _logging.getLogger(__name__)
+
+_UNSET: _Final = object()
+
+
+class LiquidResponse:
+    def __init__(
+        self,
+        status_code: int,
+        ok: bool,
+        content: _Optional[bytes],
+        headers: _Mapping[str, str],
+        chunks: _Optional[_Iterable[bytes]] = None,
+        on_close: _Optional[_Callable[[], None]] = None,
+    ) -> None:
+        self.status_code: _Final[int] = status_code
+        self.ok: _Final[bool] = ok
+        self.headers: _Final[_Mapping[str, str]] = headers
+        self._content = content
+        self._chunks = chunks
+        self._on_close = on_close
+        self._payload: _Any = _UNSET
+
+    @property
+    def streaming(self) -> bool:
+        return self._content is None and self._chunks is not None
+
+    @property
+    def content(self) -> bytes:
+        if self._content is None:
+            self._content = b"".join(self._chunks or ())
+            self._chunks = None
+        return self._content
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> _Any:
+        if self._payload is _UNSET:
+            content = self.content
+            try:
+                with _phase("decode"):
+                    self._payload = _loads(content) if content else None
+            except ValueError:
+                _logger.debug("Response body is not valid JSON: %r", content[:200])
+                self._payload = None
+        return self._payload
+
+    def iter_array(self, key: str) -> _Iterator[_Any]:
+        if self.streaming:
+            chunks, self._chunks = self._chunks, None
+            return _iter_array(chunks or (), key)
+        payload = self.json()
+        if not isinstance(payload, dict) or not isinstance(payload.get(key), list):
+            raise _JsonArrayNotFound(key, payload)
+        return iter(payload[key])
+
+    def close(self) -> None:
+        if self._on_close is not None:
+            self._on_close()
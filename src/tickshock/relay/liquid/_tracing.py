@@ -0,0 +1,228 @@
+import logging as _logging
+from collections import (
+    deque as _deque,
+)
+from contextvars import (
+    ContextVar as _ContextVar,
+    copy_context as _copy_context,
+)
+from functools import (
+    wraps as _wraps,
+)
+from threading import (
+    Lock as _Lock,
+)
+from time import (
+    perf_counter as _perf_counter,
+)
+from types import (
+    TracebackType as _TracebackType,
+)
+from typing import (
+    Any as _Any,
+    Awaitable as _Awaitable,
+    Callable as _Callable,
+    Dict as _Dict,
+    Final as _Final,
+    List as _List,
+    Literal as _Literal,
+    NamedTuple as _NamedTuple,
+    Optional as _Optional,
+    Type as _Type,
+    TypeVar as _TypeVar,
+    Union as _Union,
+)
+
+_logger = _logging.getLogger(__name__)
+
+PhaseLiteral = _Literal["connect", "send", "wait", "download", "decode", "validate", "convert"]
+
+_F = _TypeVar("_F", bound=_Callable[..., _Any])
+_T = _TypeVar("_T")
+_R = _TypeVar("_R")
+
+# httpcore reports its steps as '<name>.started' / '<name>.complete' pairs.
+_HTTPCORE_PHASES: _Final[_Dict[str, PhaseLiteral]] = {
+    "connection.connect_tcp": "connect",
+    "connection.connect_unix_socket": "connect",
+    "connection.start_tls": "connect",
+    "http11.send_request_headers": "send",
+    "http11.send_request_body": "send",
+    "http11.receive_response_headers": "wait",
+    "http11.receive_response_body": "download",
+    "http2.send_request_headers": "send",
+    "http2.send_request_body": "send",
+    "http2.receive_response_headers": "wait",
+    "http2.receive_response_body": "download",
+}
+
+
+class Span(_NamedTuple):
+    phase: PhaseLiteral
+    offset: float
+    seconds: float
+
+
+class Trace:
+    __slots__ = ("call", "started", "seconds", "spans")
+
+    def __init__(self, call: str) -> None:
+        self.call: _Final = call
+        self.started: _Final = _perf_counter()
+        self.seconds = 0.0
+        self.spans: _List[Span] = []
+
+    def record(self, name: PhaseLiteral, start: float, end: float) -> None:
+        self.spans.append(Span(name, start - self.started, end - start))
+
+    def totals(self) -> _Dict[PhaseLiteral, float]:
+        totals: _Dict[PhaseLiteral, float] = {}
+        for span in self.spans:
+            totals[span.phase] = totals.get(span.phase, 0.0) + span.seconds
+        return totals
+
+    def __repr__(self) -> str:
+        return f"Trace({self.call}, {self.seconds * 1000:.2f}ms, {len(self.spans)} spans)"
+
+
+_active: _Final[_ContextVar[_Optional[Trace]]] = _ContextVar("liquid_trace", default=None)
+
+
+class _Phase:
+    __slots__ = ("trace", "phase", "start")
+
+    def __init__(self, trace: Trace, name: PhaseLiteral) -> None:
+        self.trace = trace
+        self.phase = name
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = _perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: _Optional[_Type[BaseException]],
+        exc: _Optional[BaseException],
+        tb: _Optional[_TracebackType],
+    ) -> None:
+        self.trace.record(self.phase, self.start, _perf_counter())
+
+
+class _NoPhase:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(
+        self,
+        exc_type: _Optional[_Type[BaseException]],
+        exc: _Optional[BaseException],
+        tb: _Optional[_TracebackType],
+    ) -> None:
+        pass
+
+
+_NO_PHASE: _Final = _NoPhase()
+
+
+def active() -> _Optional[Trace]:
+    return _active.get()
+
+
+def phase(name: PhaseLiteral) -> _Union[_Phase, _NoPhase]:
+    trace = _active.get()
+    return _NO_PHASE if trace is None else _Phase(trace, name)
+
+
+def in_context(function: _Callable[[_T], _R]) -> _Callable[[_T], _R]:
+    # Executor threads don't inherit context variables, every task runs in its own copy
+    # of the submitting thread's context so its spans land in the active trace.
+    context = _copy_context()
+
+    def run(item: _T) -> _R:
+        return context.copy().run(function, item)
+
+    return run
+
+
+def httpcore_trace(trace: Trace) -> _Callable[[str, _Dict[str, _Any]], _Awaitable[None]]:
+    started: _Dict[str, float] = {}
+
+    async def on_event(event_name: str, _info: _Dict[str, _Any]) -> None:
+        step, _, stage = event_name.rpartition(".")
+        name = _HTTPCORE_PHASES.get(step)
+        if name is None:
+            return
+        if stage == "started":
+            started[step] = _perf_counter()
+        elif step in started:
+            trace.record(name, started.pop(step), _perf_counter())
+
+    return on_event
+
+
+class Tracer:
+    def __init__(
+        self,
+        callback: _Optional[_Callable[[Trace], None]] = None,
+        max_traces: int = 1000,
+    ) -> None:
+        if max_traces < 0:
+            raise ValueError("'max_traces' can't be negative")
+        self._callback: _Final = callback
+        self._lock: _Final = _Lock()
+        self._traces: _Final[_deque[Trace]] = _deque(maxlen=max_traces)
+
+    def traces(self) -> _List[Trace]:
+        with self._lock:
+            return list(self._traces)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._traces.clear()
+
+    def _finish(self, trace: Trace) -> None:
+        trace.seconds = _perf_counter() - trace.started
+        with self._lock:
+            self._traces.append(trace)
+        if self._callback is not None:
+            try:
+                self._callback(trace)
+            except Exception:  # pylint: disable=broad-exception-caught
+                _logger.exception("Trace callback failed for %s", trace.call)
+
+
+def traced(method: _F) -> _F:
+    @_wraps(method)
+    def wrapper(self: _Any, *args: _Any, **kwargs: _Any) -> _Any:
+        tracer: _Optional[Tracer] = self.tracer
+        # Calls made from inside a traced call are part of the outer trace.
+        if tracer is None or _active.get() is not None:
+            return method(self, *args, **kwargs)
+        trace = Trace(method.__name__)
+        token = _active.set(trace)
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            _active.reset(token)
+            tracer._finish(trace)  # pylint: disable=protected-access
+
+    return wrapper  # type: ignore[return-value]
+
+
+def traced_async(method: _F) -> _F:
+    @_wraps(method)
+    async def wrapper(self: _Any, *args: _Any, **kwargs: _Any) -> _Any:
+        tracer: _Optional[Tracer] = self.tracer
+        if tracer is None or _active.get() is not None:
+            return await method(self, *args, **kwargs)
+        trace = Trace(method.__name__)
+        token = _active.set(trace)
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            _active.reset(token)
+            tracer._finish(trace)  # pylint: disable=protected-access
+
+    return wrapper  # type: ignore[return-value]
@@ -0,0 +1,226 @@
+from bisect import (
+    bisect_right as _bisect_right,
+)
+from datetime import (
+    datetime as _datetime,
+    timedelta as _timedelta,
+    timezone as _timezone,
+)
+from threading import (
+    Lock as _Lock,
+)
+from typing import (
+    TYPE_CHECKING as _TYPE_CHECKING,
+    Any as _Any,
+    ClassVar as _ClassVar,
+    Dict as _Dict,
+    Final as _Final,
+    Iterable as _Iterable,
+    List as _List,
+    Optional as _Optional,
+    Tuple as _Tuple,
+)
+from .types import (
+    EventTypeLiteral as _EventTypeLiteral,
+    Instrument as _Instrument,
+    TradingHour as _TradingHour,
+)
+from ._numpy import (
+    require_numpy as _require_numpy,
+)
+
+if _TYPE_CHECKING:
+    from numpy.typing import NDArray as _NDArray
+
+_WEEK: _Final = 7 * 86_400
+# 1970-01-05 was the first Monday after the epoch, weeks are counted from there.
+_FIRST_MONDAY: _Final = 4 * 86_400
+
+_ScheduleKey = _Tuple[_Tuple[int, _EventTypeLiteral], ...]
+_Window = _Tuple[int, int, _List[float], _List[float]]
+
+
+def _week_offset(trading_hour: _TradingHour) -> int:
+    time = trading_hour.time
+    return (
+        trading_hour.week_day_int * 86_400
+        + time.hour * 3_600
+        + time.minute * 60
+        + time.second
+    )
+
+
+def schedule_key(trading_hours: _Optional[_Iterable[_TradingHour]]) -> _ScheduleKey:
+    return tuple(
+        (_week_offset(th), th.event_type) for th in trading_hours or ()
+    )
+
+
+def _weekly_spans(key: _ScheduleKey) -> _List[_Tuple[int, int]]:
+    if len(key) % 2:
+        raise ValueError("trading hours need to come in open/close pairs")
+    spans: _List[_Tuple[int, int]] = []
+    pairs = zip(key[::2], key[1::2])
+    for (open_offset, open_event), (close_offset, close_event) in pairs:
+        if open_event != "SESSION_OPEN" or close_event != "SESSION_CLOSE":
+            raise ValueError(
+                f"sessions need to begin and end (open:{open_event}) "
+                f"(close:{close_event})"
+            )
+        if close_offset <= open_offset:
+            close_offset += _WEEK
+        spans.append((open_offset, close_offset))
+    spans.sort()
+    return spans
+
+
+def _to_timestamp(value: _datetime) -> float:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=_timezone.utc)
+    return value.timestamp()
+
+
+def _to_datetime(timestamp: float) -> _datetime:
+    return _datetime.fromtimestamp(timestamp, _timezone.utc)
+
+
+class TradingCalendar:
+    _shared: _ClassVar[_Dict[_Tuple[_ScheduleKey, int], "TradingCalendar"]] = {}
+    _shared_lock: _ClassVar[_Lock] = _Lock()
+
+    def __init__(
+        self,
+        trading_hours: _Optional[_Iterable[_TradingHour]],
+        horizon: _timedelta = _timedelta(weeks=2),
+    ) -> None:
+        if horizon < _timedelta(weeks=1):
+            raise ValueError("'horizon' must be at least one week")
+        self.key: _Final = schedule_key(trading_hours)
+        self._spans: _Final = _weekly_spans(self.key)
+        self._horizon_weeks: _Final = -(-int(horizon.total_seconds()) // _WEEK)
+        self._lock: _Final = _Lock()
+        self._window: _Window = (0, -1, [], [])
+        self._pieces: _Optional[_Tuple["_NDArray[_Any]", ...]] = None
+
+    @classmethod
+    def for_instrument(
+        cls,
+        instrument: _Instrument,
+        horizon: _timedelta = _timedelta(weeks=2),
+    ) -> "TradingCalendar":
+        key = (schedule_key(instrument.trading_hours), int(horizon.total_seconds()))
+        with cls._shared_lock:
+            calendar = cls._shared.get(key)
+            if calendar is None:
+                calendar = cls(instrument.trading_hours, horizon)
+                cls._shared[key] = calendar
+            return calendar
+
+    @property
+    def always_open(self) -> bool:
+        return not self._spans
+
+    def _week_intervals(
+        self, first_week: int, last_week: int
+    ) -> _Tuple[_List[float], _List[float]]:
+        opens: _List[float] = []
+        closes: _List[float] = []
+        for week in range(first_week, last_week + 1):
+            week_start = _FIRST_MONDAY + week * _WEEK
+            for open_offset, close_offset in self._spans:
+                opens.append(week_start + open_offset)
+                closes.append(week_start + close_offset)
+        return opens, closes
+
+    def _intervals(self, timestamp: float) -> _Tuple[_List[float], _List[float]]:
+        week = int((timestamp - _FIRST_MONDAY) // _WEEK)
+        # The previous week is kept because its last session may run into this one.
+        window = self._window
+        if window[0] <= week - 1 and week + 1 <= window[1]:
+            return window[2], window[3]
+        with self._lock:
+            known_first, known_last, known_opens, known_closes = self._window
+            first_week, last_week = week - 1, week + self._horizon_weeks
+            if known_first <= first_week <= known_last:
+                start = _bisect_right(
+                    known_opens, _FIRST_MONDAY + first_week * _WEEK - 1
+                )
+                added_opens, added_closes = self._week_intervals(
+                    known_last + 1, last_week
+                )
+                opens = known_opens[start:] + added_opens
+                closes = known_closes[start:] + added_closes
+            else:
+                opens, closes = self._week_intervals(first_week, last_week)
+            self._window = (first_week, last_week, opens, closes)
+            return opens, closes
+
+    def is_open(self, at: _datetime) -> bool:
+        if not self._spans:
+            return True
+        timestamp = _to_timestamp(at)
+        opens, closes = self._intervals(timestamp)
+        index = _bisect_right(opens, timestamp) - 1
+        return index >= 0 and timestamp < closes[index]
+
+    def next_open(self, after: _datetime) -> _Optional[_datetime]:
+        if not self._spans:
+            return None
+        timestamp = _to_timestamp(after)
+        opens, _ = self._intervals(timestamp)
+        return _to_datetime(opens[_bisect_right(opens, timestamp)])
+
+    def next_close(self, after: _datetime) -> _Optional[_datetime]:
+        if not self._spans:
+            return None
+        timestamp = _to_timestamp(after)
+        _, closes = self._intervals(timestamp)
+        return _to_datetime(closes[_bisect_right(closes, timestamp)])
+
+    def _week_pieces(self) -> _Tuple["_NDArray[_Any]", ...]:
+        if self._pieces is None:
+            np = _require_numpy("vectorized sessions")
+            # Sessions running past the end of the week are split in two, the tail keeps
+            # the number of its session and is credited to the previous week.
+            pieces: _List[_Tuple[int, int, int, int]] = []
+            for number, (open_offset, close_offset) in enumerate(self._spans):
+                pieces.append(
+                    (
+                        open_offset * 1_000_000,
+                        min(close_offset, _WEEK) * 1_000_000,
+                        number,
+                        0,
+                    )
+                )
+                if close_offset > _WEEK:
+                    pieces.append((0, (close_offset - _WEEK) * 1_000_000, number, 1))
+            self._pieces = tuple(
+                np.array(column, dtype=np.int64) for column in zip(*sorted(pieces))
+            )
+        return self._pieces
+
+    def _classify(
+        self, times: "_NDArray[_Any]"
+    ) -> _Tuple["_NDArray[_Any]", "_NDArray[_Any]"]:
+        np = _require_numpy("vectorized sessions")
+        micros = np.asarray(times, dtype="datetime64[us]").astype(np.int64)
+        if not self._spans:
+            return (
+                np.ones(micros.shape, dtype=bool),
+                np.zeros(micros.shape, dtype=np.int64),
+            )
+        starts, ends, numbers, carried = self._week_pieces()
+        weeks, offsets = np.divmod(
+            micros - _FIRST_MONDAY * 1_000_000, _WEEK * 1_000_000
+        )
+        index = np.searchsorted(starts, offsets, side="right") - 1
+        clipped = np.maximum(index, 0)
+        inside = (index >= 0) & (offsets < ends[clipped])
+        return inside, (weeks - carried[clipped]) * len(self._spans) + numbers[clipped]
+
+    def session_mask(self, times: "_NDArray[_Any]") -> "_NDArray[_Any]":
+        return self._classify(times)[0]
+
+    def session_ids(self, times: "_NDArray[_Any]") -> "_NDArray[_Any]":
+        inside, ids = self._classify(times)
+        return _require_numpy("vectorized sessions").where(inside, ids, -1)
@@ -0,0 +1,107 @@
+import logging as _logging
+from threading import (
+    Lock as _Lock,
+)
+from types import (
+    TracebackType as _TracebackType,
+)
+from typing import (
+    Any as _Any,
+    ClassVar as _ClassVar,
+    Dict as _Dict,
+    Final as _Final,
+    Optional as _Optional,
+    Type as _Type,
+)
+from requests import (
+    Session as _Session,
+    Response as _Response,
+)
+from requests.adapters import (
+    HTTPAdapter as _HTTPAdapter,
+)
+
+_logger = _logging.getLogger(__name__)
+
+
+class LiquidTransport:
+    _shared: _ClassVar[_Dict[str, "LiquidTransport"]] = {}
+    _shared_lock: _ClassVar[_Lock] = _Lock()
+
+    def __init__(
+        self,
+        max_connections_per_host: int = 10,
+        keep_alive: bool = True,
+        block_when_exhausted: bool = False,
+    ) -> None:
+        if max_connections_per_host < 1:
+            raise ValueError("'max_connections_per_host' must be at least 1")
+        self.max_connections_per_host: _Final[int] = max_connections_per_host
+        self.keep_alive: _Final[bool] = keep_alive
+        self.block_when_exhausted: _Final[bool] = block_when_exhausted
+        self._session: _Final[_Session] = _Session()
+        # A client only talks to its own api_base_url, one cached host pool is enough
+        # and max_connections_per_host bounds the sockets kept in it.
+        adapter = _HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=max_connections_per_host,
+            pool_block=block_when_exhausted,
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        if not keep_alive:
+            self._session.headers["Connection"] = "close"
+        self._closed = False
+
+    @classmethod
+    def shared(cls, api_base_url: str, **kwargs: _Any) -> "LiquidTransport":
+        with cls._shared_lock:
+            transport = cls._shared.get(api_base_url)
+            if transport is None or transport.closed:
+                _logger.debug("Creating shared transport for %s", api_base_url)
+                transport = cls(**kwargs)
+                cls._shared[api_base_url] = transport
+            else:
+                conflicts = sorted(
+                    name
+                    for name, value in kwargs.items()
+                    if getattr(transport, name, None) != value
+                )
+                if conflicts:
+                    _logger.warning(
+                        "Shared transport for %s already exists, ignoring %s",
+                        api_base_url,
+                        ", ".join(conflicts),
+                    )
+            return transport
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def request(self, method: str, url: str, **kwargs: _Any) -> _Response:
+        if self._closed:
+            raise RuntimeError("transport is closed")
+        return self._session.request(method=method, url=url, **kwargs)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        with LiquidTransport._shared_lock:
+            for key, transport in list(LiquidTransport._shared.items()):
+                if transport is self:
+                    del LiquidTransport._shared[key]
+        self._session.close()
+        _logger.debug("Transport closed")
+
+    def __enter__(self) -> "LiquidTransport":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: _Optional[_Type[BaseException]],
+        exc: _Optional[BaseException],
+        tb: _Optional[_TracebackType],
+    ) -> None:
+        self.close()
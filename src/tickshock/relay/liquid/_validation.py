@@ -0,0 +1,151 @@
+import logging as _logging
+from datetime import (
+    datetime as _datetime,
+)
+from random import (
+    random as _random,
+)
+from typing import (
+    Any as _Any,
+    Callable as _Callable,
+    Dict as _Dict,
+    Final as _Final,
+    List as _List,
+    Literal as _Literal,
+    Type as _Type,
+    get_args as _get_args,
+)
+from pydantic import (
+    BaseModel as _BaseModel,
+    TypeAdapter as _TypeAdapter,
+    ValidationError as _ValidationError,
+)
+from tickshock.ground.types import (
+    Candle as _Candle,
+)
+from ._tracing import (
+    phase as _phase,
+)
+from .types._candle import (
+    CandleDto as _CandleDto,
+)
+from .types._position import (
+    _PositionDto,
+)
+from .types._quote import (
+    Quote as _Quote,
+    QuoteDto as _QuoteDto,
+)
+from .types import (
+    HistoricalOrderDto as _HistoricalOrderDto,
+    Position as _Position,
+    SymbolLiteral as _SymbolLiteral,
+)
+
+_logger = _logging.getLogger(__name__)
+
+ValidationLevelLiteral = _Literal["strict", "trusted"]
+
+_order_history_adapter: _Final = _TypeAdapter(_List[_HistoricalOrderDto])
+
+_Event = _Dict[str, _Any]
+
+
+def _time(value: _Any) -> _Any:
+    return _datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _trusted_candle(event: _Event) -> _Candle[_SymbolLiteral]:
+    return _CandleDto.model_construct(**{**event, "time": _time(event["time"])}).to_bo()
+
+
+class Validation:
+    def __init__(
+        self,
+        level: ValidationLevelLiteral = "strict",
+        sample_rate: float = 0.01,
+        rng: _Callable[[], float] = _random,
+    ) -> None:
+        if level not in _get_args(ValidationLevelLiteral):
+            raise ValueError(f"unknown validation level '{level}'")
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("'sample_rate' must be between 0 and 1")
+        self.level: _Final = level
+        self.sample_rate: _Final = sample_rate
+        self._rng: _Final = rng
+
+    @property
+    def trusted(self) -> bool:
+        return self.level == "trusted"
+
+    def _sample(self, model: _Type[_BaseModel], items: _List[_Event]) -> None:
+        # Trusted payloads skip validation, a random item is still checked now and then
+        # so a schema change on the broker side shows up instead of corrupting data.
+        if not items or self._rng() >= self.sample_rate:
+            return
+        item = items[int(self._rng() * len(items)) % len(items)]
+        try:
+            model(**item)
+        except _ValidationError:
+            _logger.error("Sampled %s failed validation: %s", model.__name__, item)
+            raise
+
+    def candle(self, event: _Event) -> _Candle[_SymbolLiteral]:
+        if not self.trusted:
+            return _CandleDto(**event).to_bo()
+        self._sample(_CandleDto, [event])
+        return _trusted_candle(event)
+
+    def candles(self, events: _List[_Event]) -> _List[_Candle[_SymbolLiteral]]:
+        if not self.trusted:
+            with _phase("validate"):
+                dtos = [_CandleDto(**event) for event in events]
+            with _phase("convert"):
+                return [dto.to_bo() for dto in dtos]
+        with _phase("validate"):
+            self._sample(_CandleDto, events)
+        with _phase("convert"):
+            return [_trusted_candle(event) for event in events]
+
+    def quote(self, event: _Event) -> _Quote:
+        if not self.trusted:
+            return _QuoteDto(**event).to_bo()
+        self._sample(_QuoteDto, [event])
+        return _Quote.from_json(event)
+
+    def quotes(self, events: _List[_Event]) -> _List[_Quote]:
+        if not self.trusted:
+            with _phase("validate"):
+                dtos = [_QuoteDto(**event) for event in events]
+            with _phase("convert"):
+                return [dto.to_bo() for dto in dtos]
+        with _phase("validate"):
+            self._sample(_QuoteDto, events)
+        with _phase("convert"):
+            return [_Quote.from_json(event) for event in events]
+
+    def positions(self, items: _List[_Event]) -> _List[_Position]:
+        if not self.trusted:
+            with _phase("validate"):
+                dtos = [_PositionDto(**item) for item in items]
+            with _phase("convert"):
+                return [dto.to_bo() for dto in dtos]
+        with _phase("validate"):
+            self._sample(_PositionDto, items)
+        with _phase("convert"):
+            return [_Position.from_json(item) for item in items]
+
+    def order(self, item: _Event) -> _HistoricalOrderDto:
+        # Nested orders are fully validated in both modes, see orders().
+        return _HistoricalOrderDto(**item)
+
+    def orders(self, items: _List[_Event]) -> _List[_HistoricalOrderDto]:
+        with _phase("validate"):
+            if not self.trusted:
+                return [_HistoricalOrderDto(**item) for item in items]
+            # Orders nest legs, executions and cash transactions, which model_construct
+            # would leave as dicts, so they are validated as one batch instead.
+            return _order_history_adapter.validate_python(items)
+
+
+STRICT: _Final = Validation()
@@ -1,9 +1,11 @@
 from ._common import (
     LiquidApiException,
     LiquidApiAuthException,
+    LiquidApiUnavailableException,
 )
 
 __all__ = [
     "LiquidApiException",
     "LiquidApiAuthException",
+    "LiquidApiUnavailableException",
 ]
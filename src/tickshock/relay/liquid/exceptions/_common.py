@@ -6,3 +6,7 @@ class LiquidApiException(Exception):
 
 class LiquidApiAuthException(LiquidApiException):
     pass
+
+
+class LiquidApiUnavailableException(LiquidApiException):
+    pass
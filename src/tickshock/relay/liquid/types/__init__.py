@@ -6,6 +6,7 @@ from ._history import (
 from ._instrument import (
     WeekdayLiteral,
     EventTypeLiteral,
+    InstrumentTypeLiteral,
     CurrencyLiteral,
     SymbolLiteral,
     Session,
@@ -16,13 +17,19 @@ from ._instrument import (
 from ._position import (
     TradeSideLiteral,
     Position,
+    PositionDelta,
 )
 from ._candle import (
     CandleIntervalLiteral,
 )
+from ._order import (
+    OrderSpec,
+    OrderBatchResult,
+)
 from ._quote import (
     Quote,
     QuoteDto,
+    QuoteBatchResult,
 )
 
 __all__ = [
@@ -31,6 +38,7 @@ __all__ = [
     "HistoricalOrderDto",
     "WeekdayLiteral",
     "EventTypeLiteral",
+    "InstrumentTypeLiteral",
     "CurrencyLiteral",
     "SymbolLiteral",
     "Session",
@@ -39,7 +47,11 @@ __all__ = [
     "InstrumentsDtoCollection",
     "TradeSideLiteral",
     "Position",
+    "PositionDelta",
     "CandleIntervalLiteral",
+    "OrderSpec",
+    "OrderBatchResult",
     "Quote",
     "QuoteDto",
+    "QuoteBatchResult",
 ]
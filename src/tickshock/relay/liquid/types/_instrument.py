@@ -1,5 +1,7 @@
 from typing import (
     List as _List,
+    Sequence as _Sequence,
+    Tuple as _Tuple,
     Dict as _Dict,
     Optional as _Optional,
     Literal as _Literal,
@@ -10,7 +12,10 @@ from typing import (
     cast as _cast,
 )
 from re import (
-    match as _match,
+    compile as _compile,
+)
+from functools import (
+    lru_cache as _lru_cache,
 )
 from datetime import (
     time as _time,
@@ -37,6 +42,13 @@ EventTypeLiteral = _Literal[
     "SESSION_OPEN",
     "SESSION_CLOSE",
 ]
+InstrumentTypeLiteral = _Literal[
+    "FOREX",
+    "CFD",
+    "CFD_STOCK",
+    "PRODUCT",
+    "CURRENCY",
+]
 CurrencyLiteral = _Literal[
     "CNH",
     "ILS",
@@ -474,6 +486,13 @@ SymbolLiteral = _Literal[
 ]
 
 
+_WEEK_DAYS: _Final = "|".join(_get_args(WeekdayLiteral))
+_WEEK_DAY_PATTERN: _Final = _compile(rf"^({_WEEK_DAYS}), \d{{2}}:\d{{2}}:\d{{2}}Z$")
+_WEEK_DAY_LOOKUP: _Final[_Dict[WeekdayLiteral, int]] = {
+    day: number for number, day in enumerate(_get_args(WeekdayLiteral))
+}
+
+
 class _TradingHourDto(_BaseModel):
     weekDay: str
     eventType: EventTypeLiteral
@@ -481,15 +500,14 @@ class _TradingHourDto(_BaseModel):
     @_field_validator('weekDay')
     @classmethod
     def validate_weekday_format(cls, v: str) -> str:
-        days = "|".join(_get_args(WeekdayLiteral))
-        pattern = rf"^({days}), \d{{2}}:\d{{2}}:\d{{2}}Z$"
-
-        if not _match(pattern, v):
-            raise ValueError(f'weekDay must start with a valid day ({days}) and follow "HH:MM:SSZ"')
+        if not _WEEK_DAY_PATTERN.match(v):
+            raise ValueError(
+                f'weekDay must start with a valid day ({_WEEK_DAYS}) and follow "HH:MM:SSZ"'
+            )
         return v
 
     def to_bo(self) -> "TradingHour":
-        return TradingHour(self)
+        return _trading_hour(self.weekDay, self.eventType)
 
 
 class _InstrumentDto(_BaseModel):
@@ -534,29 +552,21 @@ class _CfdStockDto(_InstrumentDto):
     assetClass: str
 
 
+AnyInstrumentDto = _Annotated[
+    _Union[_ProductDto, _ForexDto, _CfdDto, _CfdStockDto, _CurrencyDto],
+    _Field(discriminator="type")
+]
+
+
 class InstrumentsDtoCollection(_BaseModel):
-    instruments: _List[
-        _Annotated[
-            _Union[_ProductDto, _ForexDto, _CfdDto, _CfdStockDto, _CurrencyDto],
-            _Field(discriminator="type")
-        ]
-    ]
+    instruments: _List[AnyInstrumentDto]
 
 
 class TradingHour:
     def __init__(self, dto: _TradingHourDto) -> None:
-        week_day_lookup: _Dict[WeekdayLiteral, int] = {
-            "Monday": 0,
-            "Tuesday": 1,
-            "Wednesday": 2,
-            "Thursday": 3,
-            "Friday": 4,
-            "Saturday": 5,
-            "Sunday": 6,
-        }
         day_str, time_str = dto.weekDay.split(", ")
         self.week_day: _Final[WeekdayLiteral] = _cast(WeekdayLiteral, day_str)
-        self.week_day_int: _Final[int] = week_day_lookup[self.week_day]
+        self.week_day_int: _Final[int] = _WEEK_DAY_LOOKUP[self.week_day]
         self.time: _Final[_time] = _time.fromisoformat(time_str.replace("Z", ""))
         self.event_type: _Final[EventTypeLiteral] = dto.eventType
 
@@ -583,6 +593,18 @@ class TradingHour:
         ))
 
 
+# Instruments share a handful of schedules, so trading hours are parsed once per
+# distinct string and the resulting objects are shared between instruments.
+@_lru_cache(maxsize=None)
+def _trading_hour(week_day: str, event_type: EventTypeLiteral) -> TradingHour:
+    return TradingHour(_TradingHourDto.model_construct(weekDay=week_day, eventType=event_type))
+
+
+@_lru_cache(maxsize=None)
+def _schedule(key: _Tuple[_Tuple[str, EventTypeLiteral], ...]) -> _Tuple[TradingHour, ...]:
+    return tuple(_trading_hour(week_day, event_type) for week_day, event_type in key)
+
+
 class Session:
     def __init__(
         self,
@@ -608,7 +630,7 @@ class Session:
 
     @staticmethod
     def create_sessions(
-        trading_hours: _List[TradingHour],
+        trading_hours: _Sequence[TradingHour],
         focal_time: _datetime,
     ) -> _List["Session"]:
         sessions: _List[Session] = []
@@ -629,9 +651,16 @@ class Instrument:
         dto: _InstrumentDto,
     ) -> None:
         self.symbol: _Final[SymbolLiteral] = dto.symbol
+        self.version: _Final[int] = dto.version
+        self.description: _Final[str] = dto.description
+        self.type: _Final[_Optional[InstrumentTypeLiteral]] = getattr(dto, "type", None)
         self.currency: _Final[_Optional[CurrencyLiteral]] = \
-            dto.currency if isinstance(dto, (_ForexDto, _CfdDto)) else None
-        has_th = isinstance(dto.tradingHours, list) and len(dto.tradingHours) > 0
-        self.trading_hours: _Final[_Optional[_List[TradingHour]]] = [
-            TradingHour(th_dto) for th_dto in dto.tradingHours
-        ] if dto.tradingHours and has_th else None
+            dto.currency if isinstance(dto, (_ForexDto, _CfdDto, _CfdStockDto)) else None
+        self.asset_class: _Final[_Optional[str]] = getattr(dto, "assetClass", None)
+        self.price_increment: _Final[float] = dto.priceIncrement
+        self.pip_size: _Final[float] = dto.pipSize
+        self.lot_size: _Final[float] = dto.lotSize
+        self.multiplier: _Final[float] = dto.multiplier
+        self.trading_hours: _Final[_Optional[_Tuple[TradingHour, ...]]] = _schedule(
+            tuple((th_dto.weekDay, th_dto.eventType) for th_dto in dto.tradingHours)
+        ) if dto.tradingHours else None
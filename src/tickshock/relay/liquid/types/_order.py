@@ -0,0 +1,32 @@
+from typing import (
+    Dict as _Dict,
+    NamedTuple as _NamedTuple,
+    Optional as _Optional,
+    Tuple as _Tuple,
+)
+from ._history import (
+    OrderTypeLiteral as _OrderTypeLiteral,
+    PositionEffectLiteral as _PositionEffectLiteral,
+)
+from ._instrument import (
+    SymbolLiteral as _SymbolLiteral,
+)
+from ._position import (
+    TradeSideLiteral as _TradeSideLiteral,
+)
+
+
+class OrderSpec(_NamedTuple):
+    symbol: _SymbolLiteral
+    order_type: _OrderTypeLiteral
+    side: _TradeSideLiteral
+    effect: _PositionEffectLiteral
+    quantity: float
+    position_code: _Optional[str] = None
+    limit_price: _Optional[float] = None
+    stop_price: _Optional[float] = None
+
+
+class OrderBatchResult(_NamedTuple):
+    placed: _Dict[int, _Tuple[str, str]]
+    errors: _Dict[int, Exception]
@@ -1,7 +1,10 @@
 from typing import (
+    Any as _Any,
     Literal as _Literal,
     List as _List,
     Final as _Final,
+    Mapping as _Mapping,
+    NamedTuple as _NamedTuple,
 )
 from datetime import (
     datetime as _datetime,
@@ -38,7 +41,25 @@ class PositionsDto(_BaseModel):
     positions: _List[_PositionDto]
 
 
+_JSON_KEYS: _Final = {
+    "account": "account",
+    "version": "version",
+    "position_code": "positionCode",
+    "symbol": "symbol",
+    "quantity": "quantity",
+    "side": "side",
+    "quantity_notional": "quantityNotional",
+    "open_time": "openTime",
+    "open_price": "openPrice",
+    "last_update_time": "lastUpdateTime",
+    "margin_rate": "marginRate",
+}
+_JSON_TIMES: _Final = frozenset(("open_time", "last_update_time"))
+
+
 class Position:
+    __slots__ = tuple(_JSON_KEYS)
+
     def __init__(self, dto: _PositionDto) -> None:
         self.account: _Final[str] = dto.account
         self.version: _Final[int] = dto.version
@@ -51,3 +72,26 @@ class Position:
         self.open_price: _Final[float] = dto.open_price
         self.last_update_time: _Final[_datetime] = dto.last_update_time
         self.margin_rate: _Final[float] = dto.margin_rate
+
+    @classmethod
+    def from_json(cls, data: _Mapping[str, _Any]) -> "Position":
+        position = cls.__new__(cls)
+        for set_slot, key, is_time in _JSON_SETTERS:
+            value = data[key]
+            if is_time and isinstance(value, str):
+                value = _datetime.fromisoformat(value)
+            set_slot(position, value)
+        return position
+
+
+# Writing through the slot descriptors skips the DTO and attribute lookups per field.
+_JSON_SETTERS: _Final = tuple(
+    (getattr(Position, attribute).__set__, key, attribute in _JSON_TIMES)
+    for attribute, key in _JSON_KEYS.items()
+)
+
+
+class PositionDelta(_NamedTuple):
+    added: _List[Position]
+    changed: _List[Position]
+    closed: _List[Position]
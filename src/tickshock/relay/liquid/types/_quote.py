@@ -1,6 +1,10 @@
 from typing import (
+    Any as _Any,
     Literal as _Literal,
     Final as _Final,
+    Dict as _Dict,
+    Mapping as _Mapping,
+    NamedTuple as _NamedTuple,
 )
 from datetime import (
     datetime as _datetime,
@@ -14,6 +18,8 @@ from ._instrument import (
 
 
 class Quote:
+    __slots__ = ("symbol", "bid", "ask", "time")
+
     def __init__(
         self,
         symbol: _SymbolLiteral,
@@ -26,6 +32,16 @@ class Quote:
         self.ask: _Final = ask
         self.time: _Final = time
 
+    @classmethod
+    def from_json(cls, event: _Mapping[str, _Any]) -> "Quote":
+        time = event["time"]
+        return cls(
+            event["symbol"],
+            event["bid"],
+            event["ask"],
+            _datetime.fromisoformat(time) if isinstance(time, str) else time,
+        )
+
 
 class QuoteDto(_BaseModel):
     type: _Literal["Quote"]
@@ -41,3 +57,8 @@ class QuoteDto(_BaseModel):
             self.ask,
             self.time,
         )
+
+
+class QuoteBatchResult(_NamedTuple):
+    quotes: _Dict[_SymbolLiteral, Quote]
+    errors: _Dict[_SymbolLiteral, Exception]
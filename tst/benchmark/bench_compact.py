@@ -0,0 +1,69 @@
+import tracemalloc
+from copy import copy
+from timeit import repeat
+from src.tickshock.relay.liquid.types import Quote, Position
+from src.tickshock.relay.liquid.types._quote import QuoteDto
+from src.tickshock.relay.liquid.types._position import _PositionDto
+
+QUOTE_EVENT = {
+    "type": "Quote",
+    "symbol": "BTC$",
+    "bid": 100.0,
+    "ask": 101.0,
+    "time": "2023-01-01T00:00:00Z",
+}
+POSITION_JSON = {
+    "symbol": "BTC$",
+    "quantity": 1.0,
+    "side": "BUY",
+    "positionCode": "pos123",
+    "account": "default:888",
+    "version": 1,
+    "quantityNotional": 50000.0,
+    "openTime": "2023-01-01T00:00:00Z",
+    "openPrice": 50000.0,
+    "lastUpdateTime": "2023-01-01T00:00:00Z",
+    "marginRate": 0.0,
+}
+
+
+class _DictBacked:
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+
+def best_time(func, number=10_000):
+    return min(repeat(func, number=number, repeat=5)) / number
+
+
+def allocated(factory, count=20_000):
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        items = [factory() for _ in range(count)]
+        size = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del items
+    return size / count
+
+
+def compare(name, cls, dto, payload):
+    # Both layouts share the parsed values, only the objects themselves are counted.
+    parsed = cls.from_json(payload)
+    fields = {slot: getattr(parsed, slot) for slot in cls.__slots__}
+    slotted = allocated(lambda: copy(parsed))
+    dict_backed = allocated(lambda: _DictBacked(**fields))
+    print(f"{name} bytes: slots {slotted:.0f}, dict {dict_backed:.0f}")
+    direct = best_time(lambda: cls.from_json(payload))
+    validated = best_time(lambda: dto(**payload).to_bo())
+    print(f"{name} us:    from_json {direct * 1e6:.2f}, dto {validated * 1e6:.2f}")
+
+
+def main():
+    compare("quote", Quote, QuoteDto, QUOTE_EVENT)
+    compare("position", Position, _PositionDto, POSITION_JSON)
+
+
+if __name__ == "__main__":
+    main()
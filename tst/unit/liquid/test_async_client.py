@@ -0,0 +1,193 @@
+import pytest
+import json
+import asyncio
+import httpx
+from datetime import datetime
+from src.tickshock.relay.liquid import AsyncLiquid, RetryPolicy, Tracer
+from src.tickshock.relay.liquid.exceptions import (
+    LiquidApiException,
+    LiquidApiAuthException,
+)
+
+MOCK_CREDS = {
+    "username": "user123",
+    "password": "password123",
+    "api_base_url": "https://api.test.com",
+    "account_id": "888",
+}
+
+MOCK_QUOTE = {
+    "type": "Quote",
+    "symbol": "BTC$",
+    "bid": 50000.0,
+    "ask": 50010.0,
+    "time": "2023-01-01T12:00:00Z",
+}
+
+
+class MockBroker:
+    def __init__(self, routes):
+        self.routes = routes
+        self.requests = []
+        self.logins = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.url.path.endswith("/login"):
+            self.logins += 1
+            return httpx.Response(200, json={"sessionToken": f"token-{self.logins}"})
+        return self.routes(request)
+
+
+def make_client(broker: MockBroker) -> AsyncLiquid:
+    return AsyncLiquid(
+        **MOCK_CREDS,
+        client=httpx.AsyncClient(transport=httpx.MockTransport(broker)),
+    )
+
+
+class TestAsyncLiquid:
+    def test_login_is_lazy_and_shared(self):
+        broker = MockBroker(lambda _: httpx.Response(200, json={"events": [MOCK_QUOTE]}))
+        client = make_client(broker)
+
+        async def run():
+            async with client:
+                return await asyncio.gather(
+                    *(client.get_quotes(["BTC$"]) for _ in range(10))
+                )
+
+        results = asyncio.run(run())
+
+        assert broker.logins == 1
+        assert all(quotes[0].bid == 50000.0 for quotes in results)
+        assert broker.requests[-1].headers["Authorization"] == "DXAPI token-1"
+
+    def test_concurrent_auth_refresh_is_single_flight(self):
+        def routes(request):
+            if request.headers["Authorization"] == "DXAPI token-1":
+                return httpx.Response(401, json={"description": "Authorization required"})
+            return httpx.Response(200, json={"events": [MOCK_QUOTE]})
+
+        broker = MockBroker(routes)
+        client = make_client(broker)
+
+        async def run():
+            await client._ensure_session_token()
+            return await asyncio.gather(
+                *(client.get_quotes(["BTC$"]) for _ in range(10))
+            )
+
+        results = asyncio.run(run())
+
+        assert broker.logins == 2
+        assert len(results) == 10
+
+    def test_too_many_auth_retries(self):
+        broker = MockBroker(
+            lambda _: httpx.Response(401, json={"description": "Authorization required"})
+        )
+        client = make_client(broker)
+
+        with pytest.raises(LiquidApiAuthException, match="too many retries"):
+            asyncio.run(client.get_open_positions())
+
+    def test_reads_retry_transport_errors(self):
+        attempts = []
+
+        def flaky(request):
+            attempts.append(request)
+            if len(attempts) == 1:
+                raise httpx.ConnectTimeout("connect timed out", request=request)
+            return httpx.Response(200, json={"events": [MOCK_QUOTE]})
+
+        client = AsyncLiquid(
+            **MOCK_CREDS,
+            client=httpx.AsyncClient(transport=httpx.MockTransport(MockBroker(flaky))),
+            retry_policy=RetryPolicy(base_delay=0.0),
+        )
+
+        quotes = asyncio.run(client.get_quotes(["BTC$"]))
+
+        assert len(quotes) == 1
+        assert len(attempts) == 2
+
+    def test_orders_are_not_retried_on_server_errors(self):
+        broker = MockBroker(lambda _: httpx.Response(503, json={}))
+        client = make_client(broker)
+
+        with pytest.raises(LiquidApiException):
+            asyncio.run(client.place_order("BTC$", "LIMIT", "BUY", "OPEN", 1.0))
+
+        assert len([r for r in broker.requests if r.url.path.endswith("/orders")]) == 1
+
+    def test_metrics_are_recorded(self):
+        body = httpx.Response(200, json={"events": [MOCK_QUOTE]}).content
+        broker = MockBroker(lambda _: httpx.Response(200, content=body))
+        client = make_client(broker)
+
+        asyncio.run(client.get_quotes(["BTC$"]))
+
+        stats = client.metrics.snapshot().requests[("marketdata", "POST")]
+        assert stats.requests == 1
+        assert stats.errors == 0
+        assert stats.size.total == len(body)
+
+    def test_tracing(self):
+        broker = MockBroker(lambda _: httpx.Response(200, json={"events": [MOCK_QUOTE]}))
+        tracer = Tracer()
+        client = AsyncLiquid(
+            **MOCK_CREDS,
+            client=httpx.AsyncClient(transport=httpx.MockTransport(broker)),
+            tracer=tracer,
+        )
+
+        async def run():
+            async with client:
+                await client.get_quotes(["BTC$"])
+
+        asyncio.run(run())
+
+        (trace,) = tracer.traces()
+        assert trace.call == "get_quotes"
+        assert [span.phase for span in trace.spans] == ["decode", "validate", "convert"]
+
+    def test_get_market_data(self):
+        event = {
+            "symbol": "BTC$",
+            "open": 50000.0,
+            "high": 51000.0,
+            "low": 49000.0,
+            "close": 50500.0,
+            "volume": 10.5,
+            "time": "2023-01-01T00:00:00Z",
+            "type": "Candle",
+            "candleType": "m",
+        }
+        broker = MockBroker(lambda _: httpx.Response(200, json={"events": [event]}))
+        client = make_client(broker)
+
+        candles = asyncio.run(
+            client.get_market_data("BTC$", "m", datetime(2023, 1, 1), datetime(2023, 1, 2))
+        )
+
+        assert len(candles) == 1
+        body = json.loads(broker.requests[-1].content)
+        assert body["eventTypes"][0]["fromTime"] == "2023-01-01T00:00:00Z"
+
+    def test_place_order_failure(self):
+        broker = MockBroker(lambda _: httpx.Response(200, json={"status": "rejected"}))
+        client = make_client(broker)
+
+        with pytest.raises(LiquidApiException, match="not successful"):
+            asyncio.run(client.place_order("BTC$", "LIMIT", "BUY", "OPEN", 1.0))
+
+    def test_get_order_history_params(self):
+        broker = MockBroker(lambda _: httpx.Response(200, json={"orders": []}))
+        client = make_client(broker)
+
+        asyncio.run(client.get_order_history(symbol="ETHUSD", order_id="PID-1"))
+
+        params = broker.requests[-1].url.params
+        assert params["for-instrument"] == "ETHUSD"
+        assert params["with-order-id"] == "PID-1"
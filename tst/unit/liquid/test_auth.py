@@ -0,0 +1,103 @@
+import pytest
+import time
+from threading import Thread, Barrier
+from unittest.mock import MagicMock
+from src.tickshock.relay.liquid._auth import SessionTokenManager
+
+
+def counting_login():
+    calls = []
+
+    def login():
+        calls.append(1)
+        return f"token-{len(calls)}"
+
+    return login, calls
+
+
+class TestSessionTokenManager:
+    def test_refresh_is_single_flight(self):
+        calls = []
+
+        def slow_login():
+            calls.append(1)
+            time.sleep(0.05)
+            return f"token-{len(calls)}"
+
+        manager = SessionTokenManager(slow_login)
+        stale = manager.refresh(None)
+        barrier = Barrier(8)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(manager.refresh(stale))
+
+        threads = [Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 2
+        assert set(results) == {"token-2"}
+
+    def test_current_renews_expired_token(self, clock):
+        login, calls = counting_login()
+        manager = SessionTokenManager(login, ttl=60.0, clock=clock)
+
+        assert manager.current() == "token-1"
+        clock.now = 30.0
+        assert manager.current() == "token-1"
+        clock.now = 61.0
+        assert manager.current() == "token-2"
+        assert len(calls) == 2
+
+    def test_tick_renews_ahead_of_expiry(self, clock):
+        login, _ = counting_login()
+        manager = SessionTokenManager(login, ttl=100.0, renew_ratio=0.5, clock=clock)
+        manager.refresh(None)
+
+        assert manager._next_delay() == 50.0
+        clock.now = 50.0
+        manager._tick()
+        assert manager.token == "token-2"
+
+    def test_tick_sends_keep_alive_when_idle(self, clock):
+        login, _ = counting_login()
+        keep_alive = MagicMock()
+        manager = SessionTokenManager(
+            login, keep_alive=keep_alive, keep_alive_interval=30.0, clock=clock
+        )
+        manager.refresh(None)
+
+        clock.now = 10.0
+        manager.touch()
+        assert manager._next_delay() == 30.0
+        clock.now = 40.0
+        manager._tick()
+
+        keep_alive.assert_called_once()
+        assert manager.token == "token-1"
+
+    def test_background_renewal(self):
+        login, calls = counting_login()
+        manager = SessionTokenManager(login, ttl=0.05, renew_ratio=0.5)
+        manager.refresh(None)
+        manager.start()
+        time.sleep(0.2)
+        manager.close()
+
+        assert len(calls) > 2
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"ttl": 0},
+            {"renew_ratio": 0},
+            {"keep_alive_interval": 10.0},
+        ],
+    )
+    def test_invalid_configuration(self, kwargs):
+        with pytest.raises(ValueError):
+            SessionTokenManager(lambda: "token", **kwargs)
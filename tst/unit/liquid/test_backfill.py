@@ -0,0 +1,52 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from tickshock.ground.types import Candle
+from src.tickshock.relay.liquid._backfill import (
+    WINDOW_SIZES,
+    split_range,
+    merge_candles,
+)
+
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+
+def make_candle(minute: int, close: float = 1.0) -> Candle:
+    return Candle(
+        "BTC$", "m", 1.0, close, 1.0, 1.0, 1.0, START + timedelta(minutes=minute)
+    )
+
+
+class TestSplitRange:
+    def test_windows_cover_range(self):
+        windows = split_range(START, START + timedelta(days=3, hours=6), "m")
+
+        assert len(windows) == 4
+        assert windows[0] == (START, START + timedelta(days=1))
+        assert windows[-1][1] == START + timedelta(days=3, hours=6)
+        for (_, end), (start, _) in zip(windows, windows[1:]):
+            assert end == start
+
+    def test_window_override(self):
+        windows = split_range(START, START + timedelta(hours=3), "m", timedelta(hours=1))
+        assert len(windows) == 3
+
+    def test_every_interval_has_window(self):
+        assert set(WINDOW_SIZES) == {"m", "5m", "15m", "30m", "h", "2h", "4h", "d", "w", "mo"}
+
+    def test_invalid_window(self):
+        with pytest.raises(ValueError):
+            split_range(START, START + timedelta(hours=1), "m", timedelta(0))
+
+
+class TestMergeCandles:
+    def test_dedupes_boundaries_in_time_order(self):
+        merged = merge_candles(
+            [
+                [make_candle(2), make_candle(3, close=1.0)],
+                [make_candle(0), make_candle(1), make_candle(2)],
+                [make_candle(3, close=2.0), make_candle(4)],
+            ]
+        )
+
+        assert [c.time for c in merged] == [START + timedelta(minutes=i) for i in range(5)]
+        assert merged[3].close == 2.0
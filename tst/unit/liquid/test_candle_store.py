@@ -0,0 +1,89 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from tickshock.ground.types import Candle
+from src.tickshock.relay.liquid import CandleStore
+
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+LATER = START + timedelta(days=30)
+
+
+def make_candles(from_minute: int, to_minute: int, close: float = 1.0):
+    return [
+        Candle("BTC$", "m", 1.0, close, 2.0, 0.5, 3.0, START + timedelta(minutes=i))
+        for i in range(from_minute, to_minute + 1)
+    ]
+
+
+@pytest.fixture
+def store(tmp_path):
+    with CandleStore(tmp_path / "candles.sqlite") as candle_store:
+        yield candle_store
+
+
+class TestCandleStore:
+    def test_empty_store_misses_whole_range(self, store):
+        end = START + timedelta(minutes=10)
+        assert store.missing("BTC$", "m", START, end) == [(START, end)]
+
+    def test_round_trip(self, store):
+        end = START + timedelta(minutes=10)
+        store.save("BTC$", "m", START, end, make_candles(0, 10), now=LATER)
+
+        loaded = store.load("BTC$", "m", START, end)
+
+        assert len(loaded) == 11
+        assert loaded[0].time == START
+        assert loaded[3].high == 2.0
+        assert store.missing("BTC$", "m", START, end) == []
+
+    def test_gaps_between_covered_spans(self, store):
+        store.save("BTC$", "m", START, START + timedelta(minutes=10), [], now=LATER)
+        store.save(
+            "BTC$",
+            "m",
+            START + timedelta(minutes=20),
+            START + timedelta(minutes=30),
+            [],
+            now=LATER,
+        )
+
+        gaps = store.missing(
+            "BTC$", "m", START - timedelta(minutes=5), START + timedelta(minutes=40)
+        )
+
+        assert gaps == [
+            (START - timedelta(minutes=5), START),
+            (START + timedelta(minutes=10), START + timedelta(minutes=20)),
+            (START + timedelta(minutes=30), START + timedelta(minutes=40)),
+        ]
+
+    def test_adjacent_spans_merge(self, store):
+        store.save("BTC$", "m", START, START + timedelta(minutes=10), [], now=LATER)
+        store.save(
+            "BTC$", "m", START + timedelta(minutes=10), START + timedelta(minutes=20), [], now=LATER
+        )
+
+        assert store._coverage("BTC$", "m") == [
+            (
+                int(START.timestamp() * 1_000_000),
+                int((START + timedelta(minutes=20)).timestamp() * 1_000_000),
+            )
+        ]
+
+    def test_forming_candle_is_not_persisted(self, store):
+        end = START + timedelta(minutes=10)
+        now = START + timedelta(minutes=10, seconds=30)
+
+        store.save("BTC$", "m", START, end, make_candles(0, 10), now=now)
+
+        assert len(store.load("BTC$", "m", START, end)) == 10
+        assert store.missing("BTC$", "m", START, end) == [
+            (START + timedelta(minutes=9, seconds=30), end)
+        ]
+
+    def test_keys_are_separate(self, store):
+        end = START + timedelta(minutes=10)
+        store.save("BTC$", "m", START, end, make_candles(0, 10), now=LATER)
+
+        assert store.load("BTC$", "5m", START, end) == []
+        assert store.missing("ETH$", "m", START, end) == [(START, end)]
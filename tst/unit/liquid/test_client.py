@@ -1,12 +1,25 @@
 import pytest
 import json
+import threading
 from unittest.mock import MagicMock, patch
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from tickshock.ground.types import Candle
 from http import HTTPMethod
-from src.tickshock.relay.liquid import Liquid
+from requests import ConnectionError as RequestsConnectionError, Timeout
+from src.tickshock.relay.liquid import (
+    Liquid,
+    LiquidTransport,
+    CandleStore,
+    RetryPolicy,
+    CircuitBreaker,
+    InMemoryMetrics,
+    Tracer,
+)
+from src.tickshock.relay.liquid.types import OrderSpec
 from src.tickshock.relay.liquid.exceptions import (
     LiquidApiException,
     LiquidApiAuthException,
+    LiquidApiUnavailableException,
 )
 
 MOCK_CREDS = {
@@ -17,6 +30,17 @@ MOCK_CREDS = {
 }
 
 MOCK_LOGIN_RESPONSE = {"sessionToken": "fake-token-123"}
+MOCK_QUOTE = {
+    "type": "Quote",
+    "symbol": "BTC$",
+    "bid": 50000.0,
+    "ask": 50010.0,
+    "time": "2023-01-01T12:00:00Z",
+}
+
+
+def json_body(payload) -> bytes:
+    return json.dumps(payload).encode()
 
 
 def append_target_module(var_name: str) -> str:
@@ -25,20 +49,22 @@ def append_target_module(var_name: str) -> str:
 
 @pytest.fixture
 def mock_requests():
-    with patch(append_target_module("_request")) as mocked:
+    with patch(append_target_module("_LiquidTransport.request")) as mocked:
+        mocked.return_value.status_code = 200
+        mocked.return_value.headers = {}
         yield mocked
 
 
 @pytest.fixture
 def liquid_client(mock_requests):
-    mock_requests.return_value.json.return_value = MOCK_LOGIN_RESPONSE
+    mock_requests.return_value.content = json_body(MOCK_LOGIN_RESPONSE)
     mock_requests.return_value.ok = True
     return Liquid(**MOCK_CREDS)
 
 
 class TestLiquidInit:
     def test_init_success(self, mock_requests):
-        mock_requests.return_value.json.return_value = MOCK_LOGIN_RESPONSE
+        mock_requests.return_value.content = json_body(MOCK_LOGIN_RESPONSE)
         mock_requests.return_value.ok = True
 
         client = Liquid(**MOCK_CREDS)
@@ -48,13 +74,13 @@ class TestLiquidInit:
         mock_requests.assert_called_once()
 
     def test_init_auth_failure(self, mock_requests):
-        mock_requests.return_value.json.return_value = {"error": "unauthorized"}
+        mock_requests.return_value.content = json_body({"error": "unauthorized"})
 
         with pytest.raises(LiquidApiAuthException, match="session token not received"):
             Liquid(**MOCK_CREDS)
 
     def test_const_with_envvars(self, mock_requests):
-        mock_requests.return_value.json.return_value = MOCK_LOGIN_RESPONSE
+        mock_requests.return_value.content = json_body(MOCK_LOGIN_RESPONSE)
         mock_requests.return_value.ok = True
         env_map = {
             "LIQUID_UN": "env_user",
@@ -70,6 +96,28 @@ class TestLiquidInit:
             assert client._username == "env_user"
             assert client._api_base_url == "https://env.api.com"
 
+    def test_context_manager_closes_owned_transport(self, mock_requests):
+        mock_requests.return_value.content = json_body(MOCK_LOGIN_RESPONSE)
+        mock_requests.return_value.ok = True
+
+        with Liquid(**MOCK_CREDS) as client:
+            transport = client._transport
+            assert not transport.closed
+
+        assert transport.closed
+
+    def test_shared_transport_not_closed_by_client(self, mock_requests):
+        mock_requests.return_value.content = json_body(MOCK_LOGIN_RESPONSE)
+        mock_requests.return_value.ok = True
+        transport = LiquidTransport()
+
+        with Liquid(**MOCK_CREDS, transport=transport) as first:
+            with Liquid(**{**MOCK_CREDS, "account_id": "999"}, transport=transport) as second:
+                assert first._transport is second._transport
+
+        assert not transport.closed
+        transport.close()
+
 
 class TestLiquidMarketData:
     @pytest.mark.parametrize(
@@ -114,6 +162,121 @@ class TestLiquidMarketData:
             assert len(candles) == 1
             assert candles[0].close == 50500.0
 
+    def test_get_market_data_multi_batches_symbols(self, liquid_client):
+        def candle_event(symbol):
+            return {
+                "symbol": symbol,
+                "open": 1.0,
+                "high": 1.0,
+                "low": 1.0,
+                "close": 1.0,
+                "volume": 1.0,
+                "time": "2023-01-01T00:00:00Z",
+                "type": "Candle",
+                "candleType": "h",
+            }
+
+        def query(method, path, data):
+            response = MagicMock()
+            response.json.return_value = {
+                "events": [candle_event(symbol) for symbol in data["symbols"] if symbol != "AAPL"]
+            }
+            return response
+
+        symbols = ["BTC$", "ETH$", "AAPL", "TSLA", "BTC$"]
+        with patch.object(liquid_client, "_query", side_effect=query) as mock_query:
+            candles = liquid_client.get_market_data_multi(
+                symbols,
+                "h",
+                datetime(2023, 1, 1),
+                datetime(2023, 1, 2),
+                max_symbols_per_request=2,
+            )
+
+        assert mock_query.call_count == 2
+        assert set(candles) == {"BTC$", "ETH$", "AAPL", "TSLA"}
+        assert candles["AAPL"] == []
+        assert [c.symbol for c in candles["TSLA"]] == ["TSLA"]
+
+    def test_get_market_data_multi_exception(self, liquid_client):
+        with patch.object(liquid_client, "_query") as mock_query:
+            mock_query.return_value.json.return_value = {"malformed": "response"}
+            with pytest.raises(LiquidApiException, match="market data not received"):
+                liquid_client.get_market_data_multi(
+                    ["BTC$", "ETH$"], "m", datetime(2023, 1, 1), datetime(2023, 1, 2)
+                )
+
+    def test_get_market_data_columns(self, liquid_client):
+        pytest.importorskip("numpy")
+        mock_event = {
+            "symbol": "BTC$",
+            "open": 50000.0,
+            "high": 51000.0,
+            "low": 49000.0,
+            "close": 50500.0,
+            "volume": 10.5,
+            "time": "2023-01-01T00:00:00Z",
+            "type": "Candle",
+            "candleType": "m",
+        }
+        with patch.object(liquid_client, "_query") as mock_query:
+            mock_query.return_value.json.return_value = {"events": [mock_event] * 3}
+            columns = liquid_client.get_market_data_columns(
+                "BTC$", "m", datetime(2023, 1, 1), datetime(2023, 1, 2)
+            )
+            assert len(columns.close) == 3
+            assert columns.close[0] == 50500.0
+
+    def test_iter_market_data_streams_events(self, liquid_client, mock_requests):
+        mock_event = {
+            "symbol": "BTC$",
+            "open": 50000.0,
+            "high": 51000.0,
+            "low": 49000.0,
+            "close": 50500.0,
+            "volume": 10.5,
+            "time": "2023-01-01T00:00:00Z",
+            "type": "Candle",
+            "candleType": "m",
+        }
+        body = json_body({"events": [mock_event] * 5})
+        mock_requests.return_value.ok = True
+        mock_requests.return_value.iter_content.return_value = [
+            body[i : i + 50] for i in range(0, len(body), 50)
+        ]
+
+        candles = list(
+            liquid_client.iter_market_data(
+                "BTC$", "m", datetime(2023, 1, 1), datetime(2023, 1, 2)
+            )
+        )
+
+        assert len(candles) == 5
+        assert candles[0].close == 50500.0
+        assert mock_requests.call_args.kwargs["stream"] is True
+        mock_requests.return_value.close.assert_called_once()
+
+    def test_iter_market_data_exception(self, liquid_client, mock_requests):
+        mock_requests.return_value.ok = True
+        mock_requests.return_value.iter_content.return_value = [b'{"malformed": 1}']
+
+        with pytest.raises(LiquidApiException, match="market data not received"):
+            list(
+                liquid_client.iter_market_data(
+                    "BTC$", "m", datetime(2023, 1, 1), datetime(2023, 1, 2)
+                )
+            )
+
+    def test_iter_market_data_checks_range_on_call(self, liquid_client, mock_requests):
+        mock_requests.reset_mock()
+
+        with pytest.raises(ValueError, match="before 'to_time'"):
+            liquid_client.iter_market_data(
+                "BTC$", "m", datetime(2023, 1, 2), datetime(2023, 1, 1)
+            )
+
+        mock_requests.assert_not_called()
+
     def test_get_market_data_exception(self, liquid_client):
         with patch.object(liquid_client, "_query") as mock_query:
             mock_query.return_value.json.return_value = {"malformed": "response"}
@@ -122,27 +285,299 @@ class TestLiquidMarketData:
                     "BTC$", "m", datetime(2023, 1, 1), datetime(2023, 1, 2)
                 )
 
+    def test_backfill_market_data_retries_failed_window(self, liquid_client):
+        start = datetime(2023, 1, 1)
+        calls = []
+
+        def fetch(symbol, duration, from_time, to_time, timeout):
+            calls.append(from_time)
+            if from_time == start + timedelta(days=1) and calls.count(from_time) == 1:
+                raise LiquidApiException("boom")
+            return [
+                Candle(symbol, duration, 1.0, 1.0, 1.0, 1.0, 1.0, t)
+                for t in (from_time, to_time)
+            ]
+
+        with patch.object(liquid_client, "_fetch_candles", side_effect=fetch):
+            candles = liquid_client.backfill_market_data(
+                "BTC$", "m", start, start + timedelta(days=3), retry_delay=0
+            )
+
+        assert len(calls) == 4
+        assert [c.time for c in candles] == [start + timedelta(days=i) for i in range(4)]
+
+    def test_backfill_market_data_gives_up(self, liquid_client):
+        with patch.object(
+            liquid_client, "_fetch_candles", side_effect=LiquidApiException("boom")
+        ) as mock_fetch:
+            with pytest.raises(LiquidApiException, match="boom"):
+                liquid_client.backfill_market_data(
+                    "BTC$",
+                    "m",
+                    datetime(2023, 1, 1),
+                    datetime(2023, 1, 1, 12),
+                    max_attempts=2,
+                    retry_delay=0,
+                )
+            assert mock_fetch.call_count == 2
+
+    @pytest.mark.parametrize("error", [
+        LiquidApiUnavailableException("circuit open"),
+        RequestsConnectionError("reset"),
+    ])
+    def test_backfill_market_data_leaves_transport_errors_to_policy(self, liquid_client, error):
+        with patch.object(liquid_client, "_fetch_candles", side_effect=error) as mock_fetch:
+            with pytest.raises(type(error)):
+                liquid_client.backfill_market_data(
+                    "BTC$", "m", datetime(2023, 1, 1), datetime(2023, 1, 1, 12), retry_delay=0
+                )
+            assert mock_fetch.call_count == 1
+
+    def test_get_market_data_reads_through_store(self, liquid_client, tmp_path):
+        start = datetime(2023, 1, 1, tzinfo=timezone.utc)
+        requested = []
+
+        def fetch(symbol, duration, from_time, to_time):
+            requested.append((from_time, to_time))
+            minutes = int((to_time - from_time) / timedelta(minutes=1))
+            return [
+                Candle(symbol, duration, 1.0, 1.0, 1.0, 1.0, 1.0, from_time + timedelta(minutes=i))
+                for i in range(minutes + 1)
+            ]
+
+        with CandleStore(tmp_path / "candles.sqlite") as store:
+            liquid_client._candle_store = store
+            with patch.object(liquid_client, "_fetch_candles", side_effect=fetch):
+                first = liquid_client.get_market_data(
+                    "BTC$", "m", start, start + timedelta(minutes=10)
+                )
+                second = liquid_client.get_market_data(
+                    "BTC$", "m", start, start + timedelta(minutes=20)
+                )
+
+        assert len(first) == 11
+        assert len(second) == 21
+        assert requested == [
+            (start, start + timedelta(minutes=10)),
+            (start + timedelta(minutes=10), start + timedelta(minutes=20)),
+        ]
+
 
 class TestLiquidQueryLogic:
     def test_retry_on_auth_required(self, liquid_client):
         mock_response_fail = MagicMock()
-        mock_response_fail.text = '{"description": "Authorization required"}'
+        mock_response_fail.content = b'{"description": "Authorization required"}'
+        mock_response_fail.status_code = 401
 
         mock_response_success = MagicMock()
-        mock_response_success.text = '{"status": "ok"}'
+        mock_response_success.content = b'{"status": "ok"}'
         mock_response_success.ok = True
+        mock_response_success.status_code = 200
 
         with patch.object(
             liquid_client, "_get_session_token", return_value="new-token"
         ):
             with patch(
-                append_target_module("_request"),
+                append_target_module("_LiquidTransport.request"),
                 side_effect=[mock_response_fail, mock_response_success],
             ):
                 res = liquid_client._query(HTTPMethod.GET, "/test")
 
                 assert liquid_client._session_token == "new-token"
-                assert res == mock_response_success
+                assert res.json() == {"status": "ok"}
+
+    def test_retry_preserves_request(self, liquid_client):
+        mock_response_fail = MagicMock()
+        mock_response_fail.content = b'{"description": "Authorization required"}'
+        mock_response_fail.status_code = 401
+
+        mock_response_success = MagicMock()
+        mock_response_success.content = b'{"orders": []}'
+        mock_response_success.ok = True
+        mock_response_success.status_code = 200
+
+        with patch.object(
+            liquid_client, "_get_session_token", return_value="new-token"
+        ):
+            with patch(
+                append_target_module("_LiquidTransport.request"),
+                side_effect=[mock_response_fail, mock_response_success],
+            ) as mock_request:
+                liquid_client._query(
+                    HTTPMethod.GET, "/orders", {"a": 1}, params={"for-instrument": "BTC$"}
+                )
+
+                first, second = mock_request.call_args_list
+                assert first.kwargs["params"] == second.kwargs["params"]
+                assert first.kwargs["json"] == second.kwargs["json"]
+                assert second.kwargs["headers"]["Authorization"] == "DXAPI new-token"
+
+    def test_throttled_request_backs_off_and_retries(self, liquid_client):
+        throttled = MagicMock()
+        throttled.ok = False
+        throttled.status_code = 429
+        throttled.headers = {"Retry-After": "0"}
+        throttled.content = b'{"description": "Too many requests"}'
+
+        success = MagicMock()
+        success.ok = True
+        success.status_code = 200
+        success.headers = {}
+        success.content = b'{"events": []}'
+
+        with patch(
+            append_target_module("_LiquidTransport.request"),
+            side_effect=[throttled, success],
+        ) as mock_request, patch.object(
+            liquid_client._rate_limiter, "throttled"
+        ) as mock_throttled:
+            res = liquid_client._query(HTTPMethod.POST, "marketdata")
+
+        assert res.json() == {"events": []}
+        assert mock_request.call_count == 2
+        mock_throttled.assert_called_once_with("marketdata", 0.0)
+
+    def test_throttle_retries_are_bounded(self, liquid_client, mock_requests):
+        mock_requests.return_value.ok = False
+        mock_requests.return_value.status_code = 429
+        mock_requests.return_value.headers = {"Retry-After": "0"}
+        mock_requests.return_value.content = b"{}"
+        mock_requests.reset_mock()
+
+        with patch.object(
+            liquid_client._rate_limiter, "throttled"
+        ) as mock_throttled, patch.object(
+            liquid_client._circuit_breaker, "record_success"
+        ) as mock_success:
+            res = liquid_client._query(HTTPMethod.GET, "/test")
+
+        assert res.status_code == 429
+        assert mock_requests.call_count == 4
+        assert mock_throttled.call_count == 3
+        mock_success.assert_not_called()
+
+    def test_orders_are_not_resent_on_503_retry_after(self, liquid_client, mock_requests):
+        mock_requests.return_value.ok = False
+        mock_requests.return_value.status_code = 503
+        mock_requests.return_value.headers = {"Retry-After": "0"}
+        mock_requests.return_value.content = b"{}"
+        mock_requests.reset_mock()
+
+        with patch(append_target_module("_sleep")) as mock_sleep:
+            res = liquid_client._query(HTTPMethod.POST, "/accounts/x/orders")
+
+        assert res.status_code == 503
+        mock_requests.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    def test_idempotent_reads_retry_with_backoff(self, mock_requests):
+        mock_requests.return_value.content = json_body(MOCK_LOGIN_RESPONSE)
+        mock_requests.return_value.ok = True
+        client = Liquid(**MOCK_CREDS, retry_policy=RetryPolicy(base_delay=0.1, rng=lambda: 1.0))
+
+        server_error = MagicMock(ok=False, status_code=502, headers={}, content=b"{}")
+        success = MagicMock(ok=True, status_code=200, headers={}, content=b'{"events": []}')
+        mock_requests.side_effect = [Timeout("read timed out"), server_error, success]
+        mock_requests.reset_mock()
+
+        with patch(append_target_module("_sleep")) as mock_sleep:
+            res = client._query(HTTPMethod.POST, "marketdata")
+
+        assert res.json() == {"events": []}
+        assert mock_requests.call_count == 3
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.1, 0.2]
+        assert mock_requests.call_args.kwargs["timeout"] == 10.0
+
+    def test_retries_give_up_after_max_attempts(self, liquid_client, mock_requests):
+        mock_requests.side_effect = RequestsConnectionError("connection refused")
+        mock_requests.reset_mock()
+
+        with patch(append_target_module("_sleep")), pytest.raises(RequestsConnectionError):
+            liquid_client._query(HTTPMethod.GET, "/accounts/x/positions")
+
+        assert mock_requests.call_count == 3
+
+    def test_orders_are_never_retried(self, liquid_client, mock_requests):
+        mock_requests.side_effect = Timeout("read timed out")
+        mock_requests.reset_mock()
+
+        with patch(append_target_module("_sleep")) as mock_sleep, pytest.raises(Timeout):
+            liquid_client._query(HTTPMethod.POST, "/accounts/x/orders")
+
+        mock_requests.assert_called_once()
+        mock_sleep.assert_not_called()
+        assert mock_requests.call_args.kwargs["timeout"] == 10.0
+
+    def test_explicit_timeout_overrides_the_policy(self, liquid_client, mock_requests):
+        liquid_client._query(HTTPMethod.POST, "marketdata", timeout=42.0)
+        assert mock_requests.call_args.kwargs["timeout"] == 42.0
+
+    def test_open_circuit_fails_fast(self, mock_requests):
+        mock_requests.return_value.content = json_body(MOCK_LOGIN_RESPONSE)
+        mock_requests.return_value.ok = True
+        client = Liquid(
+            **MOCK_CREDS,
+            retry_policy=RetryPolicy(max_attempts=1),
+            circuit_breaker=CircuitBreaker(failure_threshold=2),
+        )
+        mock_requests.side_effect = Timeout("read timed out")
+        mock_requests.reset_mock()
+
+        for _ in range(2):
+            with pytest.raises(Timeout):
+                client._query(HTTPMethod.POST, "marketdata")
+        with pytest.raises(LiquidApiUnavailableException):
+            client._query(HTTPMethod.POST, "marketdata")
+
+        assert mock_requests.call_count == 2
+
+    def test_metrics_record_requests_and_retries(self, liquid_client, mock_requests):
+        server_error = MagicMock(ok=False, status_code=500, headers={}, content=b"{}")
+        success = MagicMock(ok=True, status_code=200, headers={}, content=b'{"events": []}')
+        mock_requests.side_effect = [server_error, success]
+
+        with patch(append_target_module("_sleep")):
+            liquid_client._query(HTTPMethod.POST, "marketdata")
+
+        snapshot = liquid_client.metrics.snapshot()
+        stats = snapshot.requests[("marketdata", "POST")]
+        assert stats.requests == 2
+        assert stats.errors == 1
+        assert stats.size.total == len(b"{}") + len(b'{"events": []}')
+        assert snapshot.counters[("retry", "marketdata")] == 1
+        assert snapshot.requests[("login", "POST")].requests == 1
+
+    def test_metrics_count_reauth_and_rejections(self, mock_requests):
+        mock_requests.return_value.content = json_body(MOCK_LOGIN_RESPONSE)
+        mock_requests.return_value.ok = True
+        metrics = InMemoryMetrics()
+        client = Liquid(
+            **MOCK_CREDS,
+            metrics=metrics,
+            retry_policy=RetryPolicy(max_attempts=1),
+            circuit_breaker=CircuitBreaker(failure_threshold=1),
+        )
+        auth_required = MagicMock(
+            ok=False,
+            status_code=401,
+            headers={},
+            content=b'{"description": "Authorization required"}',
+        )
+        login = MagicMock(
+            ok=True, status_code=200, headers={}, content=json_body(MOCK_LOGIN_RESPONSE)
+        )
+        success = MagicMock(ok=True, status_code=200, headers={}, content=b"{}")
+        mock_requests.side_effect = [auth_required, login, success]
+        client._query(HTTPMethod.GET, "/test")
+
+        mock_requests.side_effect = Timeout("read timed out")
+        with pytest.raises(Timeout):
+            client._query(HTTPMethod.GET, "/test")
+        with pytest.raises(LiquidApiUnavailableException):
+            client._query(HTTPMethod.GET, "/test")
+
+        assert metrics.snapshot().counters == {("reauth", "other"): 1, ("rejected", "other"): 1}
+        assert metrics.snapshot().requests[("other", "GET")].errors == 2
 
     def test_max_retries_exceeded(self, liquid_client):
         with pytest.raises(LiquidApiAuthException, match="too many retries"):
@@ -151,12 +586,30 @@ class TestLiquidQueryLogic:
     def test_query_request_failed_log(self, liquid_client, mock_requests):
         mock_requests.return_value.ok = False
         mock_requests.return_value.status_code = 500
-        mock_requests.return_value.text = json.dumps({"description": "Internal Error"})
+        mock_requests.return_value.content = json_body({"description": "Internal Error"})
 
-        res = liquid_client._query(HTTPMethod.GET, "/fail")
+        with patch(append_target_module("_sleep")):
+            res = liquid_client._query(HTTPMethod.GET, "/fail")
         assert res.ok is False
         assert res.status_code == 500
 
+    def test_query_decodes_body_once(self, liquid_client, mock_requests):
+        mock_requests.return_value.content = json_body({"events": []})
+
+        with patch(
+            "src.tickshock.relay.liquid._response._loads", wraps=json.loads
+        ) as mock_loads:
+            res = liquid_client._query(HTTPMethod.GET, "/events")
+            assert res.json() == {"events": []}
+            assert res.json() == {"events": []}
+            mock_loads.assert_called_once()
+
+    def test_query_non_json_body(self, liquid_client, mock_requests):
+        mock_requests.return_value.content = b"<html>gateway timeout</html>"
+
+        res = liquid_client._query(HTTPMethod.GET, "/html")
+        assert res.json() is None
+
 
 class TestLiquidInstrumentsAndPositions:
     def test_get_instruments_success(self, liquid_client):
@@ -185,6 +638,18 @@ class TestLiquidInstrumentsAndPositions:
             with pytest.raises(LiquidApiException, match="instruments not received"):
                 liquid_client.get_instruments()
 
+    def test_get_instrument_records_returns_raw_dicts(self, liquid_client):
+        record = {"symbol": "BTC$", "version": 3, "type": "PRODUCT"}
+        with patch.object(liquid_client, "_query") as mock_query:
+            mock_query.return_value.json.return_value = {"instruments": [record]}
+            assert liquid_client.get_instrument_records() == [record]
+
+    def test_get_instrument_records_exception(self, liquid_client):
+        with patch.object(liquid_client, "_query") as mock_query:
+            mock_query.return_value.json.return_value = {"instruments": None}
+            with pytest.raises(LiquidApiException, match="instruments not received"):
+                liquid_client.get_instrument_records()
+
     def test_get_open_positions_success(self, liquid_client):
         mock_position = {
             "symbol": "BTC$",
@@ -206,6 +671,22 @@ class TestLiquidInstrumentsAndPositions:
             assert len(positions) == 1
             assert positions[0].symbol == "BTC$"
 
+    def test_trusted_validation_level(self, mock_requests):
+        mock_requests.return_value.content = json_body(MOCK_LOGIN_RESPONSE)
+        mock_requests.return_value.ok = True
+        client = Liquid(**MOCK_CREDS, validation="trusted", validation_sample_rate=0.0)
+        quote = {
+            "type": "Quote",
+            "symbol": "BTC$",
+            "bid": 100.0,
+            "ask": 101.0,
+            "time": "2023-01-01T00:00:00Z",
+        }
+        with patch.object(client, "_query") as mock_query:
+            mock_query.return_value.json.return_value = {"events": [quote]}
+            quotes = client.get_quotes(["BTC$"])
+        assert quotes[0].time == datetime(2023, 1, 1, tzinfo=timezone.utc)
+
     def test_get_open_positions_exception(self, liquid_client):
         with patch.object(liquid_client, "_query") as mock_query:
             mock_query.return_value.json.return_value = {"wrong_key": []}
@@ -245,6 +726,80 @@ class TestLiquidOrders:
             with pytest.raises(LiquidApiException, match="not successful"):
                 liquid_client.place_order("BTC$", "LIMIT", "BUY", "OPEN", 1.0)
 
+    def test_place_orders_collects_results_and_errors(self, liquid_client):
+        orders = [
+            OrderSpec("BTC$", "MARKET", "BUY", "OPEN", 1.0),
+            OrderSpec("ETH$", "LIMIT", "SELL", "OPEN", 2.0, limit_price=10.0),
+            OrderSpec("AAPL", "MARKET", "BUY", "CLOSE", 3.0, position_code="pos1"),
+        ]
+
+        def place(symbol, *args):
+            if symbol == "ETH$":
+                raise LiquidApiException("rejected")
+            return (f"{symbol}-id", f"{symbol}-update")
+
+        with patch.object(liquid_client, "place_order", side_effect=place) as mock_place:
+            result = liquid_client.place_orders(orders, max_concurrency=3)
+
+        assert result.placed == {0: ("BTC$-id", "BTC$-update"), 2: ("AAPL-id", "AAPL-update")}
+        assert list(result.errors) == [1]
+        assert isinstance(result.errors[1], LiquidApiException)
+        mock_place.assert_any_call("ETH$", "LIMIT", "SELL", "OPEN", 2.0, None, 10.0, None)
+        assert mock_place.call_count == 3
+
+    def test_place_orders_records_unexpected_errors(self, liquid_client):
+        orders = [
+            OrderSpec("BTC$", "MARKET", "BUY", "OPEN", 1.0),
+            OrderSpec("ETH$", "MARKET", "BUY", "OPEN", 2.0),
+        ]
+
+        def place(symbol, *args):
+            if symbol == "ETH$":
+                raise KeyError("orderId")
+            return (f"{symbol}-id", f"{symbol}-update")
+
+        with patch.object(liquid_client, "place_order", side_effect=place):
+            result = liquid_client.place_orders(orders)
+
+        assert result.placed == {0: ("BTC$-id", "BTC$-update")}
+        assert isinstance(result.errors[1], KeyError)
+
+    @pytest.mark.parametrize("preserve_order, max_concurrency, expected_peak", [
+        (False, 3, 3),
+        (True, 3, 1),
+    ])
+    def test_place_orders_concurrency(
+        self, liquid_client, preserve_order, max_concurrency, expected_peak
+    ):
+        lock = threading.Lock()
+        in_flight, peak, submitted = [0], [0], []
+        barrier = threading.Barrier(expected_peak, timeout=5)
+
+        def place(symbol, *args):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+                submitted.append(args[3])
+            barrier.wait()
+            with lock:
+                in_flight[0] -= 1
+            return ("id", "update")
+
+        orders = [OrderSpec("BTC$", "MARKET", "BUY", "OPEN", float(i)) for i in range(6)]
+        with patch.object(liquid_client, "place_order", side_effect=place):
+            result = liquid_client.place_orders(
+                orders, max_concurrency=max_concurrency, preserve_order=preserve_order
+            )
+
+        assert len(result.placed) == 6
+        assert peak[0] == expected_peak
+        if preserve_order:
+            assert submitted == [float(i) for i in range(6)]
+
+    def test_place_orders_rejects_bad_concurrency(self, liquid_client):
+        with pytest.raises(ValueError, match="at least 1"):
+            liquid_client.place_orders([], max_concurrency=0)
+
     @pytest.mark.parametrize(
         "mock_response, symbol_arg, expected_match",
         [
@@ -265,6 +820,23 @@ class TestLiquidOrders:
             
             assert exc_info.value.args[1] == mock_response
 
+    def test_iter_order_history_params(self, liquid_client, mock_requests):
+        mock_requests.return_value.ok = True
+        mock_requests.return_value.iter_content.return_value = [b'{"orders": []}']
+
+        assert list(liquid_client.iter_order_history(symbol="ETHUSD")) == []
+        assert mock_requests.call_args.kwargs["params"] == {"for-instrument": "ETHUSD"}
+
+    def test_iter_order_history_validates_orders(self, liquid_client, mock_requests):
+        mock_requests.return_value.ok = True
+        mock_requests.return_value.iter_content.return_value = [b'{"orders": [{}]}']
+
+        with patch.object(liquid_client._validation, "order") as mock_order:
+            orders = list(liquid_client.iter_order_history(symbol="ETHUSD"))
+
+        mock_order.assert_called_once_with({})
+        assert orders == [mock_order.return_value]
+
     def test_get_order_history_params(self, liquid_client):
         with patch.object(liquid_client, "_query") as mock_query:
             mock_query.return_value.json.return_value = {"orders": []}
@@ -276,6 +848,66 @@ class TestLiquidOrders:
             assert kwargs["params"]["with-order-id"] == "PID-1"
 
 
+class TestLiquidTracing:
+    def test_get_quotes_reports_every_phase(self, mock_requests):
+        mock_requests.return_value.content = json_body(MOCK_LOGIN_RESPONSE)
+        mock_requests.return_value.ok = True
+        tracer = Tracer()
+        client = Liquid(**MOCK_CREDS, tracer=tracer)
+        mock_requests.return_value = MagicMock(
+            ok=True,
+            status_code=200,
+            headers={},
+            elapsed=timedelta(0),
+            content=json_body({"events": [MOCK_QUOTE]}),
+        )
+
+        quotes = client.get_quotes(["BTC$"])
+
+        assert len(quotes) == 1
+        (trace,) = tracer.traces()
+        assert trace.call == "get_quotes"
+        assert [span.phase for span in trace.spans] == [
+            "wait",
+            "download",
+            "decode",
+            "validate",
+            "convert",
+        ]
+        assert sum(trace.totals().values()) <= trace.seconds
+
+    def test_bulk_calls_trace_their_workers(self, mock_requests):
+        mock_requests.return_value.content = json_body(MOCK_LOGIN_RESPONSE)
+        mock_requests.return_value.ok = True
+        tracer = Tracer()
+        client = Liquid(**MOCK_CREDS, tracer=tracer)
+        mock_requests.return_value = MagicMock(
+            ok=True,
+            status_code=200,
+            headers={},
+            elapsed=timedelta(0),
+            content=json_body({"events": [MOCK_QUOTE]}),
+        )
+
+        client.get_quotes_bulk(["BTC$", "ETH$", "AAPL"], batch_size=1, max_workers=3)
+
+        (trace,) = tracer.traces()
+        assert trace.call == "get_quotes_bulk"
+        phases = [span.phase for span in trace.spans]
+        assert phases.count("wait") == 3
+        assert phases.count("download") == 3
+
+    def test_login_is_not_traced(self, mock_requests):
+        mock_requests.return_value.content = json_body(MOCK_LOGIN_RESPONSE)
+        mock_requests.return_value.ok = True
+        tracer = Tracer()
+
+        client = Liquid(**MOCK_CREDS, tracer=tracer)
+
+        assert client.tracer is tracer
+        assert tracer.traces() == []
+
+
 class TestLiquidQuotes:
     @pytest.mark.parametrize(
         "mock_response, expected_error",
@@ -318,3 +950,62 @@ class TestLiquidQuotes:
             assert quotes[0].symbol == "BTC$"
             assert quotes[1].symbol == "ETH$"
             mock_query.assert_called_once()
+
+    def test_get_quotes_bulk_partial_results(self, liquid_client):
+        def quote_event(symbol, bid=1.0):
+            return {
+                "type": "Quote",
+                "symbol": symbol,
+                "bid": bid,
+                "ask": 2.0,
+                "time": "2023-01-01T12:00:00Z",
+            }
+
+        def query(method, path, data):
+            batch = data["symbols"]
+            if "TSLA" in batch:
+                raise LiquidApiException("gateway timeout")
+            response = MagicMock()
+            response.json.return_value = {
+                "events": [
+                    quote_event(symbol, bid="stale" if symbol == "ETH$" else 1.0)
+                    for symbol in batch
+                    if symbol != "AAPL"
+                ]
+            }
+            return response
+
+        symbols = ["BTC$", "ETH$", "AAPL", "GOOG", "TSLA", "MSFT"]
+        with patch.object(liquid_client, "_query", side_effect=query) as mock_query:
+            result = liquid_client.get_quotes_bulk(symbols, batch_size=2)
+
+        assert mock_query.call_count == 3
+        assert set(result.quotes) == {"BTC$", "GOOG"}
+        assert set(result.errors) == {"ETH$", "AAPL", "TSLA", "MSFT"}
+        assert "invalid" in str(result.errors["ETH$"])
+        assert "not received" in str(result.errors["AAPL"])
+        assert "gateway timeout" in str(result.errors["TSLA"])
+
+    def test_get_quotes_bulk_trusted_bad_timestamp(self, mock_requests):
+        mock_requests.return_value.content = json_body(MOCK_LOGIN_RESPONSE)
+        mock_requests.return_value.ok = True
+        client = Liquid(**MOCK_CREDS, validation="trusted", validation_sample_rate=0.0)
+        events = [
+            {**MOCK_QUOTE, "symbol": "BTC$"},
+            {**MOCK_QUOTE, "symbol": "ETH$", "time": "yesterday"},
+        ]
+        with patch.object(client, "_query") as mock_query:
+            mock_query.return_value.json.return_value = {"events": events}
+            result = client.get_quotes_bulk(["BTC$", "ETH$"])
+
+        assert set(result.quotes) == {"BTC$"}
+        assert set(result.errors) == {"ETH$"}
+        assert "invalid" in str(result.errors["ETH$"])
+
+    def test_get_quotes_bulk_malformed_response(self, liquid_client):
+        with patch.object(liquid_client, "_query") as mock_query:
+            mock_query.return_value.json.return_value = {"not_events": []}
+            result = liquid_client.get_quotes_bulk(["BTC$", "ETH$"])
+
+        assert result.quotes == {}
+        assert set(result.errors) == {"BTC$", "ETH$"}
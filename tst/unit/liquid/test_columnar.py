@@ -0,0 +1,50 @@
+import pytest
+from src.tickshock.relay.liquid._columnar import candle_columns
+
+np = pytest.importorskip("numpy")
+
+EVENTS = [
+    {
+        "symbol": "BTC$",
+        "type": "Candle",
+        "candleType": "m",
+        "open": 100.0,
+        "high": 110.0,
+        "low": 90.0,
+        "close": 105.0,
+        "volume": 10.0,
+        "time": "2023-01-01T00:00:00Z",
+    },
+    {
+        "symbol": "BTC$",
+        "type": "Candle",
+        "candleType": "m",
+        "open": 105,
+        "high": 115,
+        "low": 95,
+        "close": 110,
+        "volume": 12,
+        "time": "2023-01-01T02:01:00+01:00",
+    },
+]
+
+
+def test_candle_columns():
+    columns = candle_columns("BTC$", "m", EVENTS)
+
+    assert columns.symbol == "BTC$"
+    assert columns.candle_type == "m"
+    assert columns.time.dtype == np.dtype("datetime64[us]")
+    assert columns.time.tolist()[1].isoformat() == "2023-01-01T01:01:00"
+    np.testing.assert_array_equal(columns.open, [100.0, 105.0])
+    np.testing.assert_array_equal(columns.high, [110.0, 115.0])
+    np.testing.assert_array_equal(columns.low, [90.0, 95.0])
+    np.testing.assert_array_equal(columns.close, [105.0, 110.0])
+    np.testing.assert_array_equal(columns.volume, [10.0, 12.0])
+    assert columns.close.dtype == np.float64
+
+
+def test_candle_columns_empty():
+    columns = candle_columns("BTC$", "m", [])
+    assert len(columns.time) == 0
+    assert len(columns.close) == 0
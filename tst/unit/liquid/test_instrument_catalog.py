@@ -0,0 +1,112 @@
+import threading
+import time
+import pytest
+from unittest.mock import MagicMock, patch
+from src.tickshock.relay.liquid import InstrumentCatalog
+
+
+def record(symbol, version, description="x"):
+    return {
+        "symbol": symbol,
+        "version": version,
+        "description": description,
+        "type": "FOREX",
+        "priceIncrement": 0.00001,
+        "pipSize": 0.0001,
+        "lotSize": 100000.0,
+        "multiplier": 1.0,
+        "currency": "USD",
+        "firstCurrency": "EUR",
+        "assetClass": "FX",
+        "tradingHours": [
+            {"weekDay": "Sunday, 21:00:00Z", "eventType": "SESSION_OPEN"},
+            {"weekDay": "Friday, 21:00:00Z", "eventType": "SESSION_CLOSE"},
+        ],
+    }
+
+
+@pytest.fixture
+def client():
+    mock = MagicMock()
+    mock.get_instrument_records.return_value = [record("EURUSD", 1), record("GBPUSD", 1)]
+    return mock
+
+
+class TestInstrumentCatalog:
+    def test_empty_without_file(self, tmp_path):
+        catalog = InstrumentCatalog(tmp_path / "instruments.json")
+        assert catalog.instruments == []
+
+    def test_refresh_persists_and_reloads_offline(self, tmp_path, client):
+        path = tmp_path / "instruments.json"
+        catalog = InstrumentCatalog(path, client)
+
+        assert catalog.refresh() == (2, 0)
+        assert {i.symbol for i in catalog.instruments} == {"EURUSD", "GBPUSD"}
+
+        offline = InstrumentCatalog(path)
+        assert {i.symbol for i in offline.instruments} == {"EURUSD", "GBPUSD"}
+        assert offline.get("EURUSD").currency == "USD"
+
+    def test_refresh_rebuilds_only_changed_versions(self, tmp_path, client):
+        catalog = InstrumentCatalog(tmp_path / "instruments.json", client)
+        catalog.refresh()
+        unchanged = catalog.get("EURUSD")
+
+        client.get_instrument_records.return_value = [record("EURUSD", 1), record("GBPUSD", 2)]
+        with patch.object(
+            InstrumentCatalog, "_build", wraps=InstrumentCatalog._build
+        ) as mock_build:
+            assert catalog.refresh() == (1, 0)
+            mock_build.assert_called_once()
+
+        assert catalog.get("EURUSD") is unchanged
+
+    def test_refresh_drops_removed_instruments(self, tmp_path, client):
+        path = tmp_path / "instruments.json"
+        catalog = InstrumentCatalog(path, client)
+        catalog.refresh()
+
+        client.get_instrument_records.return_value = [record("EURUSD", 1)]
+        assert catalog.refresh() == (0, 1)
+        assert InstrumentCatalog(path).get("GBPUSD") is None
+
+    def test_concurrent_refreshes_run_one_at_a_time(self, tmp_path, client):
+        lock = threading.Lock()
+        in_flight, peak = [0], [0]
+
+        def records():
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.05)
+            with lock:
+                in_flight[0] -= 1
+            return [record("EURUSD", 1), record("GBPUSD", 1)]
+
+        client.get_instrument_records.side_effect = records
+        path = tmp_path / "instruments.json"
+        catalog = InstrumentCatalog(path, client)
+        threads = [threading.Thread(target=catalog.refresh) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert peak[0] == 1
+        assert len(InstrumentCatalog(path).instruments) == 2
+
+    def test_refresh_without_client(self, tmp_path):
+        with pytest.raises(ValueError, match="no client"):
+            InstrumentCatalog(tmp_path / "instruments.json").refresh()
+
+    def test_background_refresh(self, tmp_path, client):
+        with InstrumentCatalog(
+            tmp_path / "instruments.json", client, refresh_interval=0.01
+        ) as catalog:
+            for _ in range(500):
+                if catalog.instruments:
+                    break
+                time.sleep(0.01)
+
+        assert len(catalog.instruments) == 2
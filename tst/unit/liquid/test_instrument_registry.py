@@ -0,0 +1,57 @@
+import pytest
+from src.tickshock.relay.liquid import InstrumentRegistry
+from src.tickshock.relay.liquid.types import InstrumentsDtoCollection
+
+
+def dto(symbol, instrument_type, **fields):
+    return {
+        "symbol": symbol,
+        "type": instrument_type,
+        "version": 1,
+        "description": symbol,
+        "priceIncrement": 0.01,
+        "pipSize": 0.01,
+        "lotSize": 1,
+        "multiplier": 1,
+        **fields,
+    }
+
+
+@pytest.fixture
+def registry():
+    collection = InstrumentsDtoCollection(
+        instruments=[
+            dto("EURUSD", "FOREX", currency="USD", firstCurrency="EUR", assetClass="FX",
+                priceIncrement=0.00001, pipSize=0.0001, lotSize=100000),
+            dto("EURGBP", "FOREX", currency="GBP", firstCurrency="EUR", assetClass="FX"),
+            dto("AAPL", "CFD_STOCK", currency="USD", assetClass="EQUITY"),
+            dto("BTC$", "PRODUCT"),
+        ]
+    )
+    return InstrumentRegistry(d.to_bo() for d in collection.instruments)
+
+
+class TestInstrumentRegistry:
+    def test_symbol_lookup(self, registry):
+        assert len(registry) == 4
+        assert "EURUSD" in registry
+        assert registry["EURUSD"].pip_size == 0.0001
+        assert registry["EURUSD"].lot_size == 100000
+        assert registry.get("GBPUSD") is None
+        with pytest.raises(KeyError):
+            registry["GBPUSD"]
+
+    def test_indexes(self, registry):
+        assert [i.symbol for i in registry.by_type("FOREX")] == ["EURUSD", "EURGBP"]
+        assert [i.symbol for i in registry.by_currency("USD")] == ["EURUSD", "AAPL"]
+        assert [i.symbol for i in registry.by_asset_class("EQUITY")] == ["AAPL"]
+        assert registry.by_type("CFD") == ()
+
+    def test_product_without_currency_is_not_indexed(self, registry):
+        assert registry["BTC$"].currency is None
+        assert registry["BTC$"].asset_class is None
+        assert registry.by_type("PRODUCT") == (registry["BTC$"],)
+
+    def test_duplicate_symbol(self, registry):
+        with pytest.raises(ValueError, match="duplicate instrument 'EURUSD'"):
+            InstrumentRegistry([registry["EURUSD"], registry["EURUSD"]])
@@ -0,0 +1,57 @@
+import pytest
+import json
+from src.tickshock.relay.liquid._json import (
+    iter_array,
+    loads,
+    JsonArrayNotFound,
+)
+
+PAYLOAD = {
+    "note": "text with \"events\": [ inside",
+    "events": [
+        {"i": i, "name": "é" * i, "nested": [1, {"bracket": "]"}]} for i in range(25)
+    ],
+    "tail": True,
+}
+
+
+def chunked(data: bytes, size: int):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 3, 17, 1024, 1 << 20])
+def test_iter_array_across_chunk_boundaries(size):
+    body = json.dumps(PAYLOAD, ensure_ascii=False).encode()
+    assert list(iter_array(chunked(body, size), "events")) == PAYLOAD["events"]
+
+
+def test_iter_array_is_lazy():
+    consumed = []
+
+    def chunks():
+        for chunk in chunked(json.dumps(PAYLOAD).encode(), 64):
+            consumed.append(chunk)
+            yield chunk
+
+    items = iter_array(chunks(), "events")
+    next(items)
+    assert len(consumed) < len(chunked(json.dumps(PAYLOAD).encode(), 64))
+
+
+def test_iter_array_empty():
+    assert list(iter_array([b'{"events": [ ]}'], "events")) == []
+
+
+def test_iter_array_missing_key_reports_payload():
+    with pytest.raises(JsonArrayNotFound) as exc_info:
+        list(iter_array([b'{"description": "Authorization required"}'], "events"))
+    assert exc_info.value.payload == {"description": "Authorization required"}
+
+
+def test_iter_array_truncated():
+    with pytest.raises(ValueError):
+        list(iter_array([b'{"events": [{"a": 1}, {"a"'], "events"))
+
+
+def test_loads_bytes():
+    assert loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
@@ -0,0 +1,93 @@
+import json
+import pytest
+from src.tickshock.relay.liquid import InMemoryMetrics, MetricsExporter, MetricsSink
+
+
+@pytest.fixture
+def metrics():
+    return InMemoryMetrics(latency_bounds=(0.1, 1.0), size_bounds=(100, 1000))
+
+
+class TestInMemoryMetrics:
+    def test_request_histograms_per_endpoint_and_method(self, metrics):
+        metrics.request("marketdata", "POST", 200, 0.05, 50)
+        metrics.request("marketdata", "POST", 200, 0.5, 500)
+        metrics.request("marketdata", "POST", 503, 2.0, 5000)
+        metrics.request("orders", "POST", None, 0.2, 0)
+
+        snapshot = metrics.snapshot()
+        stats = snapshot.requests[("marketdata", "POST")]
+        assert stats.requests == 3
+        assert stats.errors == 1
+        assert stats.latency.counts == (1, 1, 1)
+        assert stats.latency.max == 2.0
+        assert stats.latency.mean == pytest.approx(0.85)
+        assert stats.size.counts == (1, 1, 1)
+        assert stats.size.total == 5550
+        assert snapshot.requests[("orders", "POST")].errors == 1
+
+    def test_quantiles_report_bucket_upper_bounds(self, metrics):
+        for seconds in (0.01, 0.02, 0.03, 0.5, 3.0):
+            metrics.request("history", "GET", 200, seconds, 0)
+
+        latency = metrics.snapshot().requests[("history", "GET")].latency
+        assert latency.quantile(0.5) == 0.1
+        assert latency.quantile(0.8) == 1.0
+        assert latency.quantile(1.0) == 3.0
+        with pytest.raises(ValueError):
+            latency.quantile(1.5)
+
+    def test_counters(self, metrics):
+        metrics.increment("retry", "marketdata")
+        metrics.increment("retry", "marketdata")
+        metrics.increment("reauth", "other")
+
+        assert metrics.snapshot().counters == {("retry", "marketdata"): 2, ("reauth", "other"): 1}
+
+    def test_snapshot_is_detached(self, metrics):
+        metrics.request("other", "GET", 200, 0.01, 10)
+        snapshot = metrics.snapshot()
+        metrics.request("other", "GET", 200, 0.01, 10)
+        metrics.increment("retry", "other")
+
+        assert snapshot.requests[("other", "GET")].requests == 1
+        assert snapshot.counters == {}
+
+    def test_reset(self, metrics):
+        metrics.request("other", "GET", 200, 0.01, 10)
+        metrics.reset()
+        assert metrics.snapshot().requests == {}
+
+    def test_unsorted_bounds_are_rejected(self):
+        with pytest.raises(ValueError, match="sorted"):
+            InMemoryMetrics(latency_bounds=(1.0, 0.1))
+
+    def test_base_sink_ignores_everything(self):
+        sink = MetricsSink()
+        sink.request("other", "GET", 200, 0.01, 10)
+        sink.increment("retry", "other")
+
+
+class TestMetricsExporter:
+    def test_export_writes_json(self, metrics, tmp_path):
+        metrics.request("marketdata", "POST", 200, 0.05, 50)
+        metrics.increment("throttled", "marketdata")
+        path = tmp_path / "metrics" / "liquid.json"
+
+        MetricsExporter(metrics, path).export()
+
+        document = json.loads(path.read_text(encoding="utf-8"))
+        assert document["requests"][0]["endpoint"] == "marketdata"
+        assert document["requests"][0]["method"] == "POST"
+        assert document["requests"][0]["latency"]["counts"] == [1, 0, 0]
+        assert document["requests"][0]["latency"]["samples"] == 1
+        assert document["counters"] == [
+            {"counter": "throttled", "endpoint": "marketdata", "value": 1}
+        ]
+
+    def test_close_flushes_a_final_export(self, metrics, tmp_path):
+        path = tmp_path / "liquid.json"
+        with MetricsExporter(metrics, path, interval=60.0):
+            metrics.request("other", "GET", 200, 0.01, 10)
+
+        assert json.loads(path.read_text())["requests"][0]["requests"] == 1
@@ -0,0 +1,74 @@
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+from src.tickshock.relay.liquid import PositionTracker
+from src.tickshock.relay.liquid.types import Position
+
+
+def position(code, version, quantity=1.0):
+    return Position.from_json(
+        {
+            "symbol": "BTC$",
+            "quantity": quantity,
+            "side": "BUY",
+            "positionCode": code,
+            "account": "default:888",
+            "version": version,
+            "quantityNotional": 50000.0,
+            "openTime": datetime(2023, 1, 1, tzinfo=timezone.utc),
+            "openPrice": 50000.0,
+            "lastUpdateTime": datetime(2023, 1, 1, tzinfo=timezone.utc),
+            "marginRate": 0.0,
+        }
+    )
+
+
+class TestPositionTracker:
+    def test_first_snapshot_is_all_added(self):
+        tracker = PositionTracker()
+        delta = tracker.update([position("a", 1), position("b", 1)])
+
+        assert [p.position_code for p in delta.added] == ["a", "b"]
+        assert delta.changed == [] and delta.closed == []
+        assert set(tracker.snapshot()) == {"a", "b"}
+
+    def test_only_changed_versions_and_closed_positions(self):
+        tracker = PositionTracker()
+        unchanged = position("a", 1)
+        tracker.update([unchanged, position("b", 1), position("c", 1)])
+
+        delta = tracker.update([position("a", 1), position("b", 2, 3.0), position("d", 1)])
+
+        assert [p.position_code for p in delta.added] == ["d"]
+        assert [(p.position_code, p.quantity) for p in delta.changed] == [("b", 3.0)]
+        assert [p.position_code for p in delta.closed] == ["c"]
+        assert tracker.get("a") is unchanged
+        assert tracker.get("c") is None
+
+    def test_callbacks_receive_non_empty_deltas(self):
+        tracker = PositionTracker()
+        received = []
+        failing = MagicMock(side_effect=RuntimeError("boom"))
+        tracker.add_callback(failing)
+        tracker.add_callback(received.append)
+
+        tracker.update([position("a", 1)])
+        tracker.update([position("a", 1)])
+        tracker.remove_callback(failing)
+        tracker.update([])
+
+        assert [len(d.added) for d in received] == [1, 0]
+        assert [len(d.closed) for d in received] == [0, 1]
+        failing.assert_called_once()
+
+    def test_poll(self):
+        client = MagicMock()
+        client.get_open_positions.return_value = [position("a", 1)]
+        tracker = PositionTracker(client)
+
+        assert len(tracker.poll().added) == 1
+        assert tracker.poll() == ([], [], [])
+
+    def test_poll_without_client(self):
+        with pytest.raises(ValueError, match="no client"):
+            PositionTracker().poll()
@@ -0,0 +1,92 @@
+import pytest
+import time
+from datetime import datetime, timezone
+from threading import Event, Thread
+from unittest.mock import MagicMock
+from src.tickshock.relay.liquid import QuoteCache, QuoteCacheStats
+from src.tickshock.relay.liquid.exceptions import LiquidApiException
+from src.tickshock.relay.liquid.types import Quote
+
+MOCK_TIME = datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def make_client(release: Event = None):
+    client = MagicMock()
+
+    def get_quotes(symbols):
+        if release is not None:
+            release.wait(timeout=5)
+        return [Quote(symbol, 1.0, 2.0, MOCK_TIME) for symbol in symbols]
+
+    client.get_quotes.side_effect = get_quotes
+    return client
+
+
+class TestQuoteCache:
+    def test_hits_within_ttl(self, clock):
+        client = make_client()
+        cache = QuoteCache(client, ttl=0.5, clock=clock)
+
+        first = cache.get_quotes(["BTC$", "ETH$"])
+        clock.now = 0.4
+        second = cache.get_quotes(["ETH$", "BTC$"])
+
+        assert client.get_quotes.call_count == 1
+        assert [q.symbol for q in second] == ["ETH$", "BTC$"]
+        assert second[1] is first[0]
+        assert cache.stats() == QuoteCacheStats(hits=2, misses=2, coalesced=0)
+
+    def test_expired_symbols_are_refetched(self, clock):
+        client = make_client()
+        cache = QuoteCache(client, ttl=0.5, symbol_ttls={"BTC$": 10.0}, clock=clock)
+
+        cache.get_quotes(["BTC$", "ETH$"])
+        clock.now = 1.0
+        cache.get_quotes(["BTC$", "ETH$"])
+
+        client.get_quotes.assert_called_with(["ETH$"])
+        assert cache.stats() == QuoteCacheStats(hits=1, misses=3, coalesced=0)
+
+    def test_concurrent_requests_are_coalesced(self):
+        release = Event()
+        client = make_client(release)
+        cache = QuoteCache(client, ttl=10.0)
+        results = []
+
+        threads = [
+            Thread(target=lambda: results.append(cache.get_quotes(["BTC$"])))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert client.get_quotes.call_count == 1
+        assert len(results) == 5
+        assert cache.stats().coalesced + cache.stats().hits == 4
+
+    def test_failure_propagates_and_is_not_cached(self):
+        client = MagicMock()
+        client.get_quotes.side_effect = LiquidApiException("boom")
+        cache = QuoteCache(client)
+
+        with pytest.raises(LiquidApiException, match="boom"):
+            cache.get_quotes(["BTC$"])
+        with pytest.raises(LiquidApiException, match="boom"):
+            cache.get_quotes(["BTC$"])
+
+        assert client.get_quotes.call_count == 2
+        assert cache._in_flight == {}
+
+    def test_invalidate(self):
+        client = make_client()
+        cache = QuoteCache(client, ttl=10.0)
+
+        cache.get_quotes(["BTC$"])
+        cache.invalidate(["BTC$"])
+        cache.get_quotes(["BTC$"])
+
+        assert client.get_quotes.call_count == 2
@@ -0,0 +1,134 @@
+import pytest
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from unittest.mock import MagicMock
+from src.tickshock.relay.liquid import Liquid, QuoteFeed
+from src.tickshock.relay.liquid.types import Quote, QuoteBatchResult
+
+MOCK_TIME = datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+class StandInBroker(BaseHTTPRequestHandler):
+    ticks = 0
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if self.path.endswith("/login"):
+            payload = {"sessionToken": "local-token"}
+        else:
+            StandInBroker.ticks += 1
+            payload = {
+                "events": [
+                    {
+                        "type": "Quote",
+                        "symbol": symbol,
+                        "bid": 100.0 + StandInBroker.ticks,
+                        "ask": 101.0 + StandInBroker.ticks,
+                        "time": (MOCK_TIME + timedelta(seconds=StandInBroker.ticks)).isoformat(),
+                    }
+                    for symbol in body["symbols"]
+                ]
+            }
+        data = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def broker_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInBroker)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestQuoteFeed:
+    def test_polls_local_stand_in_server(self, broker_url):
+        received = []
+        with Liquid("user", "pw", broker_url, "888") as client:
+            with QuoteFeed(client, ["BTC$", "ETH$"], min_interval=0.01) as feed:
+                feed.add_callback(received.append)
+                assert wait_for(lambda: len(received) >= 4)
+                latest = feed.latest("BTC$")
+
+        assert latest is not None
+        assert latest.bid > 100.0
+        assert set(feed.snapshot()) == {"BTC$", "ETH$"}
+
+    def test_interval_backs_off_without_changes(self):
+        client = MagicMock()
+        quote = Quote("BTC$", 1.0, 2.0, MOCK_TIME)
+        client.get_quotes_bulk.return_value = QuoteBatchResult({"BTC$": quote}, {})
+        feed = QuoteFeed(client, ["BTC$"], min_interval=0.1, max_interval=0.3, backoff=2.0)
+
+        feed._poll_and_reschedule()
+        assert feed.interval == 0.1
+        feed._poll_and_reschedule()
+        assert feed.interval == 0.2
+        feed._poll_and_reschedule()
+        assert feed.interval == 0.3
+        assert len(feed._scheduler.queue) == 3
+        feed.close()
+        assert feed._scheduler.queue == []
+
+    def test_push_channel(self):
+        channel = MagicMock()
+        client = MagicMock()
+        feed = QuoteFeed(client, ["BTC$"], channel=channel).start()
+
+        (symbols, on_quote), _ = channel.subscribe.call_args
+        assert symbols == ["BTC$"]
+        on_quote(Quote("BTC$", 1.0, 2.0, MOCK_TIME))
+        on_quote(Quote("BTC$", 0.5, 1.5, MOCK_TIME - timedelta(seconds=1)))
+        on_quote(Quote("ETH$", 1.0, 2.0, MOCK_TIME))
+
+        assert feed.latest("BTC$").bid == 1.0
+        assert feed.latest("ETH$") is None
+        client.get_quotes_bulk.assert_not_called()
+        feed.close()
+        channel.close.assert_called_once()
+
+    def test_callback_errors_are_isolated(self):
+        feed = QuoteFeed(MagicMock(), ["BTC$"])
+        good = MagicMock()
+        feed.add_callback(MagicMock(side_effect=RuntimeError("boom")))
+        feed.add_callback(good)
+
+        feed._on_quote(Quote("BTC$", 1.0, 2.0, MOCK_TIME))
+
+        good.assert_called_once()
+
+    def test_poll_skips_symbols_unsubscribed_meanwhile(self):
+        client = MagicMock()
+        feed = QuoteFeed(client, ["BTC$", "ETH$"])
+
+        def get_quotes_bulk(symbols):
+            feed.unsubscribe(["ETH$"])
+            return QuoteBatchResult(
+                {symbol: Quote(symbol, 1.0, 2.0, MOCK_TIME) for symbol in symbols}, {}
+            )
+
+        client.get_quotes_bulk.side_effect = get_quotes_bulk
+
+        assert feed.poll()
+        assert set(feed.snapshot()) == {"BTC$"}
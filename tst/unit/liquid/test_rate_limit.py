@@ -0,0 +1,111 @@
+import asyncio
+import pytest
+from src.tickshock.relay.liquid import RateLimiter, RateBudget
+from src.tickshock.relay.liquid import _protocol
+
+
+def limiter(clock, **kwargs):
+    budgets = {"marketdata": RateBudget(2.0, 2.0), "orders": RateBudget(1.0, 3.0)}
+    return RateLimiter(
+        budgets, total=RateBudget(10.0, 4.0), orders_reserve=2.0, clock=clock, **kwargs
+    )
+
+
+class TestRateLimiter:
+    def test_burst_then_refill(self, clock):
+        rate_limiter = limiter(clock)
+
+        assert rate_limiter.reserve("marketdata") == 0
+        assert rate_limiter.reserve("marketdata") == 0
+        assert rate_limiter.reserve("marketdata") == pytest.approx(0.5)
+
+        clock.now = 0.5
+        assert rate_limiter.reserve("marketdata") == 0
+
+    def test_orders_reserve_is_not_available_to_data(self, clock):
+        rate_limiter = limiter(clock)
+        rate_limiter.reserve("marketdata")
+        rate_limiter.reserve("history")
+
+        assert rate_limiter.reserve("other") > 0
+        assert rate_limiter.reserve("orders") == 0
+        assert rate_limiter.reserve("orders") == 0
+        assert rate_limiter.reserve("orders") > 0
+
+    def test_throttle_blocks_and_slows_down(self, clock):
+        rate_limiter = limiter(clock)
+
+        rate_limiter.throttled("marketdata", retry_after=3.0)
+
+        assert rate_limiter.rate("marketdata") == 1.0
+        assert rate_limiter.reserve("marketdata") == pytest.approx(3.0)
+        assert rate_limiter.reserve("orders") == 0
+
+        clock.now = 3.0
+        assert rate_limiter.reserve("marketdata") == 0
+
+    def test_rate_recovers_after_successes(self, clock):
+        rate_limiter = limiter(clock, min_rate_ratio=0.25)
+        for _ in range(5):
+            rate_limiter.throttled("marketdata")
+        assert rate_limiter.rate("marketdata") == 0.5
+
+        for _ in range(20):
+            rate_limiter.succeeded("marketdata")
+        assert rate_limiter.rate("marketdata") == 2.0
+
+    def test_acquire_async_waits(self):
+        rate_limiter = RateLimiter({"history": RateBudget(50.0, 1.0)})
+
+        async def run():
+            for _ in range(3):
+                await rate_limiter.acquire_async("history")
+
+        asyncio.run(run())
+        assert rate_limiter.reserve("history") > 0
+
+    def test_invalid_reserve(self):
+        with pytest.raises(ValueError, match="orders_reserve"):
+            RateLimiter(total=RateBudget(10.0, 5.0), orders_reserve=5.0)
+
+
+@pytest.mark.parametrize(
+    "path, endpoint",
+    [
+        ("/login", "login"),
+        ("marketdata", "marketdata"),
+        ("accounts/default%3A1/orders", "orders"),
+        ("accounts/default%3A1/orders/history", "history"),
+        ("accounts/default%3A1/positions", "other"),
+        ("instruments/query", "other"),
+    ],
+)
+def test_endpoint_for(path, endpoint):
+    assert _protocol.endpoint_for(path) == endpoint
+
+
+@pytest.mark.parametrize(
+    "endpoint, status_code, headers, expected",
+    [
+        ("marketdata", 429, {}, True),
+        ("marketdata", 503, {"Retry-After": "1"}, True),
+        ("marketdata", 503, {}, False),
+        ("orders", 429, {}, True),
+        ("orders", 503, {"Retry-After": "1"}, False),
+    ],
+)
+def test_is_throttled(endpoint, status_code, headers, expected):
+    assert _protocol.is_throttled(endpoint, status_code, headers) is expected
+
+
+@pytest.mark.parametrize(
+    "headers, expected",
+    [
+        ({}, None),
+        ({"Retry-After": "2"}, 2.0),
+        ({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, 0.0),
+        ({"Retry-After": "soon"}, None),
+    ],
+)
+def test_retry_after(headers, expected):
+    assert _protocol.retry_after(headers) == expected
@@ -0,0 +1,93 @@
+import pytest
+from src.tickshock.relay.liquid import RetryPolicy, CircuitBreaker
+from src.tickshock.relay.liquid.exceptions import LiquidApiUnavailableException
+
+
+class TestRetryPolicy:
+    def test_backoff_grows_exponentially_up_to_the_cap(self):
+        policy = RetryPolicy(max_attempts=6, base_delay=0.5, max_delay=2.0, rng=lambda: 1.0)
+
+        assert [policy.backoff("marketdata", failures) for failures in range(1, 6)] == [
+            0.5,
+            1.0,
+            2.0,
+            2.0,
+            2.0,
+        ]
+        assert policy.backoff("marketdata", 6) is None
+
+    def test_backoff_is_jittered(self):
+        policy = RetryPolicy(base_delay=1.0, rng=lambda: 0.25)
+        assert policy.backoff("history", 2) == pytest.approx(0.5)
+
+    @pytest.mark.parametrize("endpoint", ["orders", "login"])
+    def test_non_idempotent_endpoints_are_not_retried(self, endpoint):
+        assert RetryPolicy().backoff(endpoint, 1) is None
+
+    def test_orders_can_not_be_made_retryable(self):
+        with pytest.raises(ValueError, match="not idempotent"):
+            RetryPolicy(retry_endpoints=("marketdata", "orders"))
+
+    def test_timeouts_per_endpoint(self):
+        policy = RetryPolicy(timeouts={"marketdata": 2.5})
+        assert policy.timeout("marketdata") == 2.5
+        assert policy.timeout("history") == 30.0
+        assert policy.timeout("orders") == 10.0
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+        with pytest.raises(ValueError):
+            RetryPolicy(base_delay=2.0, max_delay=1.0)
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self, clock):
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10.0, clock=clock)
+        for _ in range(2):
+            breaker.record_failure("marketdata")
+        breaker.before_call("marketdata")
+        assert breaker.state("marketdata") == "closed"
+
+        breaker.record_failure("marketdata")
+
+        assert breaker.state("marketdata") == "open"
+        with pytest.raises(LiquidApiUnavailableException, match="marketdata"):
+            breaker.before_call("marketdata")
+        breaker.before_call("orders")
+
+    def test_success_resets_the_failure_count(self, clock):
+        breaker = CircuitBreaker(failure_threshold=2, clock=clock)
+        breaker.record_failure("history")
+        breaker.record_success("history")
+        breaker.record_failure("history")
+        assert breaker.state("history") == "closed"
+
+    def test_half_open_lets_a_single_probe_through(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0, clock=clock)
+        breaker.record_failure("marketdata")
+
+        clock.now = 10.0
+        assert breaker.state("marketdata") == "half-open"
+        breaker.before_call("marketdata")
+        with pytest.raises(LiquidApiUnavailableException):
+            breaker.before_call("marketdata")
+
+        breaker.record_success("marketdata")
+        assert breaker.state("marketdata") == "closed"
+        breaker.before_call("marketdata")
+
+    def test_failed_probe_reopens(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0, clock=clock)
+        breaker.record_failure("marketdata")
+        clock.now = 10.0
+        breaker.before_call("marketdata")
+
+        clock.now = 12.0
+        breaker.record_failure("marketdata")
+
+        clock.now = 21.0
+        with pytest.raises(LiquidApiUnavailableException):
+            breaker.before_call("marketdata")
+        clock.now = 22.0
+        breaker.before_call("marketdata")
@@ -0,0 +1,120 @@
+import asyncio
+import pytest
+from src.tickshock.relay.liquid import Tracer
+from src.tickshock.relay.liquid import _tracing
+
+
+class Client:
+    def __init__(self, tracer):
+        self.tracer = tracer
+
+    @_tracing.traced
+    def outer(self):
+        with _tracing.phase("decode"):
+            pass
+        return self.inner()
+
+    @_tracing.traced
+    def inner(self):
+        with _tracing.phase("validate"):
+            return "done"
+
+    @_tracing.traced
+    def fail(self):
+        with _tracing.phase("convert"):
+            raise ValueError("broken")
+
+    @_tracing.traced_async
+    async def fetch(self):
+        with _tracing.phase("decode"):
+            await asyncio.sleep(0)
+        return "fetched"
+
+
+class TestTracer:
+    def test_records_phases_per_call(self):
+        tracer = Tracer()
+
+        assert Client(tracer).outer() == "done"
+
+        (trace,) = tracer.traces()
+        assert trace.call == "outer"
+        assert [span.phase for span in trace.spans] == ["decode", "validate"]
+        assert all(0 <= span.offset <= trace.seconds for span in trace.spans)
+        assert set(trace.totals()) == {"decode", "validate"}
+
+    def test_disabled_tracing_records_nothing(self):
+        assert Client(None).outer() == "done"
+        assert _tracing.active() is None
+        with _tracing.phase("decode"):
+            pass
+
+    def test_failed_calls_are_still_traced(self):
+        tracer = Tracer()
+
+        with pytest.raises(ValueError):
+            Client(tracer).fail()
+
+        (trace,) = tracer.traces()
+        assert [span.phase for span in trace.spans] == ["convert"]
+        assert _tracing.active() is None
+
+    def test_callback_receives_traces(self, caplog):
+        received = []
+
+        def callback(trace):
+            received.append(trace)
+            raise RuntimeError("exporter down")
+
+        Client(Tracer(callback, max_traces=0)).inner()
+
+        assert [trace.call for trace in received] == ["inner"]
+        assert "Trace callback failed" in caplog.text
+
+    def test_keeps_the_latest_traces(self):
+        tracer = Tracer(max_traces=2)
+        client = Client(tracer)
+        for _ in range(3):
+            client.inner()
+        assert len(tracer.traces()) == 2
+        tracer.clear()
+        assert tracer.traces() == []
+
+    def test_async_calls(self):
+        tracer = Tracer()
+
+        assert asyncio.run(Client(tracer).fetch()) == "fetched"
+
+        (trace,) = tracer.traces()
+        assert trace.call == "fetch"
+        assert [span.phase for span in trace.spans] == ["decode"]
+
+
+class TestHttpcoreTrace:
+    def test_maps_httpcore_events_to_phases(self):
+        trace = _tracing.Trace("get_quotes")
+        on_event = _tracing.httpcore_trace(trace)
+
+        async def replay():
+            for step in (
+                "connection.connect_tcp",
+                "connection.start_tls",
+                "http11.send_request_headers",
+                "http11.send_request_body",
+                "http11.receive_response_headers",
+                "http11.receive_response_body",
+                "http11.response_closed",
+            ):
+                await on_event(f"{step}.started", {})
+                await on_event(f"{step}.complete", {})
+
+        asyncio.run(replay())
+
+        assert [span.phase for span in trace.spans] == [
+            "connect",
+            "connect",
+            "send",
+            "send",
+            "wait",
+            "download",
+        ]
@@ -0,0 +1,141 @@
+import pytest
+from datetime import datetime, time, timedelta, timezone
+from unittest.mock import MagicMock
+from src.tickshock.relay.liquid import TradingCalendar
+from src.tickshock.relay.liquid.types import TradingHour, Session
+
+UTC = timezone.utc
+
+FOREX_WEEK = [
+    TradingHour.const("Sunday", time(21, 0), "SESSION_OPEN"),
+    TradingHour.const("Friday", time(21, 0), "SESSION_CLOSE"),
+]
+STOCK_DAYS = [
+    hour
+    for day in ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday")
+    for hour in (
+        TradingHour.const(day, time(13, 30), "SESSION_OPEN"),
+        TradingHour.const(day, time(20, 0), "SESSION_CLOSE"),
+    )
+]
+
+
+def instrument(trading_hours):
+    mock = MagicMock()
+    mock.trading_hours = trading_hours
+    return mock
+
+
+class TestTradingCalendar:
+    @pytest.mark.parametrize(
+        "at, expected",
+        [
+            (datetime(2023, 10, 25, 12, 0, tzinfo=UTC), True),
+            (datetime(2023, 10, 27, 20, 59, tzinfo=UTC), True),
+            (datetime(2023, 10, 27, 21, 0, tzinfo=UTC), False),
+            (datetime(2023, 10, 28, 12, 0, tzinfo=UTC), False),
+            (datetime(2023, 10, 29, 21, 0, tzinfo=UTC), True),
+        ],
+    )
+    def test_is_open_across_weekend(self, at, expected):
+        assert TradingCalendar(FOREX_WEEK).is_open(at) is expected
+
+    def test_next_open_and_close(self):
+        calendar = TradingCalendar(STOCK_DAYS)
+        friday_evening = datetime(2023, 10, 27, 20, 0, tzinfo=UTC)
+
+        assert not calendar.is_open(friday_evening)
+        assert calendar.next_open(friday_evening) == datetime(2023, 10, 30, 13, 30, tzinfo=UTC)
+        assert calendar.next_close(friday_evening) == datetime(2023, 10, 30, 20, 0, tzinfo=UTC)
+        assert calendar.next_close(datetime(2023, 10, 27, 15, 0, tzinfo=UTC)) == friday_evening
+
+    def test_naive_datetimes_are_utc(self):
+        assert TradingCalendar(STOCK_DAYS).is_open(datetime(2023, 10, 25, 14, 0))
+
+    def test_matches_sessions(self):
+        calendar = TradingCalendar(STOCK_DAYS)
+        focal = datetime(2023, 10, 25, 12, 0, tzinfo=UTC)
+        for session in Session.create_sessions(STOCK_DAYS, focal):
+            assert calendar.is_open(session.open_time)
+            assert not calendar.is_open(session.close_time)
+
+    def test_window_moves_forward_and_back(self):
+        calendar = TradingCalendar(FOREX_WEEK, horizon=timedelta(weeks=1))
+        start = datetime(2023, 10, 25, 12, 0, tzinfo=UTC)
+        for week in range(0, 60, 3):
+            assert calendar.is_open(start + timedelta(weeks=week))
+        assert calendar.is_open(start - timedelta(weeks=520))
+        assert not calendar.is_open(datetime(2024, 6, 1, tzinfo=UTC))
+
+    def test_without_trading_hours(self):
+        calendar = TradingCalendar(None)
+        now = datetime(2023, 10, 28, tzinfo=UTC)
+        assert calendar.always_open
+        assert calendar.is_open(now)
+        assert calendar.next_open(now) is None
+        assert calendar.next_close(now) is None
+
+    def test_shared_across_identical_schedules(self):
+        first = TradingCalendar.for_instrument(instrument(list(STOCK_DAYS)))
+        second = TradingCalendar.for_instrument(instrument(list(STOCK_DAYS)))
+        other = TradingCalendar.for_instrument(instrument(FOREX_WEEK))
+
+        assert first is second
+        assert first is not other
+
+    @pytest.mark.parametrize(
+        "trading_hours, message",
+        [
+            (FOREX_WEEK[:1], "open/close pairs"),
+            (FOREX_WEEK[::-1], "sessions need to begin and end"),
+        ],
+    )
+    def test_invalid_schedules(self, trading_hours, message):
+        with pytest.raises(ValueError, match=message):
+            TradingCalendar(trading_hours)
+
+    def test_horizon_too_short(self):
+        with pytest.raises(ValueError, match="at least one week"):
+            TradingCalendar(FOREX_WEEK, horizon=timedelta(days=1))
+
+
+class TestVectorizedSessions:
+    @pytest.fixture
+    def np(self):
+        return pytest.importorskip("numpy")
+
+    def test_mask_matches_scalar_queries(self, np):
+        calendar = TradingCalendar(STOCK_DAYS)
+        times = np.arange(
+            np.datetime64("2023-10-20T00:00"),
+            np.datetime64("2023-11-10T00:00"),
+            np.timedelta64(17, "m"),
+        )
+        expected = [
+            calendar.is_open(value.astype(datetime).replace(tzinfo=UTC)) for value in times
+        ]
+        np.testing.assert_array_equal(calendar.session_mask(times), expected)
+
+    def test_session_ids_follow_sessions_across_week_end(self, np):
+        calendar = TradingCalendar(FOREX_WEEK)
+        times = np.array(
+            [
+                "2023-10-22T20:59",
+                "2023-10-22T21:00",
+                "2023-10-25T12:00",
+                "2023-10-27T20:59",
+                "2023-10-28T12:00",
+                "2023-10-29T21:30",
+            ],
+            dtype="datetime64[us]",
+        )
+        ids = calendar.session_ids(times)
+
+        assert ids[0] == -1
+        assert ids[1] == ids[2] == ids[3] >= 0
+        assert ids[4] == -1
+        assert ids[5] == ids[1] + 1
+
+    def test_without_trading_hours(self, np):
+        times = np.array(["2023-10-28T12:00"], dtype="datetime64[us]")
+        assert TradingCalendar(None).session_mask(times).tolist() == [True]
@@ -0,0 +1,57 @@
+import pytest
+from unittest.mock import patch
+from src.tickshock.relay.liquid import LiquidTransport
+
+
+class TestLiquidTransport:
+    def test_pool_configuration(self):
+        with LiquidTransport(max_connections_per_host=5) as transport:
+            adapter = transport._session.get_adapter("https://api.test.com")
+            assert adapter._pool_connections == 1
+            assert adapter._pool_maxsize == 5
+
+    def test_keep_alive_disabled(self):
+        with LiquidTransport(keep_alive=False) as transport:
+            assert transport._session.headers["Connection"] == "close"
+
+    def test_invalid_pool_configuration(self):
+        with pytest.raises(ValueError):
+            LiquidTransport(max_connections_per_host=0)
+
+    def test_request_uses_session(self):
+        with LiquidTransport() as transport:
+            with patch.object(transport._session, "request") as mock_request:
+                transport.request("GET", "https://api.test.com/x", timeout=1)
+                mock_request.assert_called_once_with(
+                    method="GET", url="https://api.test.com/x", timeout=1
+                )
+
+    def test_request_after_close_raises(self):
+        transport = LiquidTransport()
+        transport.close()
+        with pytest.raises(RuntimeError, match="transport is closed"):
+            transport.request("GET", "https://api.test.com/x")
+
+    def test_shared_per_base_url(self):
+        first = LiquidTransport.shared("https://a.test.com")
+        second = LiquidTransport.shared("https://a.test.com")
+        other = LiquidTransport.shared("https://b.test.com")
+
+        assert first is second
+        assert first is not other
+
+        first.close()
+        other.close()
+        assert LiquidTransport.shared("https://a.test.com") is not first
+        LiquidTransport.shared("https://a.test.com").close()
+
+    def test_shared_warns_about_ignored_options(self, caplog):
+        url = "https://c.test.com"
+        first = LiquidTransport.shared(url, max_connections_per_host=4)
+        try:
+            assert LiquidTransport.shared(url, max_connections_per_host=4) is first
+            assert "ignoring" not in caplog.text
+            assert LiquidTransport.shared(url, keep_alive=False) is first
+            assert "ignoring keep_alive" in caplog.text
+        finally:
+            first.close()
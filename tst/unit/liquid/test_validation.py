@@ -0,0 +1,93 @@
+import pytest
+from datetime import datetime, timezone
+from pydantic import ValidationError
+from src.tickshock.relay.liquid._validation import Validation
+
+MOCK_TIME = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+CANDLES = [
+    {
+        "symbol": "BTC$",
+        "type": "Candle",
+        "candleType": "m",
+        "open": 100.0,
+        "close": 105.0,
+        "high": 110.0,
+        "low": 95.0,
+        "volume": 1000.0,
+        "time": "2023-01-01T00:00:00Z",
+    }
+]
+QUOTES = [
+    {"type": "Quote", "symbol": "BTC$", "bid": 100.0, "ask": 101.0, "time": "2023-01-01T00:00:00Z"}
+]
+POSITIONS = [
+    {
+        "symbol": "BTC$",
+        "quantity": 1.0,
+        "side": "BUY",
+        "positionCode": "pos123",
+        "account": "default:888",
+        "version": 1,
+        "quantityNotional": 50000.0,
+        "openTime": "2023-01-01T00:00:00Z",
+        "openPrice": 50000.0,
+        "lastUpdateTime": "2023-01-01T00:00:00Z",
+        "marginRate": 0.0,
+    }
+]
+
+
+def fields(obj):
+    return {name: getattr(obj, name) for name in type(obj).__slots__}
+
+
+def never():
+    return 0.99
+
+
+def always():
+    return 0.0
+
+
+@pytest.fixture
+def trusted():
+    return Validation("trusted", sample_rate=0.01, rng=never)
+
+
+class TestValidation:
+    def test_trusted_matches_strict(self, trusted):
+        strict = Validation()
+
+        assert trusted.candles(CANDLES) == strict.candles(CANDLES)
+        assert fields(trusted.quotes(QUOTES)[0]) == fields(strict.quotes(QUOTES)[0])
+        assert fields(trusted.positions(POSITIONS)[0]) == fields(strict.positions(POSITIONS)[0])
+        assert trusted.candle(CANDLES[0]).time == MOCK_TIME
+        assert trusted.quote(QUOTES[0]).time == MOCK_TIME
+
+    def test_trusted_skips_validation_when_not_sampled(self, trusted):
+        quotes = trusted.quotes([{**QUOTES[0], "symbol": "NOPE"}])
+        assert quotes[0].symbol == "NOPE"
+
+    def test_sampled_validation_catches_drift(self):
+        validation = Validation("trusted", sample_rate=0.01, rng=always)
+        with pytest.raises(ValidationError):
+            validation.quotes([{**QUOTES[0], "symbol": "NOPE"}])
+        with pytest.raises(ValidationError):
+            validation.candle({**CANDLES[0], "open": "not a number"})
+
+    def test_strict_validates_everything(self):
+        with pytest.raises(ValidationError):
+            Validation("strict", rng=never).quotes([{**QUOTES[0], "symbol": "NOPE"}])
+
+    def test_trusted_keeps_candle_rules(self, trusted):
+        with pytest.raises(Exception, match="up to a 1-week interval"):
+            trusted.candles([{**CANDLES[0], "candleType": "mo"}])
+
+    @pytest.mark.parametrize(
+        "level, sample_rate, message",
+        [("fast", 0.01, "unknown validation level"), ("trusted", 1.5, "between 0 and 1")],
+    )
+    def test_invalid_configuration(self, level, sample_rate, message):
+        with pytest.raises(ValueError, match=message):
+            Validation(level, sample_rate)
@@ -0,0 +1,63 @@
+from datetime import datetime, timezone
+from src.tickshock.relay.liquid.types import Quote, Position
+from src.tickshock.relay.liquid.types._quote import QuoteDto
+from src.tickshock.relay.liquid.types._position import _PositionDto
+
+QUOTE_EVENT = {
+    "type": "Quote",
+    "symbol": "BTC$",
+    "bid": 100.0,
+    "ask": 101.0,
+    "time": "2023-01-01T00:00:00Z",
+}
+POSITION_JSON = {
+    "symbol": "BTC$",
+    "quantity": 1.0,
+    "side": "BUY",
+    "positionCode": "pos123",
+    "account": "default:888",
+    "version": 1,
+    "quantityNotional": 50000.0,
+    "openTime": "2023-01-01T00:00:00Z",
+    "openPrice": 50000.0,
+    "lastUpdateTime": "2023-01-01T00:00:00Z",
+    "marginRate": 0.0,
+}
+
+
+def test_quote_has_no_instance_dict():
+    quote = Quote("BTC$", 1.0, 2.0, datetime(2023, 1, 1, tzinfo=timezone.utc))
+    assert not hasattr(quote, "__dict__")
+    assert Quote.__slots__ == ("symbol", "bid", "ask", "time")
+
+
+def test_position_has_no_instance_dict():
+    position = Position.from_json(POSITION_JSON)
+    assert not hasattr(position, "__dict__")
+    assert set(Position.__slots__) == {
+        "account",
+        "version",
+        "position_code",
+        "symbol",
+        "quantity",
+        "side",
+        "quantity_notional",
+        "open_time",
+        "open_price",
+        "last_update_time",
+        "margin_rate",
+    }
+
+
+def test_quote_from_json_matches_dto():
+    quote = Quote.from_json(QUOTE_EVENT)
+    expected = QuoteDto.model_validate(QUOTE_EVENT).to_bo()
+    for name in Quote.__slots__:
+        assert getattr(quote, name) == getattr(expected, name)
+
+
+def test_position_from_json_matches_dto():
+    position = Position.from_json(POSITION_JSON)
+    expected = _PositionDto.model_validate(POSITION_JSON).to_bo()
+    for name in Position.__slots__:
+        assert getattr(position, name) == getattr(expected, name)
@@ -138,6 +138,15 @@ def test_instrument_dto_collection_polymorphism():
     assert isinstance(collection.instruments[0], _ForexDto)
     assert collection.instruments[1].type == "CFD_STOCK"
 
+    forex, stock = (dto.to_bo() for dto in collection.instruments)
+    assert forex.type == "FOREX"
+    assert forex.asset_class == "FX"
+    assert forex.price_increment == 0.00001
+    assert forex.pip_size == 0.0001
+    assert forex.lot_size == 100000
+    assert forex.multiplier == 1
+    assert stock.currency == "USD"
+
 
 @pytest.mark.parametrize("symbol", ["BTC$", "ETHUSDTPERP", "XAUUSD.cent", "AAPL"])
 def test_instrument_bo_mapping(symbol):
@@ -153,6 +162,7 @@ def test_instrument_bo_mapping(symbol):
     )
     ins = Instrument(dto)
     assert ins.symbol == symbol
+    assert ins.type is None
     assert len(ins.trading_hours) == 1
     assert isinstance(ins.trading_hours[0], TradingHour)
 
@@ -168,3 +178,30 @@ def test_session_create_sessions_batch(focal_time):
     assert len(sessions) == 2
     assert sessions[0].start_day == "Monday"
     assert sessions[1].start_day == "Tuesday"
+
+
+def test_instruments_share_parsed_schedules():
+    def dto(symbol):
+        return _InstrumentDto(
+            symbol=symbol,
+            version=1,
+            description="Test",
+            priceIncrement=0.1,
+            pipSize=0.1,
+            lotSize=1.0,
+            multiplier=1.0,
+            tradingHours=[
+                {"weekDay": "Monday, 09:00:00Z", "eventType": "SESSION_OPEN"},
+                {"weekDay": "Monday, 17:00:00Z", "eventType": "SESSION_CLOSE"},
+            ],
+        )
+
+    first, second = Instrument(dto("AAPL")), Instrument(dto("AMZN"))
+
+    assert first.trading_hours is second.trading_hours
+    assert first.trading_hours[0].week_day_int == 0
+    assert first.trading_hours[1].time == time(17, 0)
+    assert (
+        _TradingHourDto(weekDay="Monday, 09:00:00Z", eventType="SESSION_OPEN").to_bo()
+        is first.trading_hours[0]
+    )